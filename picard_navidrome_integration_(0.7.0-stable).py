@@ -76,16 +76,60 @@ PLUGIN_API_VERSIONS = [
 ]
 
 from typing import Dict, List, Optional, Tuple, Callable, Generator, Set
+import collections
+import functools
 import os
 import re
+import sys
 import hashlib
 import json
 import random
-import string
+import secrets
+import sqlite3
+import threading
+import urllib.error
 import urllib.parse
 import urllib.request
+import weakref
 import webbrowser
 import time
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+
+# Optional incremental JSON parser for streaming large list responses
+try:
+    import ijson  # type: ignore
+except Exception:
+    ijson = None  # type: ignore
+
+# Optional faster JSON decoder; orjson parses bytes directly, no decode pass
+try:
+    import orjson  # type: ignore
+
+    _loads = orjson.loads
+except Exception:
+    orjson = None  # type: ignore
+    try:
+        import ujson  # type: ignore
+
+        _loads = ujson.loads
+    except Exception:
+        _loads = json.loads
+
+
+def _dumps_bytes(data: any) -> bytes:
+    """Serialize to UTF-8 JSON bytes with the fastest available encoder."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+# Optional pooled HTTP with keep-alive; falls back to per-call urllib connections
+try:
+    import urllib3  # type: ignore
+except Exception:
+    urllib3 = None  # type: ignore
 
 # Qt bindings (prefer PyQt5, fall back to PySide2)
 QMessageBox = None
@@ -116,6 +160,7 @@ try:
         QDialog,
         QListWidget,
         QListWidgetItem,
+        QListView,
         QVBoxLayout,
         QHBoxLayout,
         QLabel,
@@ -127,13 +172,28 @@ try:
         QHeaderView,
         QComboBox,
         QProgressBar,
+        QProgressDialog,
         QToolButton,
         QMenu,
         QAction,
         QTextEdit,
+        QGridLayout,
     )
-    from PyQt5.QtCore import QCoreApplication, QTimer, Qt, QEvent, QMimeData, QPoint  # type: ignore
-    from PyQt5.QtGui import QPixmap, QPainter, QColor, QDrag, QPen  # type: ignore
+    from PyQt5.QtCore import (  # type: ignore
+        QCoreApplication,
+        QTimer,
+        Qt,
+        QEvent,
+        QMimeData,
+        QPoint,
+        QObject,
+        QRunnable,
+        QThreadPool,
+        QStandardPaths,
+        QStringListModel,
+        pyqtSignal as _Signal,
+    )
+    from PyQt5.QtGui import QPixmap, QPainter, QColor, QDrag, QPen, QDropEvent  # type: ignore
     _QT_LIB = "pyqt5"
 except Exception:
     try:
@@ -148,6 +208,7 @@ except Exception:
             QDialog,
             QListWidget,
             QListWidgetItem,
+            QListView,
             QVBoxLayout,
             QHBoxLayout,
             QLabel,
@@ -159,30 +220,84 @@ except Exception:
             QHeaderView,
             QComboBox,
             QProgressBar,
+            QProgressDialog,
             QToolButton,
             QMenu,
             QAction,
             QTextEdit,
+            QGridLayout,
+        )
+        from PySide2.QtCore import (  # type: ignore
+            QCoreApplication,
+            QTimer,
+            Qt,
+            QEvent,
+            QMimeData,
+            QPoint,
+            QObject,
+            QRunnable,
+            QThreadPool,
+            QStandardPaths,
+            QStringListModel,
+            Signal as _Signal,
         )
-        from PySide2.QtCore import QCoreApplication, QTimer, Qt, QEvent, QMimeData, QPoint  # type: ignore
-        from PySide2.QtGui import QPixmap, QPainter, QColor, QDrag, QPen  # type: ignore
+        from PySide2.QtGui import QPixmap, QPainter, QColor, QDrag, QPen, QDropEvent  # type: ignore
         _QT_LIB = "pyside2"
     except Exception:  # pragma: no cover
         _QT_LIB = None
 
+# QShortcut/QKeySequence are only needed by a couple of dialogs; resolve the
+# binding once at import instead of re-importing on every dialog open
+QShortcut = None
+QKeySequence = None
+try:
+    from PyQt5.QtWidgets import QShortcut  # type: ignore
+    from PyQt5.QtGui import QKeySequence  # type: ignore
+except Exception:
+    try:
+        from PySide2.QtWidgets import QShortcut  # type: ignore
+        from PySide2.QtGui import QKeySequence  # type: ignore
+    except Exception:
+        pass
+
+# Qt6 moved event coordinates to .position(); probe the binding once at import
+try:
+    _HAS_EVENT_POSITION = hasattr(QDropEvent, "position")
+except Exception:
+    _HAS_EVENT_POSITION = False
+
+
+def _event_pos(event):
+    """Return the event position as a QPoint across Qt5/Qt6 bindings."""
+    if _HAS_EVENT_POSITION:
+        return event.position().toPoint()
+    return event.pos()
+
+
 # Picard API
 from picard import log  # type: ignore
 from picard.config import config, BoolOption, TextOption, IntOption  # type: ignore
 from picard.ui.options import OptionsPage, register_options_page  # type: ignore
 
 # Safely create options - ignore if already declared
+_REGISTERED_OPTIONS: Set[str] = set()
+
+
 def _safe_create_option(option_class, *args, **kwargs):
     """Safely create an option, ignoring duplicate declaration errors."""
+    # Cheap membership check first: plugin reloads re-run this module, and a
+    # set lookup beats constructing the option just to catch the duplicate
+    name = args[1] if len(args) > 1 else kwargs.get("name")
+    if name is not None and name in _REGISTERED_OPTIONS:
+        return None
     try:
-        return option_class(*args, **kwargs)
+        option = option_class(*args, **kwargs)
     except Exception:
         # Option already exists, return None
         return None
+    if name is not None:
+        _REGISTERED_OPTIONS.add(name)
+    return option
 from picard.ui.itemviews import BaseAction, register_album_action, register_track_action  # type: ignore
 try:
     from picard.ui.itemviews import register_file_action  # type: ignore
@@ -193,23 +308,189 @@ except Exception:
 # -----------------------------
 # Navidrome Cache System
 # -----------------------------
-class NavidromeCache:
-    """Simple in-memory cache for Navidrome API responses. Cache persists until manually cleared."""
-    
-    def __init__(self):
-        self._cache: Dict[str, any] = {}  # key -> data
-    
+class PersistentNavidromeCache:
+    """SQLite-backed cache tier so library data survives Picard restarts.
+
+    Values are stored zlib-compressed JSON; keys already embed the server URL
+    so multiple Navidrome instances do not collide. Expired rows are evicted
+    lazily on write.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl_days: int = 7) -> None:
+        if path is None:
+            path = os.path.join(self._cache_dir(), "navidrome_cache.sqlite")
+        self.ttl_seconds = max(1, int(ttl_days)) * 86400
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_expires ON cache (expires_at)")
+
+    @staticmethod
+    def _cache_dir() -> str:
+        base = ""
+        try:
+            base = QStandardPaths.writableLocation(QStandardPaths.CacheLocation)
+        except Exception:
+            base = ""
+        if not base:
+            base = os.path.expanduser("~/.cache")
+        path = os.path.join(base, "picard-navidrome")
+        try:
+            os.makedirs(path, exist_ok=True)
+        except Exception:
+            pass
+        return path
+
     def get(self, key: str) -> Optional[any]:
-        """Get cached data if it exists."""
-        return self._cache.get(key, None)
-    
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+                ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            if expires_at and time.time() >= expires_at:
+                with self._lock:
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return None
+            return _loads(zlib.decompress(value))
+        except Exception:
+            return None
+
     def set(self, key: str, data: any) -> None:
-        """Store data in cache."""
-        self._cache[key] = data
-    
+        try:
+            blob = zlib.compress(_dumps_bytes(data))
+            now = time.time()
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                    (key, blob, now + self.ttl_seconds),
+                )
+                # Lazy eviction of anything already expired
+                self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+        except Exception:
+            pass
+
+    def delete(self, key: str) -> None:
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+        except Exception:
+            pass
+
     def clear(self) -> None:
-        """Clear all cached data."""
-        self._cache.clear()
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM cache")
+        except Exception:
+            pass
+
+
+class NavidromeCache:
+    """In-memory LRU cache for Navidrome API responses with per-key TTL and size caps.
+
+    Entries expire after ``default_ttl`` seconds; when either the entry or byte
+    cap is exceeded the least-recently-used entries are evicted first, so hot
+    entries (recently fetched albums) stay resident while cold ones are dropped.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        default_ttl: int = 3600,
+        persistent: Optional[PersistentNavidromeCache] = None,
+    ):
+        self._cache: "collections.OrderedDict[str, Tuple[any, float, int]]" = collections.OrderedDict()  # key -> (data, expires_at, size)
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.persistent = persistent
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[any]:
+        """Get cached data if present and not expired; refreshes LRU position."""
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                data, expires_at, size = entry
+                if not expires_at or time.monotonic() < expires_at:
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return data
+                del self._cache[key]
+                self._bytes -= size
+            self._misses += 1
+        # Memory miss: consult the persistent tier and promote on hit
+        if self.persistent is not None:
+            data = self.persistent.get(key)
+            if data is not None:
+                self._store(key, data, self.default_ttl)
+                return data
+        return None
+
+    def set(self, key: str, data: any, ttl: Optional[int] = None, persist: bool = True) -> None:
+        """Store data in cache, evicting least-recently-used entries over the caps.
+
+        Pass ``persist=False`` for short-lived entries that should not outlive
+        the process via the sqlite tier.
+        """
+        if ttl is None:
+            ttl = self.default_ttl
+        self._store(key, data, ttl)
+        if persist and self.persistent is not None:
+            self.persistent.set(key, data)
+
+    def delete(self, key: str) -> None:
+        """Drop a single key from both tiers."""
+        with self._lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+        if self.persistent is not None:
+            self.persistent.delete(key)
+
+    def _store(self, key: str, data: any, ttl: int) -> None:
+        expires_at = (time.monotonic() + ttl) if ttl and ttl > 0 else 0.0
+        try:
+            size = sys.getsizeof(json.dumps(data))
+        except Exception:
+            size = 0
+        with self._lock:
+            old = self._cache.pop(key, None)
+            if old is not None:
+                self._bytes -= old[2]
+            self._cache[key] = (data, expires_at, size)
+            self._bytes += size
+            while self._cache and (len(self._cache) > self.maxsize or self._bytes > self.max_bytes):
+                _, (_, _, evicted_size) = self._cache.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def clear(self) -> None:
+        """Clear all cached data, including the persistent tier."""
+        with self._lock:
+            self._cache.clear()
+            self._bytes = 0
+            self._hits = 0
+            self._misses = 0
+        if self.persistent is not None:
+            self.persistent.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Return entry/byte counts and hit/miss counters."""
+        with self._lock:
+            return {
+                "entries": len(self._cache),
+                "bytes": self._bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
 
 
 # Global cache instance - shared across all SubsonicClient instances
@@ -221,7 +502,19 @@ def _get_global_cache(enable_cache: bool = True) -> Optional[NavidromeCache]:
     if not enable_cache:
         return None
     if _global_cache is None:
-        _global_cache = NavidromeCache()
+        try:
+            default_ttl = int(config.setting["navidrome_cache_ttl"])
+        except Exception:
+            default_ttl = 3600
+        try:
+            ttl_days = int(config.setting["navidrome_cache_ttl_days"])
+        except Exception:
+            ttl_days = 7
+        try:
+            persistent = PersistentNavidromeCache(ttl_days=ttl_days)
+        except Exception:
+            persistent = None
+        _global_cache = NavidromeCache(default_ttl=default_ttl, persistent=persistent)
     return _global_cache
 
 def _clear_global_cache() -> None:
@@ -231,12 +524,162 @@ def _clear_global_cache() -> None:
         _global_cache.clear()
 
 
+# Song dict fields actually consumed by the UI; everything else is dropped at
+# the API boundary so a large library doesn't pin ~20 unused keys per song.
+_SONG_FIELDS = (
+    "id",
+    "title",
+    "name",
+    "artist",
+    "album",
+    "genre",
+    "year",
+    "duration",
+    "track",
+    "path",
+    "file",
+    "suffix",
+    "contentType",
+)
+# Heavily repeated across songs; interning collapses N copies to one
+_INTERNED_SONG_FIELDS = ("artist", "album", "genre", "suffix")
+
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+# Ids made only of these characters never need percent-encoding
+_SAFE_ID_RE = re.compile(r"\A[A-Za-z0-9_\-]+\Z")
+
+# Filename prefix cleaners, compiled once per plugin lifetime
+_PREFIX_RE = re.compile(r"^\s*\d{2}-\d{2}\s*-\s*")
+_TRACKNO_PREFIX_RE = re.compile(
+    r"^(\d+[-\.\s]*\d*[-\.\s]*[-\s]+|Track\s+\d+\s*[-\.\s]*)", re.IGNORECASE
+)
+
+
+# PyQt5 has exec_, newer bindings have exec; resolve the name once instead
+# of a try/except ladder at every dialog-open site
+_EXEC_NAME = "exec" if hasattr(QDialog, "exec") else "exec_"
+
+
+def _exec_dialog(dlg: QDialog) -> Optional[int]:
+    """Run a dialog modally; falls back to show() and returns None."""
+    try:
+        return getattr(dlg, _EXEC_NAME)()
+    except Exception:
+        try:
+            dlg.show()
+        except Exception:
+            pass
+        return None
+
+
+def _cleaned_name(n: str) -> str:
+    """Strip a leading 'NN-NN - ' prefix from a filename."""
+    # The pattern can only match names opening with a digit or whitespace;
+    # everything else skips the regex engine entirely
+    c = n[:1]
+    if not (c.isdigit() or c.isspace()):
+        return n
+    return _PREFIX_RE.sub("", n)
+
+
+def _canonical_track_name(n: str) -> str:
+    """Canonical comparison form of a filename: prefix-stripped and trimmed.
+
+    Both sides of a name comparison must go through this exactly once so
+    no call site needs its own follow-up strip().
+    """
+    return _cleaned_name(n).strip()
+
+
+def _ttl_from_headers(headers) -> Optional[int]:
+    """Extract a cache TTL from a Cache-Control: max-age response header."""
+    try:
+        match = _MAX_AGE_RE.search(headers.get("Cache-Control") or "")
+        if match:
+            return int(match.group(1))
+    except Exception:
+        pass
+    return None
+
+
+def _slim_song(s: Dict) -> Dict:
+    """Keep only the fields the UI reads and intern heavily repeated strings."""
+    slim = {}
+    for key in _SONG_FIELDS:
+        v = s.get(key)
+        if v is None:
+            continue
+        if key in _INTERNED_SONG_FIELDS and isinstance(v, str):
+            v = sys.intern(v)
+        slim[key] = v
+    return slim
+
+
+# -----------------------------
+# Request throttle for concurrent fetches
+# -----------------------------
+class _RateLimiter:
+    """Simple token-bucket throttle so concurrent album fetches honour Navidrome's rate limit."""
+
+    def __init__(self, max_calls: int = 20, period: float = 1.0) -> None:
+        self._max_calls = max_calls
+        self._period = period
+        self._lock = threading.Lock()
+        self._calls: List[float] = []
+
+    def acquire(self) -> None:
+        """Block until a request slot is available within the current window."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._calls = [t for t in self._calls if now - t < self._period]
+                if len(self._calls) < self._max_calls:
+                    self._calls.append(now)
+                    return
+                wait = self._period - (now - self._calls[0])
+            time.sleep(max(wait, 0.01))
+
+
+class SubsonicError(Exception):
+    """Transport or API failure talking to the Subsonic endpoint.
+
+    Attributes are slot-based and the display string is composed lazily in
+    __str__, so the common caller that just catches and ignores the error
+    never pays for message formatting.
+    """
+
+    __slots__ = ("endpoint", "code", "message")
+
+    def __init__(self, endpoint: str, message: str, code: Optional[int] = None) -> None:
+        super().__init__()
+        self.endpoint = endpoint
+        self.message = message
+        self.code = code
+
+    def __str__(self) -> str:
+        if self.code is not None:
+            return f"Subsonic error {self.code}: {self.message}"
+        return f"{self.message} ({self.endpoint})"
+
+
 # -----------------------------
 # Minimal Subsonic API client
 # -----------------------------
 class SubsonicClient:
     """Minimal Subsonic API client compatible with Navidrome."""
 
+    # Bounded worker pool for concurrent getAlbum fetches
+    MAX_FETCH_WORKERS = 8
+
+    # Playlist index is cached only briefly; it mutates more often than albums
+    PLAYLISTS_CACHE_TTL = 60
+
+    # The full song library persists for a week; the scan-status snapshot
+    # token invalidates it earlier when the server's media actually changed
+    LIBRARY_CACHE_TTL = 7 * 86400
+
     def __init__(
         self,
         base_url: str,
@@ -262,6 +705,36 @@ class SubsonicClient:
         # Initialize cache - use global cache for persistence across instances
         self.enable_cache = enable_cache
         self.cache = _get_global_cache(enable_cache)
+
+        # Throttle shared by all worker threads of this client
+        self._rate_limiter = _RateLimiter()
+
+        # Collapse identical concurrent requests onto a single network call
+        self._inflight: Dict[str, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        # Pooled keep-alive connections reuse the TCP/TLS session across calls
+        self._pool = None
+        if urllib3 is not None:
+            try:
+                self._pool = urllib3.PoolManager(
+                    num_pools=1,
+                    maxsize=self.MAX_FETCH_WORKERS * 2,
+                    cert_reqs="CERT_REQUIRED" if verify_ssl else "CERT_NONE",
+                    retries=urllib3.Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 502, 503, 504]),
+                )
+                if not verify_ssl:
+                    urllib3.disable_warnings()
+            except Exception:
+                self._pool = None
+
+        # Precompute the (salt, token) pair once; reuse it across requests
+        self._auth_cache: Dict[str, str] = {}
+        self._auth_expires = 0.0
+        self._refresh_auth()
+
+        # TTL from the last response's Cache-Control header, if the server sent one
+        self._last_cache_ttl: Optional[int] = None
     
     def clear_cache(self) -> None:
         """Clear all cached data."""
@@ -270,14 +743,17 @@ class SubsonicClient:
     def get_cache_stats(self) -> Dict[str, int]:
         """Get basic cache statistics."""
         if not self.cache:
-            return {"enabled": 0, "entries": 0}
-        return {"enabled": 1, "entries": len(self.cache._cache)}
+            return {"enabled": 0, "entries": 0, "bytes": 0, "hits": 0, "misses": 0}
+        stats = self.cache.stats()
+        stats["enabled"] = 1
+        return stats
 
     # ---- HTTP helpers ----
-    def _auth_params(self) -> Dict[str, str]:
-        salt = "".join(random.choices(string.ascii_letters + string.digits, k=12))
+    def _refresh_auth(self) -> None:
+        """Regenerate the cached (salt, token) auth params; valid for 300 seconds."""
+        salt = secrets.token_urlsafe(9)[:12]
         token = hashlib.md5((self.password + salt).encode("utf-8")).hexdigest()
-        return {
+        self._auth_cache = {
             "u": self.username,
             "t": token,
             "s": salt,
@@ -285,6 +761,86 @@ class SubsonicClient:
             "c": self.app_name,
             "f": "json",
         }
+        # Prebuilt constant query string so GET URLs skip the merged-dict + urlencode hop
+        self._auth_qs = urllib.parse.urlencode(self._auth_cache)
+        # Fully-rendered URLs for parameter-free endpoints (getPlaylists etc.);
+        # stale once the auth pair rotates, so reset alongside it
+        self._url_cache: Dict[str, str] = {}
+        self._auth_expires = time.monotonic() + 300
+
+    def _auth_params(self) -> Dict[str, str]:
+        # Reuse the precomputed pair instead of re-hashing on every request
+        if time.monotonic() >= self._auth_expires:
+            self._refresh_auth()
+        return self._auth_cache
+
+    def _build_url(self, endpoint: str, params: Optional[Dict] = None) -> str:
+        """Build a GET URL from the prebuilt auth query string plus dynamic params."""
+        if time.monotonic() >= self._auth_expires:
+            self._refresh_auth()
+        if not params:
+            url = self._url_cache.get(endpoint)
+            if url is None:
+                url = f"{self.base_url}{endpoint}?{self._auth_qs}"
+                self._url_cache[endpoint] = url
+            return url
+        return f"{self.base_url}{endpoint}?{self._auth_qs}&{urllib.parse.urlencode(params, doseq=True)}"
+
+    def _ssl_context(self):
+        if self.verify_ssl:
+            return None
+        try:
+            import ssl
+            return ssl._create_unverified_context()  # type: ignore[attr-defined]
+        except Exception:
+            return None
+
+    def _open_with_retry(self, request, endpoint: str):
+        """Open a prepared request, preferring pooled keep-alive connections.
+
+        With urllib3 installed the pool's Retry handles 429/502/503 backoff;
+        otherwise a fresh urllib connection is opened with manual 429 retries.
+        """
+        if self._pool is not None:
+            self._rate_limiter.acquire()
+            try:
+                response = self._pool.urlopen(
+                    request.get_method(),
+                    request.full_url,
+                    body=request.data,
+                    headers=dict(request.header_items()),
+                    timeout=self.timeout_seconds,
+                    preload_content=False,
+                )
+            except Exception as exc:
+                raise SubsonicError(endpoint, f"HTTP error: {exc}")
+            if response.status >= 400:
+                try:
+                    response.release_conn()
+                except Exception:
+                    pass
+                raise SubsonicError(endpoint, f"HTTP {response.status}")
+            return response
+
+        attempts = 0
+        context = self._ssl_context()
+        while True:
+            self._rate_limiter.acquire()
+            try:
+                return urllib.request.urlopen(request, context=context, timeout=self.timeout_seconds)
+            except urllib.error.HTTPError as exc:
+                # Back off and retry transient failures, honouring Retry-After
+                if exc.code in (429, 502, 503, 504) and attempts < 3:
+                    attempts += 1
+                    try:
+                        delay = float(exc.headers.get("Retry-After"))
+                    except Exception:
+                        delay = 0.5 * (2 ** attempts)
+                    time.sleep(min(delay, 30.0))
+                    continue
+                raise SubsonicError(endpoint, f"HTTP error: {exc}")
+            except Exception as exc:
+                raise SubsonicError(endpoint, f"HTTP error: {exc}")
 
     def _request(
         self,
@@ -292,107 +848,259 @@ class SubsonicClient:
         params: Optional[Dict] = None,
         method: str = "GET",
         song_ids: Optional[List[str]] = None,
+        repeat_params: Optional[List[Tuple[str, str]]] = None,
     ) -> Dict:
         if not endpoint.startswith("/"):
             endpoint = "/" + endpoint
         params = params or {}
-        all_params = {**self._auth_params(), **params}
-
-        url = f"{self.base_url}{endpoint}"
-        request = None
-        data_bytes = None
 
         if method.upper() == "GET":
-            qs = urllib.parse.urlencode(all_params, doseq=True)
-            url = f"{url}?{qs}"
-            request = urllib.request.Request(url, method="GET")
+            request = urllib.request.Request(self._build_url(endpoint, params), method="GET")
         else:
-            # Handle repeated songId parameters (Subsonic expects multiple songId= entries)
-            if song_ids:
-                param_pairs = [(k, v) for k, v in all_params.items()]
-                for sid in song_ids:
-                    param_pairs.append(("songId", sid))
-                body = urllib.parse.urlencode(param_pairs)
+            all_params = {**self._auth_params(), **params}
+            # Handle repeated parameters (Subsonic expects e.g. multiple
+            # songId=/songIdToAdd= entries rather than comma-joined lists)
+            if song_ids or repeat_params:
+                body_parts = [urllib.parse.urlencode(all_params)]
+                pairs = [("songId", sid) for sid in (song_ids or [])]
+                if repeat_params:
+                    pairs.extend(repeat_params)
+                for key, val in pairs:
+                    val = str(val)
+                    # Navidrome ids are hex/uuid-like; skip percent-encoding
+                    # when a quick match proves there is nothing to escape
+                    if _SAFE_ID_RE.match(val):
+                        body_parts.append(key + "=" + val)
+                    else:
+                        body_parts.append(key + "=" + urllib.parse.quote_plus(val))
+                body = "&".join(body_parts)
             else:
                 body = urllib.parse.urlencode(all_params, doseq=True)
             data_bytes = body.encode("utf-8")
-            request = urllib.request.Request(url, data=data_bytes, method="POST")
+            request = urllib.request.Request(f"{self.base_url}{endpoint}", data=data_bytes, method="POST")
             request.add_header("Content-Type", "application/x-www-form-urlencoded")
 
-        # SSL context (optional)
-        context = None
-        if not self.verify_ssl:
-            try:
-                import ssl
-                context = ssl._create_unverified_context()  # type: ignore[attr-defined]
-            except Exception:
-                context = None
-
-        try:
-            with urllib.request.urlopen(request, context=context, timeout=self.timeout_seconds) as response:
-                data = response.read().decode("utf-8")
-        except Exception as exc:
-            raise ValueError(f"HTTP error calling {endpoint}: {exc}")
+        with self._open_with_retry(request, endpoint) as response:
+            self._last_cache_ttl = _ttl_from_headers(response.headers)
+            # Keep the body as bytes; _loads parses them directly
+            data = response.read()
 
         try:
-            payload = json.loads(data)
+            payload = _loads(data)
         except Exception as exc:
-            raise ValueError(f"Invalid JSON from {endpoint}: {exc}")
+            raise SubsonicError(endpoint, f"Invalid JSON: {exc}")
 
         if "subsonic-response" not in payload:
-            raise ValueError("Unexpected response: missing 'subsonic-response'")
+            raise SubsonicError(endpoint, "Unexpected response: missing 'subsonic-response'")
         resp = payload["subsonic-response"]
         if resp.get("status") != "ok":
             error = resp.get("error", {})
             code = error.get("code")
             msg = error.get("message")
-            raise ValueError(f"Subsonic error {code}: {msg}")
+            raise SubsonicError(endpoint, str(msg), code=code)
         return resp
 
+    def _dedup_call(self, key: str, fn: Callable[[], object]):
+        """Run fn once per key at a time; concurrent callers share the result.
+
+        The first caller for a key does the work; later callers block on its
+        Future instead of issuing a duplicate network request.
+        """
+        with self._inflight_lock:
+            fut = self._inflight.get(key)
+            if fut is not None:
+                owner = False
+            else:
+                fut = Future()
+                self._inflight[key] = fut
+                owner = True
+        if not owner:
+            return fut.result()
+        try:
+            result = fn()
+            fut.set_result(result)
+            return result
+        except BaseException as exc:
+            fut.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
     def _get(self, endpoint: str, params: Optional[Dict] = None) -> Dict:
         return self._request(endpoint, params, method="GET")
 
-    def _post(self, endpoint: str, params: Optional[Dict] = None, song_ids: Optional[List[str]] = None) -> Dict:
-        return self._request(endpoint, params, method="POST", song_ids=song_ids)
+    def _post(
+        self,
+        endpoint: str,
+        params: Optional[Dict] = None,
+        song_ids: Optional[List[str]] = None,
+        repeat_params: Optional[List[Tuple[str, str]]] = None,
+    ) -> Dict:
+        return self._request(endpoint, params, method="POST", song_ids=song_ids, repeat_params=repeat_params)
+
+    def _request_stream(self, endpoint: str, params: Optional[Dict], item_path: str) -> Generator[Dict, None, None]:
+        """Yield list items from a GET response incrementally.
+
+        ``item_path`` is the dotted path below ``subsonic-response`` to the list
+        (e.g. ``"albumList2.album"``). When ijson is available items are parsed
+        while the socket drains; otherwise the full response is parsed at once.
+        """
+        if ijson is None:
+            resp = self._get(endpoint, params)
+            node = resp
+            for key in item_path.split("."):
+                node = node.get(key, {}) if isinstance(node, dict) else {}
+            items = node or []
+            if isinstance(items, dict):
+                items = [items]
+            for item in items:
+                yield item
+            return
+
+        if not endpoint.startswith("/"):
+            endpoint = "/" + endpoint
+        request = urllib.request.Request(self._build_url(endpoint, params), method="GET")
+        single = f"subsonic-response.{item_path}"
+        target = single + ".item"
+        # Walk the raw event stream instead of ijson.items() so the
+        # envelope's status/error fields are seen as well; an API-level
+        # failure carries no item list and would otherwise parse as an
+        # empty library instead of raising like the non-streaming path.
+        # Items are built both from array elements (the ``.item`` prefix)
+        # and from a lone dict at the list field itself — servers send the
+        # latter for single-entry lists, which the non-ijson branch above
+        # normalizes the same way.
+        status: Optional[str] = None
+        error: Dict = {}
+        builder = None
+        built_at = ""
+        with self._open_with_retry(request, endpoint) as response:
+            self._last_cache_ttl = _ttl_from_headers(response.headers)
+            for prefix, event, value in ijson.parse(response):
+                if builder is not None and (prefix == built_at or prefix.startswith(built_at + ".")):
+                    builder.event(event, value)
+                    if event == "end_map" and prefix == built_at:
+                        yield builder.value
+                        builder = None
+                elif event == "start_map" and (prefix == target or prefix == single):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(event, value)
+                    built_at = prefix
+                elif prefix == "subsonic-response.status":
+                    status = value
+                elif prefix == "subsonic-response.error.code":
+                    error["code"] = value
+                elif prefix == "subsonic-response.error.message":
+                    error["message"] = value
+        if status is None:
+            raise SubsonicError(endpoint, "Unexpected response: missing 'subsonic-response'")
+        if status != "ok":
+            raise SubsonicError(endpoint, str(error.get("message")), code=error.get("code"))
 
     # ---- API calls we use ----
     def ping(self) -> bool:
         resp = self._get("/rest/ping.view")
         return resp.get("status") == "ok"
 
+    def _playlists_cache_key(self) -> str:
+        return f"{self.base_url}_playlists_{self.username}"
+
+    def _invalidate_playlists(self) -> None:
+        if self.cache:
+            self.cache.delete(self._playlists_cache_key())
+
     def get_playlists(self) -> List[Dict]:
-        resp = self._get("/rest/getPlaylists.view")
-        playlists = resp.get("playlists", {}).get("playlist", [])
-        if isinstance(playlists, dict):
-            playlists = [playlists]
-        return playlists
+        # Short-TTL, memory-only cache: the index changes rarely while a
+        # dialog is open, but edits elsewhere should show up quickly
+        cache_key = self._playlists_cache_key()
+        if self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        def _fetch() -> List[Dict]:
+            resp = self._get("/rest/getPlaylists.view")
+            playlists = resp.get("playlists", {}).get("playlist", [])
+            if isinstance(playlists, dict):
+                playlists = [playlists]
+            if self.cache:
+                self.cache.set(cache_key, playlists, ttl=self.PLAYLISTS_CACHE_TTL, persist=False)
+            return playlists
+
+        return self._dedup_call(cache_key, _fetch)
 
     def get_playlist_tracks(self, playlist_id: str) -> List[Dict]:
-        resp = self._get("/rest/getPlaylist.view", {"id": playlist_id})
-        entries = resp.get("playlist", {}).get("entry", [])
-        if isinstance(entries, dict):
-            entries = [entries]
-        return entries
+        def _fetch() -> List[Dict]:
+            return list(self._request_stream("/rest/getPlaylist.view", {"id": playlist_id}, "playlist.entry"))
+
+        return self._dedup_call(f"{self.base_url}_playlist_tracks_{playlist_id}", _fetch)
 
     def create_playlist(self, name: str, song_ids: List[str]) -> Optional[str]:
         """Create a playlist with provided song IDs. Returns playlist id if available."""
         params = {"name": name}
+        # All ids travel in one createPlaylist POST as repeated songId
+        # parameters; materialize so a generator argument cannot be left
+        # half-consumed by the caller afterwards.
+        song_ids = list(song_ids or [])
         resp = self._post("/rest/createPlaylist.view", params, song_ids=song_ids)
+        self._invalidate_playlists()
         pl = resp.get("playlist", {})
         pl_id = str(pl.get("id", "")) if isinstance(pl, dict) else ""
         return pl_id or None
 
-    def update_playlist(self, playlist_id: str, *, name: Optional[str] = None, public: Optional[bool] = None) -> None:
-        """Update playlist name or visibility."""
+    def update_playlist(
+        self,
+        playlist_id: str,
+        *,
+        name: Optional[str] = None,
+        public: Optional[bool] = None,
+        song_ids_to_add: Optional[List[str]] = None,
+        song_indices_to_remove: Optional[List[int]] = None,
+    ) -> None:
+        """Update playlist metadata and/or membership in one call.
+
+        Uses the native updatePlaylist endpoint so single-track edits stay
+        O(1) on the wire and the playlist keeps its id, ownership, comment
+        and sharing metadata.
+        """
         params = {"playlistId": playlist_id}
         if name is not None:
             params["name"] = name
         if public is not None:
             params["public"] = "true" if public else "false"
-        self._post("/rest/updatePlaylist.view", params)
+        repeat_params: List[Tuple[str, str]] = []
+        for sid in song_ids_to_add or []:
+            repeat_params.append(("songIdToAdd", str(sid)))
+        for pos in song_indices_to_remove or []:
+            repeat_params.append(("songIndexToRemove", str(pos)))
+        self._post("/rest/updatePlaylist.view", params, repeat_params=repeat_params or None)
+        self._invalidate_playlists()
+
+    def replace_playlist_tracks(self, playlist_id: str, song_ids: List[str]) -> None:
+        """Replace a playlist's full track order in place.
+
+        createPlaylist with a playlistId updates the existing playlist per
+        the Subsonic API, so reorders/shuffles need one request and the id
+        never changes.
+        """
+        self._post("/rest/createPlaylist.view", {"playlistId": playlist_id}, song_ids=song_ids)
+        self._invalidate_playlists()
 
     def delete_playlist(self, playlist_id: str) -> None:
         self._post("/rest/deletePlaylist.view", {"id": playlist_id})
+        self._invalidate_playlists()
+
+    def playlist_transaction(self, playlist_id: str) -> "_PlaylistTransaction":
+        """Buffer several edits to one playlist and flush them together.
+
+        ``with client.playlist_transaction(pl_id) as tx: tx.rename(...);
+        tx.add_tracks([...])`` sends at most one updatePlaylist call (plus
+        one createPlaylist when a full track replacement is buffered)
+        instead of one round-trip per edit, and invalidates the playlist
+        index once. Nothing is sent if the body raises.
+        """
+        return _PlaylistTransaction(self, playlist_id)
 
     def search_songs(self, query: str, *, count: int = 10, offset: int = 0) -> List[Dict]:
         params = {"query": query, "songCount": str(count), "songOffset": str(offset)}
@@ -416,26 +1124,26 @@ class SubsonicClient:
                     pass
                 return cached_albums
         
-        # Fetch from API if not cached
+        # Fetch from API if not cached; duplicate concurrent fetches share one call
         try:
             log.debug("Navidrome: Cache MISS for album_list2 %s/%s/%s - fetching from server", list_type, size, offset)
         except Exception:
             pass
-        params = {"type": list_type, "size": str(size), "offset": str(offset)}
-        resp = self._get("/rest/getAlbumList2.view", params)
-        albums = resp.get("albumList2", {}).get("album", [])
-        if isinstance(albums, dict):
-            albums = [albums]
-        
-        # Cache the result
-        if self.cache:
-            self.cache.set(cache_key, albums)
-            try:
-                log.debug("Navidrome: Cached album_list2 result (%d albums)", len(albums))
-            except Exception:
-                pass
-        
-        return albums
+
+        def _fetch() -> List[Dict]:
+            params = {"type": list_type, "size": str(size), "offset": str(offset)}
+            albums = list(self._request_stream("/rest/getAlbumList2.view", params, "albumList2.album"))
+
+            # Cache the result, preferring a server-provided max-age as the TTL
+            if self.cache:
+                self.cache.set(cache_key, albums, ttl=self._last_cache_ttl)
+                try:
+                    log.debug("Navidrome: Cached album_list2 result (%d albums)", len(albums))
+                except Exception:
+                    pass
+            return albums
+
+        return self._dedup_call(cache_key, _fetch)
 
     def get_album(self, album_id: str) -> List[Dict]:
         # Generate cache key based on server URL and album_id
@@ -451,27 +1159,58 @@ class SubsonicClient:
                     pass
                 return cached_songs
         
-        # Fetch from API if not cached
+        # Fetch from API if not cached; duplicate concurrent fetches share one call
         try:
             log.debug("Navidrome: Cache MISS for album %s - fetching from server", album_id)
         except Exception:
             pass
-        resp = self._get("/rest/getAlbum.view", {"id": album_id})
-        songs = resp.get("album", {}).get("song", [])
-        if isinstance(songs, dict):
-            songs = [songs]
-        
-        # Cache the result
-        if self.cache:
-            self.cache.set(cache_key, songs)
-            try:
-                log.debug("Navidrome: Cached album result (%d songs)", len(songs))
-            except Exception:
-                pass
-        
-        return songs
+
+        def _fetch() -> List[Dict]:
+            songs = [_slim_song(s) for s in self._request_stream("/rest/getAlbum.view", {"id": album_id}, "album.song")]
+
+            # Cache the result, preferring a server-provided max-age as the TTL
+            if self.cache:
+                self.cache.set(cache_key, songs, ttl=self._last_cache_ttl)
+                try:
+                    log.debug("Navidrome: Cached album result (%d songs)", len(songs))
+                except Exception:
+                    pass
+            return songs
+
+        return self._dedup_call(cache_key, _fetch)
 
     # ---- Iterators for library traversal ----
+    def _fetch_albums_concurrently(
+        self,
+        album_ids: List[str],
+        *,
+        cancel_flag: Optional[Callable[[], bool]] = None,
+    ) -> Generator[List[Dict], None, None]:
+        """Fetch albums through a bounded worker pool, yielding song lists in completion order."""
+        if not album_ids:
+            return
+        executor = ThreadPoolExecutor(max_workers=self.MAX_FETCH_WORKERS)
+        try:
+            futures = {executor.submit(self.get_album, aid): aid for aid in album_ids}
+            for fut in as_completed(futures):
+                if cancel_flag and cancel_flag():
+                    return
+                try:
+                    songs = fut.result()
+                except Exception as exc:
+                    # Retries are exhausted at this point; record the loss
+                    try:
+                        log.warning("Navidrome: album %s failed after retries: %s", futures[fut], exc)
+                    except Exception:
+                        pass
+                    continue
+                yield songs
+        finally:
+            try:
+                executor.shutdown(wait=False, cancel_futures=True)
+            except TypeError:  # cancel_futures requires Python 3.9+
+                executor.shutdown(wait=False)
+
     def iter_all_songs(
         self, *, page_size: int = 500, max_pages: int = 10000
     ) -> List[Dict]:
@@ -482,15 +1221,9 @@ class SubsonicClient:
             albums = self.get_album_list2(size=page_size, offset=offset)
             if not albums:
                 break
-            for album in albums:
-                album_id = str(album.get("id", ""))
-                if not album_id:
-                    continue
-                try:
-                    songs = self.get_album(album_id)
-                    collected.extend(songs)
-                except Exception:
-                    continue
+            album_ids = [str(a.get("id", "")) for a in albums if a.get("id")]
+            for songs in self._fetch_albums_concurrently(album_ids):
+                collected.extend(songs)
             if len(albums) < page_size:
                 break
             offset += page_size
@@ -505,83 +1238,303 @@ class SubsonicClient:
         progress_cb: Optional[Callable[[int, int], None]] = None,
         cancel_flag: Optional[Callable[[], bool]] = None,
     ) -> Generator[Dict, None, None]:
-        """Yield songs one-by-one; update progress; allow cancel."""
-        # First pass: Calculate total song count for accurate progress
-        total_songs = 0
-        all_albums = []
+        """Yield songs one-by-one; update progress; allow cancel.
+
+        Single streaming pass: each getAlbumList2 page is consumed as it
+        arrives and the progress total grows with the songCount sum of known
+        albums, so the first songs appear without a full pre-count sweep. The
+        next page is prefetched while the current page's albums are in flight.
+        """
+        fetched = 0
+        known_total = 0
         offset = 0
         pages = 0
-        
+
+        if progress_cb:
+            try:
+                progress_cb(0, 0)
+            except Exception:
+                pass
+
+        prefetcher = ThreadPoolExecutor(max_workers=1)
         try:
-            log.debug("Navidrome: Calculating total songs for accurate progress...")
-        except Exception:
-            pass
-        
-        while pages < max_pages:
-            if cancel_flag and cancel_flag():
-                return
             albums = self.get_album_list2(size=page_size, offset=offset)
-            if not albums:
-                break
-            
-            # Count total songs from this page
-            page_song_count = 0
-            for album in albums:
-                sc = album.get("songCount", 0)
-                try:
-                    page_song_count += int(sc)
-                except Exception:
-                    pass
-            
-            total_songs += page_song_count
-            all_albums.extend(albums)
-            
-            if len(albums) < page_size:
-                break
-            offset += page_size
-            pages += 1
-        
-        try:
-            log.debug("Navidrome: Total songs calculated: %d", total_songs)
-        except Exception:
-            pass
-        
-        # Initial progress update with correct total
-        if progress_cb:
-            try:
-                progress_cb(0, total_songs)
-            except Exception:
-                pass
-        
-        # Second pass: Actually fetch and yield songs
-        fetched = 0
-        for album in all_albums:
-            if cancel_flag and cancel_flag():
-                return
-            album_id = str(album.get("id", ""))
-            if not album_id:
-                continue
-            try:
-                songs = self.get_album(album_id)
-            except Exception:
-                songs = []
-            for s in songs:
+            while pages < max_pages and albums:
                 if cancel_flag and cancel_flag():
                     return
-                fetched += 1
+
+                for album in albums:
+                    try:
+                        known_total += int(album.get("songCount", 0))
+                    except Exception:
+                        pass
                 if progress_cb:
                     try:
-                        progress_cb(fetched, total_songs)
+                        progress_cb(fetched, known_total)
                     except Exception:
                         pass
-                yield s
+
+                # Pipeline prefetch: request the next page while this one drains
+                next_page = None
+                if len(albums) >= page_size:
+                    next_page = prefetcher.submit(
+                        self.get_album_list2, size=page_size, offset=offset + page_size
+                    )
+
+                album_ids = [str(a.get("id", "")) for a in albums if a.get("id")]
+                for songs in self._fetch_albums_concurrently(album_ids, cancel_flag=cancel_flag):
+                    for s in songs:
+                        if cancel_flag and cancel_flag():
+                            return
+                        fetched += 1
+                        if progress_cb:
+                            try:
+                                progress_cb(fetched, known_total)
+                            except Exception:
+                                pass
+                        yield s
+
+                if next_page is None:
+                    break
+                try:
+                    albums = next_page.result()
+                except Exception:
+                    break
+                offset += page_size
+                pages += 1
+        finally:
+            prefetcher.shutdown(wait=False)
 
         # Final progress update
         if progress_cb:
             try:
-                progress_cb(fetched, total_songs)
+                progress_cb(fetched, known_total)
+            except Exception:
+                pass
+
+    # ---- Whole-library persistent cache ----
+    def _library_cache_key(self) -> str:
+        return f"{self.base_url}_song_library_{self.username}"
+
+    def library_signature(self) -> str:
+        """Cheap freshness token for the whole song library.
+
+        getScanStatus reports the server's media count and last scan time;
+        while neither moves, the library cannot have changed. Returns ""
+        when the endpoint is unavailable, in which case the cache TTL alone
+        governs staleness.
+        """
+        try:
+            resp = self._get("/rest/getScanStatus.view")
+            st = resp.get("scanStatus", {}) or {}
+            return f"{st.get('count', '')}:{st.get('lastScan', '')}"
+        except Exception:
+            return ""
+
+    def cached_song_library(self, signature: str) -> Optional[List[Dict]]:
+        """Return the cached full song list when the snapshot still matches."""
+        if not self.cache:
+            return None
+        entry = self.cache.get(self._library_cache_key())
+        if not isinstance(entry, dict):
+            return None
+        songs = entry.get("songs")
+        if not isinstance(songs, list):
+            return None
+        if signature and entry.get("signature") != signature:
+            return None
+        return songs
+
+    def store_song_library(self, songs: List[Dict], signature: str) -> None:
+        """Persist the full song list alongside its snapshot token."""
+        if not self.cache or not songs:
+            return
+        try:
+            self.cache.set(
+                self._library_cache_key(),
+                {"signature": signature, "songs": songs},
+                ttl=self.LIBRARY_CACHE_TTL,
+            )
+        except Exception:
+            pass
+
+
+class _PlaylistTransaction:
+    """Context manager that coalesces playlist edits into minimal requests."""
+
+    def __init__(self, client: "SubsonicClient", playlist_id: str) -> None:
+        self._client = client
+        self._playlist_id = playlist_id
+        self._name: Optional[str] = None
+        self._public: Optional[bool] = None
+        self._adds: List[str] = []
+        self._removes: List[int] = []
+        self._replace: Optional[List[str]] = None
+
+    def rename(self, name: str) -> None:
+        self._name = name
+
+    def set_public(self, public: bool) -> None:
+        self._public = public
+
+    def add_tracks(self, song_ids: List[str]) -> None:
+        self._adds.extend(str(s) for s in song_ids)
+
+    def remove_indices(self, indices: List[int]) -> None:
+        self._removes.extend(int(i) for i in indices)
+
+    def replace_tracks(self, song_ids: List[str]) -> None:
+        self._replace = [str(s) for s in song_ids]
+
+    def __enter__(self) -> "_PlaylistTransaction":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if exc_type is not None:
+            return False  # buffered edits are dropped, nothing was sent
+        # A full replacement goes through createPlaylist (in-place update);
+        # incremental edits would be redundant on top of it
+        if self._replace is not None:
+            self._client.replace_playlist_tracks(self._playlist_id, self._replace)
+            self._adds = []
+            self._removes = []
+        if self._name is not None or self._public is not None or self._adds or self._removes:
+            self._client.update_playlist(
+                self._playlist_id,
+                name=self._name,
+                public=self._public,
+                song_ids_to_add=self._adds or None,
+                song_indices_to_remove=self._removes or None,
+            )
+        return False
+
+
+# Reused clients keep their urllib3 pool (and its TLS sessions) warm across
+# dialog opens and actions instead of handshaking from scratch each time
+_CLIENT_CACHE: Dict[Tuple, SubsonicClient] = {}
+
+
+@dataclass(frozen=True)
+class NavSettings:
+    """Connection settings read once from Picard's config proxy."""
+
+    base_url: str
+    username: str
+    password: str
+    verify_ssl: bool
+    enable_cache: bool
+
+    def complete(self) -> bool:
+        return bool(self.base_url and self.username and self.password)
+
+
+def _cfg_bool(key: str, default: bool = False) -> bool:
+    """Read a boolean plugin setting with one guard instead of nested EAFP."""
+    try:
+        return bool(config.setting[key])
+    except (KeyError, ValueError, TypeError):
+        return default
+
+
+def _read_nav_settings() -> NavSettings:
+    """Read and normalize the plugin settings in a single config pass.
+
+    Each ``config.setting[...]`` access goes through Picard's QSettings
+    proxy; actions read five keys, so strip/coerce them here once instead
+    of at every call site.
+    """
+    s = config.setting
+    enable_cache = _cfg_bool("navidrome_enable_cache", True)
+    return NavSettings(
+        base_url=s["navidrome_base_url"].strip(),
+        username=s["navidrome_username"].strip(),
+        password=s["navidrome_password"],
+        verify_ssl=bool(s["navidrome_verify_ssl"]),
+        enable_cache=enable_cache,
+    )
+
+
+def _get_client(
+    base_url: str,
+    username: str,
+    password: str,
+    *,
+    app_name: str = "PicardNavidrome",
+    verify_ssl: bool = True,
+    timeout_seconds: int = 15,
+    enable_cache: bool = True,
+) -> SubsonicClient:
+    """Return a shared SubsonicClient, rebuilding it when settings change."""
+    key = (base_url, username, verify_ssl, timeout_seconds, enable_cache)
+    client = _CLIENT_CACHE.get(key)
+    if client is not None and client.password == password:
+        return client
+    client = SubsonicClient(
+        base_url=base_url,
+        username=username,
+        password=password,
+        app_name=app_name,
+        verify_ssl=verify_ssl,
+        timeout_seconds=timeout_seconds,
+        enable_cache=enable_cache,
+    )
+    _CLIENT_CACHE[key] = client
+    return client
+
+
+# -----------------------------
+# Background network jobs
+# -----------------------------
+class _NetworkJobSignals(QObject):
+    finished = _Signal(object)
+    failed = _Signal(str)
+
+
+class _NetworkJob(QRunnable):
+    """Run a blocking SubsonicClient call on the shared thread pool.
+
+    Results are delivered back to the GUI thread through the ``finished`` /
+    ``failed`` signals (queued connections), so slot handlers never block the
+    Qt event loop on a network roundtrip.
+    """
+
+    def __init__(self, fn: Callable, *args, **kwargs) -> None:
+        super().__init__()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self.signals = _NetworkJobSignals()
+
+    def run(self) -> None:  # type: ignore[override]
+        try:
+            result = self._fn(*self._args, **self._kwargs)
+        except Exception as exc:
+            try:
+                self.signals.failed.emit(str(exc))
             except Exception:
                 pass
+            return
+        try:
+            self.signals.finished.emit(result)
+        except Exception:
+            pass
+
+
+def _run_network_job(
+    fn: Callable,
+    on_finished: Optional[Callable] = None,
+    on_failed: Optional[Callable] = None,
+) -> None:
+    """Dispatch a blocking call on the global QThreadPool with result callbacks."""
+    job = _NetworkJob(fn)
+    try:
+        if on_finished is not None:
+            job.signals.finished.connect(on_finished)  # type: ignore[attr-defined]
+        if on_failed is not None:
+            job.signals.failed.connect(on_failed)  # type: ignore[attr-defined]
+    except Exception:
+        pass
+    QThreadPool.globalInstance().start(job)
 
 
 # -----------------------------
@@ -599,6 +1552,8 @@ class NavidromeOptionsPage(OptionsPage):
         _safe_create_option(BoolOption, "setting", "navidrome_verify_ssl", True),
         _safe_create_option(BoolOption, "setting", "navidrome_save_credentials", False),
         _safe_create_option(BoolOption, "setting", "navidrome_enable_cache", True),
+        _safe_create_option(IntOption, "setting", "navidrome_cache_ttl", 3600),
+        _safe_create_option(IntOption, "setting", "navidrome_cache_ttl_days", 7),
     ] if opt is not None]
 
     def __init__(self, parent=None):
@@ -734,9 +1689,15 @@ class NavidromeOptionsPage(OptionsPage):
                 if not (base_url and username and password):
                     connected = False
                 else:
+                    # Ping on the thread pool so loading/saving the page never blocks the UI
                     try:
-                        client = SubsonicClient(base_url=base_url, username=username, password=password, app_name="PicardNavidrome", verify_ssl=verify_ssl, timeout_seconds=5)
-                        connected = bool(client.ping())
+                        client = _get_client(base_url, username, password, verify_ssl=verify_ssl, timeout_seconds=5)
+                        _run_network_job(
+                            client.ping,
+                            lambda ok: self._apply_conn_status(bool(ok)),
+                            lambda _msg: self._apply_conn_status(False),
+                        )
+                        return
                     except Exception:
                         connected = False
             elif connected is None:
@@ -746,6 +1707,12 @@ class NavidromeOptionsPage(OptionsPage):
                 connected = bool(base_url and username and password)
                 if connected:
                     connected = False
+            self._apply_conn_status(bool(connected))
+        except Exception:
+            pass
+
+    def _apply_conn_status(self, connected: bool) -> None:
+        try:
             if connected:
                 self.conn_status.setText("Connected!")
                 self.conn_status.setStyleSheet("color: green;")
@@ -768,22 +1735,45 @@ class NavidromeOptionsPage(OptionsPage):
             return
 
         try:
-            client = SubsonicClient(
-                base_url=base_url,
-                username=username,
-                password=password,
+            client = _get_client(
+                base_url,
+                username,
+                password,
                 app_name=app_name,
                 verify_ssl=verify_ssl,
             )
-            if client.ping():
+        except Exception as exc:
+            self._update_conn_status(connected=False)
+            QMessageBox.critical(self, "Navidrome", f"Connection error: {exc}")
+            return
+
+        # Run the ping on the thread pool so the options page stays responsive
+        try:
+            self.test_button.setEnabled(False)
+        except Exception:
+            pass
+
+        def _on_ping(ok: object) -> None:
+            try:
+                self.test_button.setEnabled(True)
+            except Exception:
+                pass
+            if ok:
                 self._update_conn_status(connected=True)
                 QMessageBox.information(self, "Navidrome", f"Logged successfully as {username}.")
             else:
                 self._update_conn_status(connected=False)
                 QMessageBox.critical(self, "Navidrome", "Connection failed. Please check your credentials and server URL.")
-        except Exception as exc:
+
+        def _on_ping_failed(msg: str) -> None:
+            try:
+                self.test_button.setEnabled(True)
+            except Exception:
+                pass
             self._update_conn_status(connected=False)
-            QMessageBox.critical(self, "Navidrome", f"Connection error: {exc}")
+            QMessageBox.critical(self, "Navidrome", f"Connection error: {msg}")
+
+        _run_network_job(client.ping, _on_ping, _on_ping_failed)
 
     def _open_browser(self) -> None:
         base_url = self.base_url.text().strip()
@@ -796,26 +1786,17 @@ class NavidromeOptionsPage(OptionsPage):
             return
         try:
             self.save()
-            try:
-                enable_cache = bool(config.setting["navidrome_enable_cache"])
-            except (KeyError, ValueError):
-                enable_cache = True
-            client = SubsonicClient(
-                base_url=base_url, 
-                username=username, 
-                password=password, 
-                app_name=app_name, 
+            enable_cache = _cfg_bool("navidrome_enable_cache", True)
+            client = _get_client(
+                base_url,
+                username,
+                password,
+                app_name=app_name,
                 verify_ssl=verify_ssl,
-                enable_cache=enable_cache
+                enable_cache=enable_cache,
             )
             dlg = NavidromeBrowserDialog(None, client)
-            try:
-                dlg.exec()
-            except Exception:
-                try:
-                    dlg.exec_()
-                except Exception:
-                    dlg.show()
+            _exec_dialog(dlg)
         except Exception as exc:
             QMessageBox.critical(None, "Navidrome", f"Error: {exc}")
 
@@ -830,26 +1811,17 @@ class NavidromeOptionsPage(OptionsPage):
             return
         try:
             self.save()
-            try:
-                enable_cache = bool(config.setting["navidrome_enable_cache"])
-            except (KeyError, ValueError):
-                enable_cache = True
-            client = SubsonicClient(
-                base_url=base_url, 
-                username=username, 
-                password=password, 
-                app_name=app_name, 
+            enable_cache = _cfg_bool("navidrome_enable_cache", True)
+            client = _get_client(
+                base_url,
+                username,
+                password,
+                app_name=app_name,
                 verify_ssl=verify_ssl,
-                enable_cache=enable_cache
+                enable_cache=enable_cache,
             )
             dlg = NavidromeLibraryDialog(None, client)
-            try:
-                dlg.exec()
-            except Exception:
-                try:
-                    dlg.exec_()
-                except Exception:
-                    dlg.show()
+            _exec_dialog(dlg)
         except Exception as exc:
             QMessageBox.critical(None, "Navidrome", f"Error: {exc}")
 
@@ -863,15 +1835,42 @@ class NavidromeOptionsPage(OptionsPage):
             verify_ssl = bool(self.verify_ssl.isChecked())
             
             if base_url and username and password:
-                client = SubsonicClient(
-                    base_url=base_url, 
-                    username=username, 
-                    password=password, 
+                client = _get_client(
+                    base_url,
+                    username,
+                    password,
                     verify_ssl=verify_ssl,
-                    enable_cache=True
+                    enable_cache=True,
                 )
-                client.clear_cache()
-                QMessageBox.information(self, "Navidrome", "Cache cleared successfully!")
+
+                # Clearing the sqlite tier touches disk; keep it off the GUI
+                # thread and show a busy dialog so the Options page stays alive
+                progress = None
+                try:
+                    progress = QProgressDialog("Clearing cache…", None, 0, 0, self)
+                    progress.setWindowTitle("Navidrome")
+                    progress.setWindowModality(Qt.WindowModal)
+                    progress.setMinimumDuration(0)
+                    progress.show()
+                except Exception:
+                    progress = None
+
+                def _close_progress() -> None:
+                    if progress is not None:
+                        try:
+                            progress.close()
+                        except Exception:
+                            pass
+
+                def _on_cleared(_result) -> None:
+                    _close_progress()
+                    QMessageBox.information(self, "Navidrome", "Cache cleared successfully!")
+
+                def _on_failed(msg: str) -> None:
+                    _close_progress()
+                    QMessageBox.critical(self, "Navidrome", f"Error clearing cache: {msg}")
+
+                _run_network_job(client.clear_cache, on_finished=_on_cleared, on_failed=_on_failed)
             else:
                 QMessageBox.warning(self, "Navidrome", "Please configure connection settings first.")
         except Exception as exc:
@@ -884,6 +1883,24 @@ class NavidromeOptionsPage(OptionsPage):
             QMessageBox.critical(None, "Navidrome", f"Unable to open About: {exc}")
 
 
+def _show_names_dialog(names: List[str]) -> None:
+    """Show playlist names in a virtualized list view.
+
+    QMessageBox lays out its text through the rich-text engine, which gets
+    quadratically slower as the string grows; a QListView only renders the
+    visible rows no matter how many playlists the server returns.
+    """
+    dlg = QDialog(None)
+    dlg.setWindowTitle("Navidrome Playlists")
+    view = QListView(dlg)
+    view.setModel(QStringListModel(names, dlg))
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    layout = QVBoxLayout(dlg)
+    layout.addWidget(view)
+    dlg.resize(400, 600)
+    _exec_dialog(dlg)
+
+
 # -----------------------------
 # Context menu action
 # -----------------------------
@@ -892,13 +1909,9 @@ class NavidromeFetchPlaylistsAction(BaseAction):
     TITLE = "Navidrome: List Playlists"
 
     def callback(self, objs) -> None:  # objs: selected items (unused)
-        base_url = config.setting["navidrome_base_url"].strip()
-        username = config.setting["navidrome_username"].strip()
-        password = config.setting["navidrome_password"]
-        app_name = "PicardNavidrome"
-        verify_ssl = bool(config.setting["navidrome_verify_ssl"])
+        settings = _read_nav_settings()
 
-        if not base_url or not username or not password:
+        if not settings.complete():
             QMessageBox.warning(
                 None,
                 "Navidrome",
@@ -907,19 +1920,24 @@ class NavidromeFetchPlaylistsAction(BaseAction):
             return
 
         try:
-            client = SubsonicClient(
-                base_url=base_url,
-                username=username,
-                password=password,
-                app_name=app_name,
-                verify_ssl=verify_ssl,
+            client = _get_client(
+                settings.base_url,
+                settings.username,
+                settings.password,
+                verify_ssl=settings.verify_ssl,
             )
-            playlists = client.get_playlists()
-            if not playlists:
-                QMessageBox.information(None, "Navidrome", "No playlists found.")
-                return
-            names = "\n".join(p.get("name", "(unnamed)") for p in playlists)
-            QMessageBox.information(None, "Navidrome Playlists", names)
+
+            # Fetch off the GUI thread; the result dispatches back via signals
+            def _on_playlists(playlists) -> None:
+                if not playlists:
+                    QMessageBox.information(None, "Navidrome", "No playlists found.")
+                    return
+                _show_names_dialog([p.get("name", "(unnamed)") for p in playlists])
+
+            def _on_failed(msg: str) -> None:
+                QMessageBox.critical(None, "Navidrome", f"Error: {msg}")
+
+            _run_network_job(client.get_playlists, on_finished=_on_playlists, on_failed=_on_failed)
         except Exception as exc:
             QMessageBox.critical(None, "Navidrome", f"Error: {exc}")
 
@@ -929,11 +1947,38 @@ class NavidromeFetchPlaylistsAction(BaseAction):
 # -----------------------------
 class _DraggableListWidget(QListWidget):
     """Custom QListWidget with safer DnD and transparent drag pixmap."""
+
+    # Indicator pen, created once on first paint and shared by all instances
+    _drop_pen = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self._dragging = False
         self._drop_row = -1
         self._drop_above = True
+        # Row -> (top, bottom) viewport bounds; visualItemRect is stable
+        # between model/scroll changes, so cache it per hovered row
+        self._row_y_cache: Dict[int, Tuple[int, int]] = {}
+        try:
+            model = self.model()
+            model.rowsMoved.connect(self._invalidate_row_cache)  # type: ignore[attr-defined]
+            model.rowsInserted.connect(self._invalidate_row_cache)  # type: ignore[attr-defined]
+            model.rowsRemoved.connect(self._invalidate_row_cache)  # type: ignore[attr-defined]
+            self.verticalScrollBar().valueChanged.connect(self._invalidate_row_cache)  # type: ignore[attr-defined]
+        except Exception:
+            pass
+
+    def _invalidate_row_cache(self, *_args) -> None:
+        self._row_y_cache.clear()
+
+    def _row_bounds(self, row: int, item) -> Tuple[int, int]:
+        """Return cached (top, bottom) viewport coordinates for a row."""
+        bounds = self._row_y_cache.get(row)
+        if bounds is None:
+            r = self.visualItemRect(item)
+            bounds = (r.top(), r.bottom())
+            self._row_y_cache[row] = bounds
+        return bounds
 
     def startDrag(self, supportedActions):  # type: ignore[override]
         try:
@@ -977,39 +2022,31 @@ class _DraggableListWidget(QListWidget):
             except Exception:
                 pass
         # Initialize drop indicator
+        self._update_drop_indicator(event)
+
+    def _update_drop_indicator(self, event) -> None:
+        """Recompute the indicator position; repaint only when it moved."""
         try:
-            pos = event.position() if hasattr(event, 'position') else event.pos()
-            pt = pos.toPoint() if hasattr(pos, 'toPoint') else pos
+            pt = _event_pos(event)
             idx_item = self.itemAt(pt)
             if idx_item is None:
-                self._drop_row = self.count() - 1
-                self._drop_above = False
+                drop_row = self.count() - 1
+                drop_above = False
             else:
-                row = self.row(idx_item)
-                r = self.visualItemRect(idx_item)
-                self._drop_row = row
-                self._drop_above = (pt.y() < (r.top() + r.height() // 2))
-            self.viewport().update()
+                drop_row = self.row(idx_item)
+                top, bot = self._row_bounds(drop_row, idx_item)
+                # Branch-free midpoint test: y < (top + bot) / 2
+                drop_above = (pt.y() * 2 < top + bot)
+            if (drop_row, drop_above) != (self._drop_row, self._drop_above):
+                self._drop_row = drop_row
+                self._drop_above = drop_above
+                self.viewport().update()
         except Exception:
             pass
 
     def dragMoveEvent(self, event):  # type: ignore[override]
         # Update visual drop indicator line and accept
-        try:
-            pos = event.position() if hasattr(event, 'position') else event.pos()
-            pt = pos.toPoint() if hasattr(pos, 'toPoint') else pos
-            idx_item = self.itemAt(pt)
-            if idx_item is None:
-                self._drop_row = self.count() - 1
-                self._drop_above = False
-            else:
-                row = self.row(idx_item)
-                r = self.visualItemRect(idx_item)
-                self._drop_row = row
-                self._drop_above = (pt.y() < (r.top() + r.height() // 2))
-            self.viewport().update()
-        except Exception:
-            pass
+        self._update_drop_indicator(event)
         try:
             event.acceptProposedAction()
         except Exception:
@@ -1022,8 +2059,7 @@ class _DraggableListWidget(QListWidget):
         # Guard against dropping directly below itself causing disappear
         try:
             src_row = self.currentRow()
-            pos = event.position() if hasattr(event, 'position') else event.pos()  # PyQt6 vs 5
-            dst_row = self.row(self.itemAt(pos.toPoint() if hasattr(pos, 'toPoint') else pos))
+            dst_row = self.row(self.itemAt(_event_pos(event)))
             if dst_row < 0:
                 dst_row = self.count() - 1
             if dst_row == src_row:
@@ -1032,6 +2068,11 @@ class _DraggableListWidget(QListWidget):
                 return
         except Exception:
             pass
+        # Suppress intermediate repaints while rows shuffle; one update at the end
+        try:
+            self.setUpdatesEnabled(False)
+        except Exception:
+            pass
         try:
             super().dropEvent(event)
             try:
@@ -1040,12 +2081,14 @@ class _DraggableListWidget(QListWidget):
                 pass
         except Exception:
             event.ignore()
-        # Clear indicator
-        try:
-            self._drop_row = -1
-            self.viewport().update()
-        except Exception:
-            pass
+        finally:
+            # Clear indicator and repaint once
+            try:
+                self._drop_row = -1
+                self.setUpdatesEnabled(True)
+                self.viewport().update()
+            except Exception:
+                pass
         # Clear selection after successful drop to meet UX requirement
         try:
             self.clearSelection()
@@ -1100,14 +2143,16 @@ class _DraggableListWidget(QListWidget):
                 p = QPainter(self.viewport())
                 try:
                     p.setRenderHint(QPainter.Antialiasing, True)
-                    pen_color = QColor(0, 120, 215)
-                    pen = QPen(pen_color, 2)
+                    # Shared pen; no per-frame QPen/QColor allocation
+                    pen = _DraggableListWidget._drop_pen
+                    if pen is None:
+                        pen = QPen(QColor(0, 120, 215), 2)
+                        _DraggableListWidget._drop_pen = pen
                     p.setPen(pen)
                     # Determine y position
                     if self._drop_row < self.count():
-                        ref_item = self.item(self._drop_row)
-                        rect = self.visualItemRect(ref_item)
-                        y = rect.top() if self._drop_above else rect.bottom()
+                        top, bot = self._row_bounds(self._drop_row, self.item(self._drop_row))
+                        y = top if self._drop_above else bot
                     else:
                         y = self.viewport().rect().bottom()
                     p.drawLine(0, y, self.viewport().width(), y)
@@ -1116,14 +2161,209 @@ class _DraggableListWidget(QListWidget):
         except Exception:
             pass
 
+# Stylesheets used by the browser dialog, parsed once per process instead of
+# per dialog construction
+_PLAYLISTS_QSS = """
+    QListView {
+        background-color: #fafafa;
+        border: none;
+        padding: 4px;
+        outline: none;
+    }
+    QListView:focus {
+        border: none;
+        outline: none;
+    }
+    QListView::item {
+        padding: 8px 12px;
+        border-radius: 6px;
+        margin: 2px;
+        font-weight: normal;
+        border: none;
+        background: transparent;
+    }
+    /* Edited (selected) playlist in blue */
+    QListView::item:selected {
+        background-color: #2196F3;
+        color: white;
+        font-weight: bold;
+        border: none;
+    }
+    QListView::item:hover {
+        background-color: #e3f2fd;
+        color: #1976d2;
+    }
+    QListView::item:focus {
+        outline: none;
+        border: none;
+    }
+"""
+
+_HEADERS_QSS = """
+    QWidget {
+        background-color: #f5f5f5;
+        border-bottom: 2px solid #ddd;
+        border-left: 1px solid #ddd;
+        border-right: 1px solid #ddd;
+        border-top: 1px solid #ddd;
+    }
+"""
+
+# Both handle states in one sheet: toggling the "state" property re-styles
+# without reparsing CSS on every press/release
+_HANDLE_QSS = """
+    QLabel[state="idle"] {
+        background-color: #ddd;
+        border-left: 1px solid #bbb;
+        border-right: 1px solid #bbb;
+        color: #666;
+        font-weight: bold;
+        font-size: 12px;
+    }
+    QLabel[state="idle"]:hover {
+        background-color: #2196F3;
+        color: white;
+        border-left: 1px solid #1976D2;
+        border-right: 1px solid #1976D2;
+    }
+    QLabel[state="active"] {
+        background-color: #1976D2;
+        color: white;
+        border-left: 1px solid #0D47A1;
+        border-right: 1px solid #0D47A1;
+        font-weight: bold;
+        font-size: 12px;
+    }
+"""
+
+
+def _set_handle_state(handle, state: str) -> None:
+    """Flip a resize handle between its idle/active style states."""
+    try:
+        handle.setProperty("state", state)
+        style = handle.style()
+        style.unpolish(handle)
+        style.polish(handle)
+    except Exception:
+        pass
+
+_HEADER_NUM_QSS = """
+    QLabel {
+        padding: 8px 4px;
+        border-right: 2px solid #999;
+        background-color: #e8e8e8;
+        color: #333;
+        font-weight: bold;
+    }
+    QLabel:hover {
+        background-color: #d8d8d8;
+    }
+"""
+
+_HEADER_DRAG_QSS = """
+    QLabel {
+        padding: 8px 4px;
+        border-right: 1px solid #ccc;
+        background-color: #f0f0f0;
+    }
+    QLabel:hover {
+        background-color: #e0e0e0;
+        cursor: pointer;
+    }
+"""
+
+_TRACK_NUM_QSS = (
+    "background-color: #f2f2f2;"
+    "border: 1px solid #d0d0d0;"
+    "border-radius: 4px;"
+    "color: #555;"
+    "font-weight: bold;"
+    "padding: 2px 6px;"
+)
+
+_TRACK_TEXT_QSS = "padding: 2px 4px;"
+
+# Light green background for rows whose tracks were just added
+_ROW_HIGHLIGHT_QSS = "background-color: #c8e6c9;"
+
+# Event types the drag-select filter cares about; everything else returns
+# before any try frame is set up
+try:
+    _MOUSE_EVENTS = frozenset({QEvent.MouseButtonPress, QEvent.MouseMove, QEvent.MouseButtonRelease})
+except Exception:
+    _MOUSE_EVENTS = frozenset()
+
+
+class _HeaderEventFilter(QObject):
+    """Route header mouse events to the owning dialog.
+
+    One shared filter replaces the three per-header lambda overrides, so
+    event dispatch goes through a single Python callable instead of a
+    closure allocated per header per handler.
+    """
+
+    def __init__(self, owner) -> None:
+        super().__init__(owner)
+        self._owner = owner
+
+    def eventFilter(self, obj, event):  # type: ignore[override]
+        try:
+            et = event.type()
+            if et == QEvent.MouseButtonPress:
+                self._owner._header_mouse_press(event, obj)
+            elif et == QEvent.MouseMove:
+                self._owner._header_mouse_move(event, obj)
+            elif et == QEvent.MouseButtonRelease:
+                self._owner._header_mouse_release(event, obj)
+            else:
+                return False
+            return True
+        except Exception:
+            return False
+
+
 # -----------------------------
 # Simple playlists browser dialog
 # -----------------------------
 class NavidromeBrowserDialog(QDialog):
+    # Fixed width of the ⋮ column-resize handles
+    _HANDLE_WIDTH = 8
+
     def __init__(self, parent: Optional[QWidget], client: SubsonicClient) -> None:
         super().__init__(parent)
         self.setWindowTitle("Navidrome Playlists")
         self.client = client
+
+        # Coalesces resize-drag mouse moves to at most ~60 updates/second
+        # Drag/resize state machine: plain attributes instead of
+        # hasattr/delattr probing in the per-event handlers
+        self._is_dragging = False
+        self._dragging_header = None
+        self._drag_start_pos = None
+        self._original_cursor = None
+        self._is_resizing = False
+        self._resizing_header = None
+        self._resizing_col_index = -1
+        self._resize_start_pos = None
+        self._original_width = 0
+        self._last_applied_width = None
+        self._handle_to_header: Dict[int, QLabel] = {}
+        self._header_index: Dict[int, int] = {}
+        self._drag_geometry: List[Tuple[int, int, int]] = []
+        self._dragging_index = -1
+        self._last_swap_target = -1
+        self._layout_dirty = 0
+        self._layout_flush_scheduled = False
+        self._header_filter = _HeaderEventFilter(self)
+        self._pending_resize = None
+        self._resize_timer = None
+        try:
+            self._resize_timer = QTimer(self)
+            self._resize_timer.setSingleShot(True)
+            self._resize_timer.setInterval(16)
+            self._resize_timer.timeout.connect(self._apply_pending_resize)  # type: ignore[attr-defined]
+        except Exception:
+            self._resize_timer = None
         try:
             self.resize(1200, 800)
         except Exception:
@@ -1147,55 +2387,20 @@ class NavidromeBrowserDialog(QDialog):
 
         self.info_label = QLabel("Select a playlist to view and reorder tracks", self)
 
-        # Left panel: Playlists list with better styling
-        self.playlists_list = QListWidget(self)
+        # Left panel: playlists as a model-backed view; names live in a
+        # QStringListModel so population is one C++ reset, not N widget items
+        self.playlists_list = QListView(self)
+        self._playlists_model = QStringListModel(self.playlists_list)
+        try:
+            self.playlists_list.setModel(self._playlists_model)
+        except Exception:
+            pass
         try:
+            self.playlists_list.setEditTriggers(QAbstractItemView.NoEditTriggers)  # type: ignore[attr-defined]
             self.playlists_list.setAlternatingRowColors(True)
             self.playlists_list.setSelectionMode(QAbstractItemView.SingleSelection)  # type: ignore[attr-defined]
-            try:
-                self.playlists_list.setSpacing(2)
-            except Exception:
-                pass
-            try:
-                self.playlists_list.setStyleSheet(
-                    """
-                    QListWidget {
-                        background-color: #fafafa;
-                        border: none;
-                        padding: 4px;
-                        outline: none;
-                    }
-                    QListWidget:focus {
-                        border: none;
-                        outline: none;
-                    }
-                    QListWidget::item {
-                        padding: 8px 12px;
-                        border-radius: 6px;
-                        margin: 2px;
-                        font-weight: normal;
-                        border: none;
-                        background: transparent;
-                    }
-                    /* Edited (selected) playlist in blue */
-                    QListWidget::item:selected {
-                        background-color: #2196F3;
-                        color: white;
-                        font-weight: bold;
-                        border: none;
-                    }
-                    QListWidget::item:hover {
-                        background-color: #e3f2fd;
-                        color: #1976d2;
-                    }
-                    QListWidget::item:focus {
-                        outline: none;
-                        border: none;
-                    }
-                    """
-                )
-            except Exception:
-                pass
+            self.playlists_list.setSpacing(2)
+            self.playlists_list.setStyleSheet(_PLAYLISTS_QSS)
         except Exception:
             pass
 
@@ -1207,8 +2412,6 @@ class NavidromeBrowserDialog(QDialog):
             self.tracks_list.setDefaultDropAction(Qt.MoveAction)  # type: ignore
             self.tracks_list.setDragDropMode(QAbstractItemView.InternalMove)
             self.tracks_list.setDropIndicatorShown(True)
-            # Connect reordering signal
-            self.tracks_list.orderChanged.connect(self._on_tracks_reordered)  # type: ignore[attr-defined]
         except Exception:
             pass
 
@@ -1223,11 +2426,6 @@ class NavidromeBrowserDialog(QDialog):
         except Exception:
             pass
         left_controls.addWidget(self.playlists_list, 1)
-        # Show which playlist is being edited
-        try:
-            self.playlists_list.currentTextChanged.connect(self._update_editing_label)  # type: ignore[attr-defined]
-        except Exception:
-            pass
 
         # Playlist action buttons
         try:
@@ -1358,7 +2556,11 @@ class NavidromeBrowserDialog(QDialog):
 
         # Connect signals
         try:
-            self.playlists_list.currentRowChanged.connect(self._on_playlist_selected)  # type: ignore[attr-defined]
+            # UniqueConnection: the surrounding try/except would otherwise
+            # silently stack a second handler if this ever ran twice
+            self.playlists_list.selectionModel().currentChanged.connect(
+                self._on_playlist_current_changed, Qt.UniqueConnection
+            )  # type: ignore[attr-defined]
             self.rename_button.clicked.connect(self._rename_playlist)  # type: ignore[attr-defined]
             self.delete_button.clicked.connect(self._delete_playlist)  # type: ignore[attr-defined]
             self.public_checkbox.stateChanged.connect(self._toggle_public)  # type: ignore[attr-defined]
@@ -1368,60 +2570,150 @@ class NavidromeBrowserDialog(QDialog):
         except Exception:
             pass
 
-        # Track drag reordering
+        # Track drag reordering (single connection; the old orderChanged hookup
+        # pointed at a signal the widget never had)
         try:
             self.tracks_list.model().rowsMoved.connect(self._on_tracks_reordered)  # type: ignore[attr-defined]
         except Exception:
             pass
 
+        # Debounce pushing a reordered track list to the server so several
+        # quick drags collapse into one delete/create round-trip
+        self._order_dirty = False
+        self._order_playlist: Tuple[int, str, str] = (-1, "", "")
+        self._order_flush_timer = None
+        try:
+            self._order_flush_timer = QTimer(self)
+            self._order_flush_timer.setSingleShot(True)
+            self._order_flush_timer.setInterval(500)
+            self._order_flush_timer.timeout.connect(self._flush_track_order)  # type: ignore[attr-defined]
+        except Exception:
+            self._order_flush_timer = None
+        try:
+            # Bound method; PyQt drops the surplus result argument
+            self.finished.connect(self._flush_track_order)  # type: ignore[attr-defined]
+        except Exception:
+            pass
+
+        # Debounce selection changes so holding arrow-down does not fire a
+        # label update + tracks load per intermediate row
+        self._pending_selection_row = -1
+        self._selection_timer = None
+        try:
+            self._selection_timer = QTimer(self)
+            self._selection_timer.setSingleShot(True)
+            self._selection_timer.setInterval(50)
+            self._selection_timer.timeout.connect(self._apply_pending_selection)  # type: ignore[attr-defined]
+        except Exception:
+            self._selection_timer = None
+
         self._updating_ui = False
         self._current_playlist_tracks = []  # Store current tracks with IDs
+        self._current_playlist_track_ids: List[str] = []  # Ids in load order, no Qt round-trips
         self._newly_added_track_ids: Set[str] = set()  # Track IDs of newly added tracks for green highlighting
         self._last_selected_playlist_id: str = ""  # Track last selected playlist to detect switching
+        self._owner_cache: Dict[str, bool] = {}  # Ownership verdict per playlist id
         self._load_playlists()
 
-    def _update_editing_label(self, name: str) -> None:
-        """Show the currently edited playlist in black; use green only for success messages elsewhere."""
+    def _playlists_current_row(self) -> int:
         try:
-            self.info_label.setText(f"Editing: {name}")
-            # Match size and weight with success message, but keep color black
-            self.info_label.setStyleSheet("color: black; font-size: 14px; font-weight: bold;")
+            return self.playlists_list.selectionModel().currentIndex().row()
+        except Exception:
+            return -1
+
+    def _on_playlist_current_changed(self, current, _previous) -> None:
+        """Selection-model slot replacing currentRowChanged/currentTextChanged."""
+        try:
+            row = current.row() if current is not None and current.isValid() else -1
+        except Exception:
+            row = -1
+        self._pending_selection_row = row
+        timer = getattr(self, "_selection_timer", None)
+        if timer is not None:
+            try:
+                timer.start()
+                return
+            except Exception:
+                pass
+        self._apply_pending_selection()
+
+    def _apply_pending_selection(self) -> None:
+        """Act on the most recent selection once rapid navigation settles."""
+        row = self._pending_selection_row
+        if row >= 0:
+            try:
+                name = str(self._playlists_model.data(self._playlists_model.index(row)) or "")
+                self._update_editing_label(name)
+            except Exception:
+                pass
+        self._on_playlist_selected(row)
+
+    def _update_editing_label(self, name: str) -> None:
+        """Show the currently edited playlist in black; use green only for success messages elsewhere."""
+        try:
+            self.info_label.setText(f"Editing: {name}")
+            # Match size and weight with success message, but keep color black
+            self.info_label.setStyleSheet("color: black; font-size: 14px; font-weight: bold;")
         except Exception:
             pass
 
     def _load_playlists(self) -> None:
+        # Fetch on the thread pool; the dialog shows immediately and fills on arrival
         try:
-            playlists = self.client.get_playlists()
-        except Exception as exc:
-            QMessageBox.critical(self, "Navidrome", f"Failed to load playlists: {exc}")
-            return
-        self._playlists = playlists
-        self.playlists_list.clear()
-        for pl in playlists:
-            name = pl.get("name", "(unnamed)")
-            item = QListWidgetItem(name)
+            self.info_label.setText("Loading playlists…")
+        except Exception:
+            pass
+        _run_network_job(
+            self.client.get_playlists,
+            self._on_playlists_loaded,
+            lambda msg: QMessageBox.critical(self, "Navidrome", f"Failed to load playlists: {msg}"),
+        )
+
+    def _on_playlists_loaded(self, playlists: object) -> None:
+        self._playlists = list(playlists or [])
+        self._owner_cache.clear()
+        playlists = self._playlists
+        # Elegant (not bold) font for playlist names, applied once to the view
+        try:
+            font = self.playlists_list.font()
             try:
-                # Different, more elegant font for playlist names (not bold)
-                font = item.font()
-                try:
-                    font.setFamily("Segoe UI")
-                except Exception:
-                    pass
-                try:
-                    font.setPointSize(font.pointSize() + 1)
-                except Exception:
-                    pass
-                font.setBold(False)
-                font.setItalic(False)
-                item.setFont(font)
+                font.setFamily("Segoe UI")
+            except Exception:
+                pass
+            try:
+                font.setPointSize(font.pointSize() + 1)
+            except Exception:
+                pass
+            font.setBold(False)
+            font.setItalic(False)
+            self.playlists_list.setFont(font)
+        except Exception:
+            pass
+        # One model reset populates the whole panel; keep selection signals
+        # quiet until it is fully built so the initial setCurrentIndex does
+        # not race an extra tracks round-trip through the debounce slot
+        try:
+            self.playlists_list.blockSignals(True)
+            # currentChanged lives on the selection model, not the view
+            self.playlists_list.selectionModel().blockSignals(True)
+        except Exception:
+            pass
+        try:
+            self._playlists_model.setStringList([pl.get("name", "(unnamed)") for pl in playlists])
+            if self._playlists_model.rowCount() > 0:
+                self.playlists_list.setCurrentIndex(self._playlists_model.index(0))
+        except Exception:
+            pass
+        finally:
+            try:
+                self.playlists_list.blockSignals(False)
+                self.playlists_list.selectionModel().blockSignals(False)
             except Exception:
                 pass
-            self.playlists_list.addItem(item)
-        # Auto-select and highlight the first playlist if available
+        # Exactly one explicit selection pass for the first playlist
         try:
-            if self.playlists_list.count() > 0:
-                self.playlists_list.setCurrentRow(0)
-                # Trigger loading of tracks and label update
+            if self._playlists_model.rowCount() > 0:
+                self._update_editing_label(str(playlists[0].get("name", "(unnamed)")))
                 self._on_playlist_selected(0)
         except Exception:
             pass
@@ -1488,15 +2780,7 @@ class NavidromeBrowserDialog(QDialog):
             pass
             
         try:
-            self.headers_widget.setStyleSheet("""
-                QWidget {
-                    background-color: #f5f5f5;
-                    border-bottom: 2px solid #ddd;
-                    border-left: 1px solid #ddd;
-                    border-right: 1px solid #ddd;
-                    border-top: 1px solid #ddd;
-                }
-            """)
+            self.headers_widget.setStyleSheet(_HEADERS_QSS)
         except Exception:
             pass
 
@@ -1536,29 +2820,72 @@ class NavidromeBrowserDialog(QDialog):
                         handle.show()
                     except Exception:
                         pass
+            # O(1) lookup tables for the mouse handlers; identity keys avoid
+            # QWidget __eq__ and hasattr probes on every press/move
+            self._handle_to_header = {
+                id(h._resize_handle): h
+                for h in self.column_headers
+                if getattr(h, '_resize_handle', None) is not None
+            }
+            self._header_index = {id(h): i for i, h in enumerate(self.column_headers)}
+        except Exception:
+            pass
+
+    # Header layout dirty flags
+    _LAYOUT_WIDTHS = 1
+    _LAYOUT_HANDLES = 2
+
+    def _schedule_header_layout(self, flags: int) -> None:
+        """Coalesce width/handle refreshes into one pass per event cycle."""
+        self._layout_dirty |= flags
+        if self._layout_flush_scheduled:
+            return
+        self._layout_flush_scheduled = True
+        try:
+            QTimer.singleShot(0, self._flush_header_layout)
+        except Exception:
+            self._layout_flush_scheduled = False
+            self._flush_header_layout()
+
+    def _flush_header_layout(self) -> None:
+        flags = self._layout_dirty
+        self._layout_dirty = 0
+        self._layout_flush_scheduled = False
+        try:
+            if flags & self._LAYOUT_WIDTHS:
+                self._apply_header_widths()
+            if flags & self._LAYOUT_HANDLES:
+                self._refresh_header_handles()
         except Exception:
             pass
 
     def _apply_header_widths(self) -> None:
         """Set each header label width so (label + handle) equals configured column width."""
         try:
-            for i, header in enumerate(self.column_headers):
-                # Column width from config for visual index i
-                try:
-                    display_col_idx = self.column_order[i]
-                except Exception:
-                    display_col_idx = i
-                total_width = self.column_config[display_col_idx][1]
-                handle = getattr(header, '_resize_handle', None)
-                handle_width = 0
-                try:
-                    if handle is not None and handle.isVisible():
-                        handle_width = int(handle.width())
-                except Exception:
-                    handle_width = 0
-                label_width = max(20, total_width - handle_width)
+            # Handles are fixed-width and hidden only on the last column, so
+            # widths are computable in pure Python without per-handle queries
+            last_idx = len(self.column_headers) - 1
+            try:
+                self.headers_widget.setUpdatesEnabled(False)
+            except Exception:
+                pass
+            try:
+                for i, header in enumerate(self.column_headers):
+                    # Column width from config for visual index i
+                    try:
+                        display_col_idx = self.column_order[i]
+                    except Exception:
+                        display_col_idx = i
+                    total_width = self.column_config[display_col_idx][1]
+                    handle_width = self._HANDLE_WIDTH if i != last_idx else 0
+                    label_width = max(20, total_width - handle_width)
+                    try:
+                        header.setFixedWidth(label_width)
+                    except Exception:
+                        pass
+            finally:
                 try:
-                    header.setFixedWidth(label_width)
+                    self.headers_widget.setUpdatesEnabled(True)
                 except Exception:
                     pass
         except Exception:
@@ -1568,27 +2895,13 @@ class NavidromeBrowserDialog(QDialog):
         """Create a visible resize handle between columns."""
         handle = QLabel("⋮", self)  # Using vertical dots as resize indicator
         try:
-            handle.setFixedWidth(8)
+            handle.setFixedWidth(self._HANDLE_WIDTH)
             handle.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)  # type: ignore
             handle.setCursor(Qt.SizeHorCursor)  # type: ignore
-            handle.setStyleSheet("""
-                QLabel {
-                    background-color: #ddd;
-                    border-left: 1px solid #bbb;
-                    border-right: 1px solid #bbb;
-                    color: #666;
-                    font-weight: bold;
-                    font-size: 12px;
-                }
-                QLabel:hover {
-                    background-color: #2196F3;
-                    color: white;
-                    border-left: 1px solid #1976D2;
-                    border-right: 1px solid #1976D2;
-                }
-            """)
+            handle.setProperty("state", "idle")
+            handle.setStyleSheet(_HANDLE_QSS)
             handle.setToolTip("↔ Drag to resize column")
-            
+
             # Add mouse events for resizing
             handle.mousePressEvent = lambda event: self._handle_resize_press(event, handle)
             handle.mouseMoveEvent = lambda event: self._handle_resize_move(event, handle)
@@ -1609,41 +2922,18 @@ class NavidromeBrowserDialog(QDialog):
             header.setFixedWidth(width)
             # Different styling for # column (fixed) vs other columns (draggable)
             if text == "#":
-                header.setStyleSheet("""
-                    QLabel {
-                        padding: 8px 4px;
-                        border-right: 2px solid #999;
-                        background-color: #e8e8e8;
-                        color: #333;
-                        font-weight: bold;
-                    }
-                    QLabel:hover {
-                        background-color: #d8d8d8;
-                    }
-                """)
+                header.setStyleSheet(_HEADER_NUM_QSS)
             else:
-                header.setStyleSheet("""
-                    QLabel {
-                        padding: 8px 4px;
-                        border-right: 1px solid #ccc;
-                        background-color: #f0f0f0;
-                    }
-                    QLabel:hover {
-                        background-color: #e0e0e0;
-                        cursor: pointer;
-                    }
-                """)
+                header.setStyleSheet(_HEADER_DRAG_QSS)
             # Set helpful tooltips
             if text == "#":
                 header.setToolTip("Track order - fixed position, use ⋮ handles to resize")
             else:
                 header.setToolTip("Column header - drag to move, use ⋮ handles to resize")
             
-            # Enable drag functionality
+            # Enable drag functionality through the shared event filter
             header.setProperty("draggable", True)
-            header.mousePressEvent = lambda event, h=header: self._header_mouse_press(event, h)
-            header.mouseMoveEvent = lambda event, h=header: self._header_mouse_move(event, h)
-            header.mouseReleaseEvent = lambda event, h=header: self._header_mouse_release(event, h)
+            header.installEventFilter(self._header_filter)
         except Exception:
             pass
         return header
@@ -1652,93 +2942,124 @@ class NavidromeBrowserDialog(QDialog):
         """Handle resize handle mouse press."""
         try:
             if event.button() == Qt.LeftButton:  # type: ignore
-                # Find which column this handle belongs to
-                for i, header in enumerate(self.column_headers):
-                    if hasattr(header, '_resize_handle') and header._resize_handle == handle:
-                        self._resizing_header = header
-                        self._resize_start_pos = event.globalPos()
-                        self._original_width = header.width()
-                        self._is_resizing = True
-                        handle.setStyleSheet("""
-                            QLabel {
-                                background-color: #1976D2;
-                                color: white;
-                                border-left: 1px solid #0D47A1;
-                                border-right: 1px solid #0D47A1;
-                                font-weight: bold;
-                                font-size: 12px;
-                            }
-                        """)
-                        break
+                # O(1) owning-header lookup instead of scanning column_headers
+                header = self._handle_to_header.get(id(handle))
+                if header is not None:
+                    self._resizing_header = header
+                    # Resolve the config column once; the per-frame apply
+                    # path then skips both index lookups entirely
+                    header_index = self._header_index.get(id(header))
+                    if header_index is None:
+                        header_index = self.column_headers.index(header)
+                    self._resizing_col_index = self.column_order[header_index]
+                    self._resize_start_pos = event.globalPos()
+                    self._original_width = header.width()
+                    self._last_applied_width = None
+                    self._is_resizing = True
+                    _set_handle_state(handle, "active")
         except Exception:
             pass
 
     def _handle_resize_move(self, event, handle) -> None:
-        """Handle resize handle mouse move."""
+        """Handle resize handle mouse move (coalesced through a timer)."""
+        try:
+            if self._is_resizing and self._resizing_header is not None and self._resize_start_pos is not None:
+                # Record only the latest position; the 16 ms single-shot
+                # timer applies it, capping resize work at ~60 fps while
+                # the mouse can move far more often
+                self._pending_resize = (handle, event.globalPos().x())
+                if self._resize_timer is not None:
+                    if not self._resize_timer.isActive():
+                        self._resize_timer.start()
+                else:
+                    self._apply_pending_resize()
+        except Exception:
+            pass
+
+    def _apply_pending_resize(self) -> None:
+        """Apply the most recent resize-drag position recorded by the handler."""
         try:
-            if hasattr(self, '_is_resizing') and getattr(self, '_is_resizing', False):
-                if hasattr(self, '_resizing_header') and hasattr(self, '_resize_start_pos'):
-                    current_pos = event.globalPos()
-                    delta = current_pos.x() - self._resize_start_pos.x()
-                    new_width = max(60, self._original_width + delta)  # Minimum width of 60px
-                    
-                    self._resizing_header.setFixedWidth(new_width)
-                    # Update the column config
-                    header_index = self.column_headers.index(self._resizing_header)
-                    col_index = self.column_order[header_index]
-                    self.column_config[col_index][1] = new_width
-                    # Show visual feedback
-                    handle.setToolTip(f"↔ Width: {new_width}px")
-                    # Re-apply header widths to account for handle size
-                    try:
-                        self._apply_header_widths()
-                    except Exception:
-                        pass
+            pending = self._pending_resize
+            if pending is None or not self._is_resizing:
+                return
+            if self._resizing_header is None or self._resize_start_pos is None:
+                return
+            self._pending_resize = None
+            handle, global_x = pending
+            delta = global_x - self._resize_start_pos.x()
+            new_width = max(60, self._original_width + delta)  # Minimum width of 60px
+            if new_width == self._last_applied_width:
+                # Same width as the last applied frame: skip the relayout
+                return
+            self._last_applied_width = new_width
+
+            self._resizing_header.setFixedWidth(new_width)
+            # Update the column config via the index stored at press time
+            col_index = self._resizing_col_index
+            if col_index < 0:
+                col_index = self.column_order[self.column_headers.index(self._resizing_header)]
+            self.column_config[col_index][1] = new_width
+            # Show visual feedback
+            handle.setToolTip(f"↔ Width: {new_width}px")
+            # Re-apply header widths to account for handle size
+            self._schedule_header_layout(self._LAYOUT_WIDTHS)
         except Exception:
             pass
 
     def _handle_resize_release(self, event, handle) -> None:
         """Handle resize handle mouse release."""
         try:
-            if hasattr(self, '_is_resizing'):
-                self._is_resizing = False
-                delattr(self, '_is_resizing')
-                # Refresh the display after resizing
-                current_row = self.playlists_list.currentRow()
-                if current_row >= 0:
-                    self._on_playlist_selected(current_row)
-                # Ensure header widths align including handles
+            if self._is_resizing:
+                # Flush whatever position is still waiting on the timer
                 try:
-                    self._apply_header_widths()
-                    self._refresh_header_handles()
+                    self._apply_pending_resize()
+                    if self._resize_timer is not None:
+                        self._resize_timer.stop()
+                    self._pending_resize = None
                 except Exception:
                     pass
+                self._is_resizing = False
+                # A resize is purely visual: re-width the existing row labels
+                # instead of refetching the playlist and rebuilding every row
+                self._apply_row_widths()
+                # Ensure header widths align including handles
+                self._schedule_header_layout(self._LAYOUT_WIDTHS | self._LAYOUT_HANDLES)
                 # Reset handle styling
-                handle.setStyleSheet("""
-                    QLabel {
-                        background-color: #ddd;
-                        border-left: 1px solid #bbb;
-                        border-right: 1px solid #bbb;
-                        color: #666;
-                        font-weight: bold;
-                        font-size: 12px;
-                    }
-                    QLabel:hover {
-                        background-color: #2196F3;
-                        color: white;
-                        border-left: 1px solid #1976D2;
-                        border-right: 1px solid #1976D2;
-                    }
-                """)
+                _set_handle_state(handle, "idle")
                 handle.setToolTip("↔ Drag to resize column")
                 
             # Clean up state
-            if hasattr(self, '_resizing_header'):
-                delattr(self, '_resizing_header')
-            if hasattr(self, '_resize_start_pos'):
-                delattr(self, '_resize_start_pos')
-            if hasattr(self, '_original_width'):
-                delattr(self, '_original_width')
+            self._resizing_header = None
+            self._resizing_col_index = -1
+            self._resize_start_pos = None
+            self._original_width = 0
+        except Exception:
+            pass
+
+    def _apply_row_widths(self) -> None:
+        """Resize existing track-row labels to the configured column widths."""
+        try:
+            widths = [self.column_config[col_idx][1] for col_idx in self.column_order]
+            try:
+                self.tracks_list.setUpdatesEnabled(False)
+            except Exception:
+                pass
+            try:
+                for row in range(self.tracks_list.count()):
+                    widget = self.tracks_list.itemWidget(self.tracks_list.item(row))
+                    labels = getattr(widget, '_column_labels', None)
+                    if not labels:
+                        continue
+                    for label, width in zip(labels, widths):
+                        try:
+                            label.setFixedWidth(width)
+                        except Exception:
+                            pass
+            finally:
+                try:
+                    self.tracks_list.setUpdatesEnabled(True)
+                except Exception:
+                    pass
         except Exception:
             pass
 
@@ -1765,33 +3086,63 @@ class NavidromeBrowserDialog(QDialog):
             self._original_cursor = header.cursor()
             header.setCursor(Qt.ClosedHandCursor)  # type: ignore
             self._is_dragging = True
+            self._refresh_drag_geometry()
         except Exception:
             pass
 
+    def _refresh_drag_geometry(self) -> None:
+        """Snapshot header centers/widths so drag moves stay in pure Python.
+
+        mapToGlobal/geometry are C++ round-trips; per mouse event times K
+        headers that adds up fast. The snapshot only changes on a swap, so
+        recompute it there and at drag start.
+        """
+        try:
+            geometry = []
+            for i, h in enumerate(self.column_headers):
+                rect = h.geometry()
+                center_x = h.mapToGlobal(rect.topLeft()).x() + rect.width() // 2
+                geometry.append((i, center_x, rect.width()))
+            self._drag_geometry = geometry
+            self._dragging_index = self._header_index.get(id(self._dragging_header), -1)
+        except Exception:
+            self._drag_geometry = []
+            self._dragging_index = -1
+
     def _header_mouse_move(self, event, header) -> None:
         """Handle header mouse move for dragging."""
         try:
-            if hasattr(self, '_is_dragging') and getattr(self, '_is_dragging', False):
-                # Handle column reordering with better detection
-                if hasattr(self, '_dragging_header'):
-                    current_pos = event.globalPos()
+            if self._is_dragging and self._dragging_header is not None:
+                # Handle column reordering against the cached geometry
+                mouse_x = event.globalPos().x()
+                current_index = self._dragging_index
+                if current_index < 0:
                     current_index = self.column_headers.index(self._dragging_header)
-                    
-                    # Find which header we're over by checking center points
-                    for i, other_header in enumerate(self.column_headers):
-                        if other_header != self._dragging_header and i > 0:  # Skip # column
-                            header_rect = other_header.geometry()
-                            header_global_rect = other_header.mapToGlobal(header_rect.topLeft())
-                            header_center_x = header_global_rect.x() + header_rect.width() // 2
-                            
-                            # Check if mouse is over the center area of another header
-                            if abs(current_pos.x() - header_center_x) < header_rect.width() // 3:
-                                if i != current_index:
-                                    self._swap_columns(current_index, i)
-                                    break
+
+                # Release the last-swap guard once the cursor has left that
+                # target's band; keeping it latched for the whole gesture
+                # would forbid swapping back after an overshoot
+                last = self._last_swap_target
+                if 0 <= last < len(self._drag_geometry):
+                    _, last_center, last_width = self._drag_geometry[last]
+                    if abs(mouse_x - last_center) >= last_width // 6:
+                        self._last_swap_target = -1
+
+                # Find which header we're over by checking center points.
+                # The narrow band plus the last-target check form a
+                # hysteresis so a cursor parked on a boundary cannot
+                # oscillate swaps on every event
+                for i, center_x, width in self._drag_geometry:
+                    if i > 0 and i != current_index:  # Skip # column and self
+                        if abs(mouse_x - center_x) < width // 6 and i != self._last_swap_target:
+                            self._last_swap_target = current_index
+                            self._swap_columns(current_index, i)
+                            break
             else:
                 # Show appropriate cursor when not dragging
-                header_index = self.column_headers.index(header)
+                header_index = self._header_index.get(id(header))
+                if header_index is None:
+                    header_index = self.column_headers.index(header)
                 col_index = self.column_order[header_index]
                 
                 # Show appropriate cursor based on whether column can be dragged
@@ -1806,16 +3157,15 @@ class NavidromeBrowserDialog(QDialog):
         """Handle header mouse release."""
         try:
             # Clean up dragging state
-            if hasattr(self, '_is_dragging'):
-                self._is_dragging = False
-                delattr(self, '_is_dragging')
-            if hasattr(self, '_dragging_header'):
-                delattr(self, '_dragging_header')
-            if hasattr(self, '_drag_start_pos'):
-                delattr(self, '_drag_start_pos')
-                
+            self._is_dragging = False
+            self._dragging_header = None
+            self._drag_start_pos = None
+            self._last_swap_target = -1
+
             # Reset cursor
-            header_index = self.column_headers.index(header)
+            header_index = self._header_index.get(id(header))
+            if header_index is None:
+                header_index = self.column_headers.index(header)
             col_index = self.column_order[header_index]
             if col_index == 0:  # # column
                 header.setCursor(Qt.ArrowCursor)  # type: ignore
@@ -1850,47 +3200,97 @@ class NavidromeBrowserDialog(QDialog):
             except Exception:
                 pass
 
-            # Fully rebuild the headers layout so handles stay attached to columns
+            # The full id->position rebuild lives in the deferred
+            # _refresh_header_handles pass; patch the two swapped entries
+            # now so _dragging_index never reads a stale slot mid-drag
             try:
-                while self.headers_layout.count():
-                    item = self.headers_layout.takeAt(0)
-                    try:
-                        w = item.widget()
-                        if w is not None:
-                            w.setParent(None)
-                    except Exception:
-                        pass
+                self._header_index[id(self.column_headers[from_index])] = from_index
+                self._header_index[id(self.column_headers[to_index])] = to_index
             except Exception:
                 pass
 
-            for container in self.column_containers:
-                self.headers_layout.addWidget(container)
+            # Move only the two affected containers; the rest of the layout
+            # (including the trailing stretch) stays untouched, so Qt
+            # invalidates O(1) items instead of rebuilding the whole row
             try:
-                self.headers_layout.addStretch(1)
+                c_from = self.column_containers[from_index]
+                c_to = self.column_containers[to_index]
+                self.headers_layout.removeWidget(c_from)
+                self.headers_layout.removeWidget(c_to)
+                lo, hi = (from_index, to_index) if from_index < to_index else (to_index, from_index)
+                self.headers_layout.insertWidget(lo, self.column_containers[lo])
+                self.headers_layout.insertWidget(hi, self.column_containers[hi])
             except Exception:
                 pass
 
             # Update header widths and handles visibility after reordering
+            self._schedule_header_layout(self._LAYOUT_WIDTHS | self._LAYOUT_HANDLES)
+            # The geometry snapshot is stale once columns moved, but the
+            # widgets only reach their new positions after the layout
+            # re-activates. Drop the snapshot now (no band tests fire on
+            # an empty list) and rebuild it after the deferred width pass;
+            # _dragging_index comes straight from the patched map so the
+            # interim events still know which column is in hand.
+            if self._is_dragging:
+                self._drag_geometry = []
+                self._dragging_index = self._header_index.get(id(self._dragging_header), -1)
+                try:
+                    QTimer.singleShot(0, self._refresh_drag_geometry)
+                except Exception:
+                    self._refresh_drag_geometry()
+
+
+            # Rearrange the labels already on screen; no refetch, no rebuild
+            self._reorder_row_labels(from_index, to_index)
+
+        except Exception:
+            pass
+
+    def _reorder_row_labels(self, from_index: int, to_index: int) -> None:
+        """Mirror a header swap onto every track row's label layout."""
+        try:
+            lo, hi = (from_index, to_index) if from_index < to_index else (to_index, from_index)
             try:
-                self._apply_header_widths()
-                self._refresh_header_handles()
+                self.tracks_list.setUpdatesEnabled(False)
             except Exception:
                 pass
-                
-            # Refresh the track display
-            current_row = self.playlists_list.currentRow()
-            if current_row >= 0:
-                self._on_playlist_selected(current_row)
-                
+            try:
+                for row in range(self.tracks_list.count()):
+                    widget = self.tracks_list.itemWidget(self.tracks_list.item(row))
+                    labels = getattr(widget, '_column_labels', None)
+                    if not labels or hi >= len(labels):
+                        continue
+                    layout = widget.layout()
+                    labels[lo], labels[hi] = labels[hi], labels[lo]
+                    try:
+                        layout.removeWidget(labels[lo])
+                        layout.removeWidget(labels[hi])
+                        layout.insertWidget(lo, labels[lo])
+                        layout.insertWidget(hi, labels[hi])
+                    except Exception:
+                        pass
+            finally:
+                try:
+                    self.tracks_list.setUpdatesEnabled(True)
+                except Exception:
+                    pass
         except Exception:
             pass
 
-    def _on_playlist_selected(self, row: int) -> None:
-        self.tracks_list.clear()  # Clear list widget
-        self._current_playlist_tracks = []
+    def _on_playlist_selected(self, row: int, force: bool = False) -> None:
+        # Push any reordered-but-unsaved order before the list is replaced
+        try:
+            if self._order_flush_timer is not None:
+                self._order_flush_timer.stop()
+            self._flush_track_order()
+        except Exception:
+            pass
         if row < 0 or row >= len(getattr(self, "_playlists", [])):
             # Clear when no playlist is selected
-            self._newly_added_track_ids = set()
+            self.tracks_list.clear()
+            self._current_playlist_tracks = []
+            self._current_playlist_track_ids = []
+            self._newly_added_track_ids.clear()
             self._last_selected_playlist_id = ""
             try:
                 self.owner_label.setText("<b>Owner:</b> ")
@@ -1909,10 +3309,18 @@ class NavidromeBrowserDialog(QDialog):
             return
         pl = self._playlists[row]
         playlist_id = str(pl.get("id", ""))
-        
+
+        # Stray re-selects (focus churn, clicking the already-active row) are
+        # no-ops once the same playlist is fully populated; mutation flows
+        # pass force=True to reload regardless
+        if (not force and playlist_id
+                and playlist_id == self._last_selected_playlist_id
+                and self.tracks_list.count() == len(self._current_playlist_tracks)):
+            return
+
         # Clear green highlighting when switching to a different playlist
         if playlist_id != self._last_selected_playlist_id and self._last_selected_playlist_id != "":
-            self._newly_added_track_ids = set()
+            self._newly_added_track_ids.clear()
         self._last_selected_playlist_id = playlist_id
         
         try:
@@ -1924,13 +3332,101 @@ class NavidromeBrowserDialog(QDialog):
         self._refresh_public_checkbox()
         self._refresh_owner_label()
         self._update_modification_buttons_state()
+
+        # Fetch tracks off the GUI thread; a newer selection supersedes this one
+        self._tracks_request_id = playlist_id
+        pl_name = pl.get('name', '(unnamed)')
         try:
-            entries = self.client.get_playlist_tracks(playlist_id)
-        except Exception as exc:
-            QMessageBox.critical(self, "Navidrome", f"Failed to load tracks: {exc}")
-            return
+            self.info_label.setText("Loading tracks…")
+        except Exception:
+            pass
+
+        def _on_tracks(entries, pid=playlist_id, name=pl_name):
+            if pid != getattr(self, "_tracks_request_id", None):
+                return
+            self._populate_tracks(list(entries or []))
+            try:
+                self._update_editing_label(name)
+            except Exception:
+                pass
+
+        def _on_tracks_failed(msg, pid=playlist_id, name=pl_name):
+            if pid != getattr(self, "_tracks_request_id", None):
+                return
+            # Don't leave the label stuck on "Loading tracks…"
+            try:
+                self._update_editing_label(name)
+            except Exception:
+                pass
+            QMessageBox.critical(self, "Navidrome", f"Failed to load tracks: {msg}")
+
+        _run_network_job(
+            lambda: self.client.get_playlist_tracks(playlist_id),
+            _on_tracks,
+            _on_tracks_failed,
+        )
+
+    def _populate_tracks(self, entries: List[Dict]) -> None:
+        """Fill the tracks list in one batch with repaints suspended.
+
+        Existing rows are updated in place rather than destroyed: each row
+        costs one QWidget, one QHBoxLayout and K QLabels, so switching
+        between large playlists reuses those QObjects and only pays for
+        setText calls plus whatever rows the longer list needs on top.
+        """
+        self._current_playlist_tracks = []
+        self._current_playlist_track_ids = []
+        try:
+            self.tracks_list.setUpdatesEnabled(False)
+            self.tracks_list.blockSignals(True)
+        except Exception:
+            pass
+        # Rows share one layout pass: the first row's size hint fits them all
+        shared_hint = None
+        # Hoist per-track attribute lookups out of the loop
+        column_order = self.column_order
+        column_config = self.column_config
+        newly_added = self._newly_added_track_ids
+
+        # One bold font for every # label instead of a copy per row
+        num_font = None
+        try:
+            num_font = self.font()
+            num_font.setBold(True)
+            try:
+                num_font.setPointSize(num_font.pointSize() + 1)
+            except Exception:
+                pass
+        except Exception:
+            num_font = None
 
         # Populate list widget with track data (same as Review Selected Tracks)
+        try:
+            self._populate_tracks_loop(entries, column_order, column_config, newly_added, num_font, shared_hint)
+        finally:
+            try:
+                self.tracks_list.blockSignals(False)
+                self.tracks_list.setUpdatesEnabled(True)
+                self.tracks_list.viewport().update()
+            except Exception:
+                pass
+
+        # Renumber the tracks
+        self._renumber_tracks()
+
+    def _populate_tracks_loop(self, entries, column_order, column_config, newly_added, num_font, shared_hint) -> None:
+        # Per-row constants hoisted out of the N*K label loop
+        align_num = Qt.AlignCenter | Qt.AlignVCenter  # type: ignore
+        align_txt = Qt.AlignLeft | Qt.AlignVCenter  # type: ignore
+        user_role = Qt.UserRole
+        has_new = bool(newly_added)  # usually empty; skip per-row membership tests
+        col_specs = [(column_config[ci][0], column_config[ci][1]) for ci in column_order]
+        # Drop surplus rows from a previously shown longer playlist
+        try:
+            while self.tracks_list.count() > len(entries):
+                self.tracks_list.takeItem(self.tracks_list.count() - 1)
+        except Exception:
+            pass
         for i, e in enumerate(entries):
             track_id = str(e.get("id", ""))
             title = e.get("title", "")
@@ -1940,18 +3436,62 @@ class NavidromeBrowserDialog(QDialog):
             
             # Store track data
             self._current_playlist_tracks.append(e)
+            self._current_playlist_track_ids.append(track_id)
 
-            # Extract filename from path
-            filename = e.get("path", "").split("/")[-1] if e.get("path") else ""
+            # Extract filename from path; rpartition skips the list a split
+            # would build, and `or ""` also covers an explicit null path
+            filename = (e.get("path") or "").rpartition("/")[2]
             if filename:
                 # Remove common prefixes like "04 - ", "001.", "Track 01 -", etc.
-                filename = re.sub(r'^(\d+[-\.\s]*\d*[-\.\s]*[-\s]+|Track\s+\d+\s*[-\.\s]*)', '', filename, flags=re.IGNORECASE)
+                filename = _TRACKNO_PREFIX_RE.sub('', filename)
                 filename = filename.strip(' -.')
 
             try:
+                # Collect all track data (≡ only in # column)
+                track_data = {
+                    "#": f"≡ {i+1}",
+                    "Songname": title or "Unknown Songname",
+                    "Artist": artist or "Unknown Artist",
+                    "Album": album or "Unknown Album",
+                    "Genre": genre or "Unknown Genre",
+                    "Filename": filename or "Unknown File"
+                }
+
+                # Reuse the row widget already at this position when its
+                # label layout matches the current column setup
+                reused = self.tracks_list.item(i)
+                if reused is not None:
+                    widget = self.tracks_list.itemWidget(reused)
+                    labels = getattr(widget, '_column_labels', None)
+                    if labels is not None and len(labels) == len(column_order):
+                        try:
+                            reused.setData(user_role, track_id)  # type: ignore
+                        except Exception:
+                            pass
+                        for label, (col_name, _w) in zip(labels, col_specs):
+                            try:
+                                label.setText(str(track_data[col_name]))
+                            except Exception:
+                                pass
+                        try:
+                            # Only touch the stylesheet when the highlight
+                            # actually changes; a same-value set still
+                            # forces Qt to re-polish the row's subtree
+                            qss = _ROW_HIGHLIGHT_QSS if (has_new and track_id in newly_added) else ""
+                            if widget.styleSheet() != qss:
+                                widget.setStyleSheet(qss)
+                        except Exception:
+                            pass
+                        continue
+                    # Unusable leftover row: replace it with a fresh one
+                    try:
+                        self.tracks_list.takeItem(i)
+                    except Exception:
+                        pass
+
                 item = QListWidgetItem()
                 try:
-                    item.setData(Qt.UserRole, track_id)  # type: ignore
+                    item.setData(user_role, track_id)  # type: ignore
                 except Exception:
                     pass
                 try:
@@ -1969,50 +3509,20 @@ class NavidromeBrowserDialog(QDialog):
                 except Exception:
                     pass
                 
-                # Collect all track data (≡ only in # column)
-                track_data = {
-                    "#": f"≡ {i+1}",
-                    "Songname": title or "Unknown Songname",
-                    "Artist": artist or "Unknown Artist",
-                    "Album": album or "Unknown Album", 
-                    "Genre": genre or "Unknown Genre",
-                    "Filename": filename or "Unknown File"
-                }
-                
                 # Create labels in the order specified by column_order
                 labels = []
-                column_x = 0
-                for col_idx in self.column_order:
-                    col_name = self.column_config[col_idx][0]
-                    col_width = self.column_config[col_idx][1]
-                    stretch = self.column_config[col_idx][2]
-                    
+                for col_name, col_width in col_specs:
                     label = QLabel(str(track_data[col_name]), row_w)
                     try:
                         label.setFixedWidth(col_width)
                         if col_name == "#":
-                            label.setAlignment(Qt.AlignCenter | Qt.AlignVCenter)  # type: ignore
-                            font = label.font()
-                            font.setBold(True)
-                            try:
-                                font.setPointSize(font.pointSize() + 1)
-                            except Exception:
-                                pass
-                            label.setFont(font)
-                            label.setStyleSheet(
-                                "background-color: #f2f2f2;"
-                                "border: 1px solid #d0d0d0;"
-                                "border-radius: 4px;"
-                                "color: #555;"
-                                "font-weight: bold;"
-                                "padding: 2px 6px;"
-                            )
+                            label.setAlignment(align_num)
+                            if num_font is not None:
+                                label.setFont(num_font)
+                            label.setStyleSheet(_TRACK_NUM_QSS)
                         else:
-                            label.setAlignment(Qt.AlignLeft | Qt.AlignVCenter)  # type: ignore
-                            font = label.font()
-                            font.setPointSize(font.pointSize())
-                            label.setFont(font)
-                            label.setStyleSheet("padding: 2px 4px;")
+                            label.setAlignment(align_txt)
+                            label.setStyleSheet(_TRACK_TEXT_QSS)
                         if col_name == "#":
                             label.setToolTip("Drag to reorder tracks")
                             label.setCursor(Qt.OpenHandCursor)  # type: ignore
@@ -2023,11 +3533,6 @@ class NavidromeBrowserDialog(QDialog):
                     
                     labels.append(label)
                     h.addWidget(label)
-                    # Keep track of cumulative x if needed for pixel-perfect alignment later
-                    try:
-                        column_x += int(col_width)
-                    except Exception:
-                        pass
                 try:
                     h.addStretch(1)
                 except Exception:
@@ -2036,40 +3541,39 @@ class NavidromeBrowserDialog(QDialog):
                 # Store labels for renumbering
                 try:
                     row_w._column_labels = labels  # type: ignore[attr-defined]
-                    row_w._num_label = labels[self.column_order.index(0)] if 0 in self.column_order else None  # type: ignore[attr-defined]
+                    row_w._num_label = labels[column_order.index(0)] if 0 in column_order else None  # type: ignore[attr-defined]
                 except Exception:
                     pass
 
-                self.tracks_list.addItem(item)
+                self.tracks_list.insertItem(i, item)
                 try:
-                    item.setSizeHint(row_w.sizeHint())
+                    if shared_hint is None:
+                        shared_hint = row_w.sizeHint()
+                    item.setSizeHint(shared_hint)
                 except Exception:
                     pass
                 self.tracks_list.setItemWidget(item, row_w)
                 
                 # Highlight newly added tracks in green
-                if track_id in self._newly_added_track_ids:
+                if has_new and track_id in newly_added:
                     try:
-                        row_w.setStyleSheet("background-color: #c8e6c9;")  # Light green background
+                        row_w.setStyleSheet(_ROW_HIGHLIGHT_QSS)
                     except Exception:
                         pass
-                
-                # Make widgets transparent for mouse events (except drag handles)
+
+                # Make the row transparent for mouse events; Qt's hit test
+                # skips a transparent widget's whole subtree, so the K
+                # per-label attribute writes were redundant
                 try:
                     row_w.setAttribute(Qt.WA_TransparentForMouseEvents, True)  # type: ignore
-                    for label in labels:
-                        label.setAttribute(Qt.WA_TransparentForMouseEvents, True)  # type: ignore
                 except Exception:
                     pass
-                    
+
             except Exception:
                 pass
-                
-        # Renumber the tracks
-        self._renumber_tracks()
 
     def _current_playlist(self) -> Tuple[int, Dict]:
-        row = self.playlists_list.currentRow()
+        row = self._playlists_current_row()
         if row < 0 or row >= len(getattr(self, "_playlists", [])):
             return -1, {}
         return row, self._playlists[row]
@@ -2110,16 +3614,27 @@ class NavidromeBrowserDialog(QDialog):
                 pass
 
     def _is_current_user_owner(self) -> bool:
-        """Check if the current user owns the selected playlist."""
+        """Check if the current user owns the selected playlist.
+
+        The verdict is cached per playlist id — three handlers consult it on
+        every click — and the cache resets whenever the playlists reload.
+        """
         idx, pl = self._current_playlist()
         if idx < 0:
             return False
+        pl_id = str(pl.get("id", ""))
+        cached = self._owner_cache.get(pl_id)
+        if cached is not None:
+            return cached
         try:
             owner = pl.get("owner", "")
             current_user = self.client.username
-            return str(owner).lower() == str(current_user).lower()
+            result = str(owner).lower() == str(current_user).lower()
         except Exception:
-            return False
+            result = False
+        if pl_id:
+            self._owner_cache[pl_id] = result
+        return result
 
     def _update_modification_buttons_state(self) -> None:
         """Enable/disable modification buttons based on playlist ownership."""
@@ -2174,13 +3689,14 @@ class NavidromeBrowserDialog(QDialog):
         if not new_name or new_name == cur_name:
             return
         try:
-            self.client.update_playlist(playlist_id, name=new_name)
+            with self.client.playlist_transaction(playlist_id) as tx:
+                tx.rename(new_name)
         except Exception as exc:
             QMessageBox.critical(self, "Navidrome", f"Failed to rename playlist: {exc}")
             return
         self._playlists[idx]["name"] = new_name
         try:
-            self.playlists_list.item(idx).setText(new_name)
+            self._playlists_model.setData(self._playlists_model.index(idx), new_name)
         except Exception:
             pass
         self.info_label.setText(f"Renamed to: {new_name}")
@@ -2208,7 +3724,7 @@ class NavidromeBrowserDialog(QDialog):
             QMessageBox.critical(self, "Navidrome", f"Failed to delete playlist: {exc}")
             return
         try:
-            self.playlists_list.takeItem(idx)
+            self._playlists_model.removeRow(idx)
         except Exception:
             pass
         try:
@@ -2252,9 +3768,14 @@ class NavidromeBrowserDialog(QDialog):
 
     def _renumber_tracks(self) -> None:
         """Renumber track order labels after reordering (for list widget)."""
+        # Suspend painting so N label updates collapse into one repaint
         try:
-            for i in range(self.tracks_list.count()):
-                item = self.tracks_list.item(i)
+            self.tracks_list.setUpdatesEnabled(False)
+        except Exception:
+            pass
+        try:
+            for i in range(self.tracks_list.count()):
+                item = self.tracks_list.item(i)
                 if item is None:
                     continue
                 widget = self.tracks_list.itemWidget(item)
@@ -2269,13 +3790,34 @@ class NavidromeBrowserDialog(QDialog):
                     pass
         except Exception:
             pass
+        finally:
+            try:
+                self.tracks_list.setUpdatesEnabled(True)
+            except Exception:
+                pass
+
+    def _collect_track_ids(self, skip_row: Optional[int] = None) -> List[str]:
+        """Collect track ids from the list in display order in a single pass."""
+        track_ids: List[str] = []
+        for i in range(self.tracks_list.count()):
+            if skip_row is not None and i == skip_row:
+                continue
+            item = self.tracks_list.item(i)
+            if item is None:
+                continue
+            try:
+                track_id = str(item.data(Qt.UserRole))  # type: ignore
+                if track_id:
+                    track_ids.append(track_id)
+            except Exception:
+                continue
+        return track_ids
 
     def _randomize_tracks(self) -> None:
         """Shuffle the track order randomly and save to Navidrome."""
         # Clear green highlighting when user randomizes tracks
-        self._newly_added_track_ids = set()
-        
-        import random
+        self._newly_added_track_ids.clear()
+
         idx, pl = self._current_playlist()
         if idx < 0:
             return
@@ -2286,18 +3828,9 @@ class NavidromeBrowserDialog(QDialog):
             return
 
         try:
-            # Get current track order
-            track_ids = []
-            for i in range(self.tracks_list.count()):
-                item = self.tracks_list.item(i)  # Get list item which contains track ID
-                if item is None:
-                    continue
-                try:
-                    track_id = str(item.data(Qt.UserRole))  # type: ignore
-                    if track_id:
-                        track_ids.append(track_id)
-                except Exception:
-                    continue
+            # Order is irrelevant for a shuffle, so the stored id list beats
+            # walking the QListWidget through the binding layer
+            track_ids = list(self._current_playlist_track_ids) or self._collect_track_ids()
 
             if not track_ids:
                 return
@@ -2305,24 +3838,17 @@ class NavidromeBrowserDialog(QDialog):
             # Shuffle the track IDs
             random.shuffle(track_ids)
 
-            # Update playlist on server
+            # Replace the order in place; the playlist id stays stable
             playlist_id = str(pl.get("id", ""))
             try:
-                # Delete current playlist
-                self.client.delete_playlist(playlist_id)
-                # Recreate with shuffled order
-                new_name = pl.get("name", "Shuffled Playlist")
-                new_pl_id = self.client.create_playlist(new_name, track_ids)
-                if new_pl_id:
-                    # Update our local data
-                    self._playlists[idx]["id"] = new_pl_id
-                    # Reload tracks to reflect new order
-                    self._on_playlist_selected(idx)
-                    self.info_label.setText("Tracks shuffled successfully!")
-                    try:
-                        self.info_label.setStyleSheet("color: #2e7d32; font-size: 14px; font-weight: bold;")
-                    except Exception:
-                        pass
+                self.client.replace_playlist_tracks(playlist_id, track_ids)
+                # Reload tracks to reflect new order
+                self._on_playlist_selected(idx, force=True)
+                self.info_label.setText("Tracks shuffled successfully!")
+                try:
+                    self.info_label.setStyleSheet("color: #2e7d32; font-size: 14px; font-weight: bold;")
+                except Exception:
+                    pass
             except Exception as exc:
                 QMessageBox.critical(self, "Navidrome", f"Failed to shuffle tracks: {exc}")
         except Exception:
@@ -2331,7 +3857,7 @@ class NavidromeBrowserDialog(QDialog):
     def _remove_selected_track(self) -> None:
         """Remove the selected track from the playlist."""
         # Clear green highlighting when user removes a track
-        self._newly_added_track_ids = set()
+        self._newly_added_track_ids.clear()
         
         idx, pl = self._current_playlist()
         if idx < 0:
@@ -2348,35 +3874,17 @@ class NavidromeBrowserDialog(QDialog):
             return
 
         try:
-            # Get all track IDs except the selected one
-            track_ids = []
-            for i in range(self.tracks_list.count()):
-                if i == current_row:
-                    continue  # Skip the selected track
-                item = self.tracks_list.item(i)  # Get list item which contains track ID
-                if item is None:
-                    continue
-                try:
-                    track_id = str(item.data(Qt.UserRole))  # type: ignore
-                    if track_id:
-                        track_ids.append(track_id)
-                except Exception:
-                    continue
-
-            # Update playlist on server
+            # One O(1) server call: drop just the selected index
             playlist_id = str(pl.get("id", ""))
             try:
-                # Delete current playlist
-                self.client.delete_playlist(playlist_id)
-                # Recreate without the removed track
-                new_name = pl.get("name", "Updated Playlist")
-                new_pl_id = self.client.create_playlist(new_name, track_ids)
-                if new_pl_id:
-                    # Update our local data
-                    self._playlists[idx]["id"] = new_pl_id
-                    # Reload tracks to reflect removal
-                    self._on_playlist_selected(idx)
-                    self.info_label.setText("Track removed successfully!")
+                self.client.update_playlist(playlist_id, song_indices_to_remove=[current_row])
+                try:
+                    del self._current_playlist_track_ids[current_row]
+                except Exception:
+                    pass
+                # Reload tracks to reflect removal
+                self._on_playlist_selected(idx, force=True)
+                self.info_label.setText("Track removed successfully!")
             except Exception as exc:
                 QMessageBox.critical(self, "Navidrome", f"Failed to remove track: {exc}")
         except Exception:
@@ -2397,109 +3905,152 @@ class NavidromeBrowserDialog(QDialog):
         # Open the library dialog for adding songs
         try:
             dialog = NavidromeLibraryDialogForAddingSongs(self, self.client)
-            if dialog.exec_() == QDialog.Accepted:
+            if _exec_dialog(dialog) == QDialog.Accepted:
                 new_track_ids = dialog.selected_track_ids
                 if not new_track_ids:
                     return
                 
-                # Get current track IDs
-                current_track_ids = []
-                for i in range(self.tracks_list.count()):
-                    item = self.tracks_list.item(i)
-                    if item is None:
-                        continue
-                    try:
-                        track_id = str(item.data(Qt.UserRole))  # type: ignore
-                        if track_id:
-                            current_track_ids.append(track_id)
-                    except Exception:
-                        continue
-                
-                # Combine existing tracks with new ones
-                all_track_ids = current_track_ids + new_track_ids
-                
-                # Update playlist on server
+                # Append server-side; existing tracks never leave the playlist
                 playlist_id = str(pl.get("id", ""))
                 try:
-                    # Delete current playlist
-                    self.client.delete_playlist(playlist_id)
-                    # Recreate with all tracks
-                    new_name = pl.get("name", "Updated Playlist")
-                    new_pl_id = self.client.create_playlist(new_name, all_track_ids)
-                    if new_pl_id:
-                        # Update our local data
-                        self._playlists[idx]["id"] = new_pl_id
-                        
-                        # Store newly added track IDs for green highlighting AFTER updating playlist ID
-                        self._newly_added_track_ids = set(new_track_ids)
-                        
-                        # Update the last selected playlist ID to the NEW playlist ID
-                        # This prevents _on_playlist_selected from clearing the highlighting
-                        self._last_selected_playlist_id = new_pl_id
-                        
-                        # Reload tracks to reflect additions
-                        self._on_playlist_selected(idx)
-                        self.info_label.setText(f"Added {len(new_track_ids)} track(s) successfully!")
-                        try:
-                            self.info_label.setStyleSheet("color: #2e7d32; font-size: 14px; font-weight: bold;")
-                        except Exception:
-                            pass
+                    self._add_tracks_batched(playlist_id, new_track_ids)
+                    self._current_playlist_track_ids.extend(str(t) for t in new_track_ids)
+
+                    # Store newly added track IDs for green highlighting
+                    self._newly_added_track_ids = set(new_track_ids)
+
+                    # Reload tracks to reflect additions
+                    self._on_playlist_selected(idx, force=True)
+                    self.info_label.setText(f"Added {len(new_track_ids)} track(s) successfully!")
+                    try:
+                        self.info_label.setStyleSheet("color: #2e7d32; font-size: 14px; font-weight: bold;")
+                    except Exception:
+                        pass
                 except Exception as exc:
                     QMessageBox.critical(self, "Navidrome", f"Failed to add tracks: {exc}")
         except Exception as exc:
             QMessageBox.critical(self, "Navidrome", f"Failed to open library dialog: {exc}")
 
-    def _on_tracks_reordered(self) -> None:
-        """Handle track reordering via drag and drop."""
+    # Keep request bodies bounded when appending very large selections
+    ADD_BATCH_SIZE = 500
+
+    def _add_tracks_batched(self, playlist_id: str, track_ids: List[str]) -> None:
+        """Append tracks in order-preserving batches of ADD_BATCH_SIZE.
+
+        Batches go out sequentially because updatePlaylist appends in
+        request order — concurrent chunks would interleave and scramble the
+        playlist. A progress dialog covers the multi-batch case.
+        """
+        if len(track_ids) <= self.ADD_BATCH_SIZE:
+            self.client.update_playlist(playlist_id, song_ids_to_add=track_ids)
+            return
+        batches = [
+            track_ids[i:i + self.ADD_BATCH_SIZE]
+            for i in range(0, len(track_ids), self.ADD_BATCH_SIZE)
+        ]
+        progress = None
+        try:
+            progress = NavidromeFetchProgressDialog(self)
+            progress.setWindowTitle("Adding tracks…")
+            progress.set_total(len(track_ids))
+            progress.show()
+        except Exception:
+            progress = None
+        try:
+            sent = 0
+            for batch in batches:
+                # Check for cancellation before each request, not after it
+                if progress is not None and progress.cancelled():
+                    break
+                self.client.update_playlist(playlist_id, song_ids_to_add=batch)
+                sent += len(batch)
+                if progress is not None:
+                    try:
+                        progress.set_value(sent)
+                        progress.set_status(f"Added {sent} of {len(track_ids)} tracks…")
+                        QApplication.processEvents()
+                    except Exception:
+                        pass
+        finally:
+            if progress is not None:
+                try:
+                    progress.close()
+                except Exception:
+                    pass
+
+    def _on_tracks_reordered(self, _parent=None, start=-1, end=-1, _dest=None, dest_row=-1) -> None:
+        """Handle track reordering via drag and drop; the server flush is debounced.
+
+        rowsMoved's source/destination indices let the Python-side id list
+        mirror the move in O(block) instead of re-walking every
+        QListWidgetItem through the binding layer.
+        """
         # Clear green highlighting when user reorders tracks
-        self._newly_added_track_ids = set()
-        
+        self._newly_added_track_ids.clear()
+
+        # Mirror the move onto the authoritative id list
+        ids = self._current_playlist_track_ids
+        try:
+            if 0 <= start <= end < len(ids) and dest_row >= 0:
+                block = ids[start:end + 1]
+                del ids[start:end + 1]
+                insert_at = dest_row - len(block) if dest_row > start else dest_row
+                ids[insert_at:insert_at] = block
+            else:
+                # Signal arrived without usable indices: fall back to a sweep
+                self._current_playlist_track_ids = self._collect_track_ids()
+        except Exception:
+            self._current_playlist_track_ids = self._collect_track_ids()
+
         idx, pl = self._current_playlist()
         if idx < 0:
             return
-        
+
         # Safety check: only allow owner to reorder tracks
         if not self._is_current_user_owner():
             QMessageBox.warning(self, "Navidrome", "Only the playlist owner can reorder tracks.")
             # Reload the playlist to restore original order
-            self._on_playlist_selected(self.playlists_list.currentRow())
+            self._on_playlist_selected(self._playlists_current_row(), force=True)
             return
 
+        # Renumber immediately for feedback; the network push waits until the
+        # drags settle so several quick moves become one request
+        self._renumber_tracks()
+        self._order_dirty = True
+        self._order_playlist = (idx, str(pl.get("id", "")), pl.get("name", "Reordered Playlist"))
         try:
-            # Get new track order after drag/drop
-            track_ids = []
-            for i in range(self.tracks_list.count()):
-                item = self.tracks_list.item(i)  # Get list item which contains track ID
-                if item is None:
-                    continue
-                try:
-                    track_id = str(item.data(Qt.UserRole))  # type: ignore
-                    if track_id:
-                        track_ids.append(track_id)
-                except Exception:
-                    continue
+            if self._order_flush_timer is not None:
+                self._order_flush_timer.start()
+                return
+        except Exception:
+            pass
+        self._flush_track_order()
+
+    def _flush_track_order(self) -> None:
+        """Push the currently displayed track order for the reordered playlist."""
+        if not getattr(self, "_order_dirty", False):
+            return
+        self._order_dirty = False
+        idx, playlist_id, name = self._order_playlist
+        self._order_playlist = (-1, "", "")
+        if idx < 0 or not playlist_id:
+            return
+
+        try:
+            # The id list already reflects every drag in display order
+            track_ids = list(self._current_playlist_track_ids) or self._collect_track_ids()
 
             if not track_ids:
                 return
 
-            # Update playlist on server with new order
-            playlist_id = str(pl.get("id", ""))
+            # Replace the order on the server in one request; no recreate
             try:
-                # Delete current playlist
-                self.client.delete_playlist(playlist_id)
-                # Recreate with new order
-                new_name = pl.get("name", "Reordered Playlist")
-                new_pl_id = self.client.create_playlist(new_name, track_ids)
-                if new_pl_id:
-                    # Update our local data
-                    self._playlists[idx]["id"] = new_pl_id
-                    # Renumber the tracks
-                    self._renumber_tracks()
-                    self.info_label.setText("Track order saved!")
-                    try:
-                        self.info_label.setStyleSheet("color: #2e7d32; font-size: 14px; font-weight: bold;")
-                    except Exception:
-                        pass
+                self.client.replace_playlist_tracks(playlist_id, track_ids)
+                self.info_label.setText("Track order saved!")
+                try:
+                    self.info_label.setStyleSheet("color: #2e7d32; font-size: 14px; font-weight: bold;")
+                except Exception:
+                    pass
             except Exception as exc:
                 QMessageBox.critical(self, "Navidrome", f"Failed to save track order: {exc}")
         except Exception:
@@ -2572,6 +4123,49 @@ class NavidromeFetchProgressDialog(QDialog):
             pass
 
 
+class SongColumns:
+    """Columnar store for loaded songs: one list per column plus song ids.
+
+    Keeps the table data as flat per-column string lists instead of per-cell
+    Qt item lookups, so filtering and id resolution never have to walk
+    QTableWidgetItems. Row indices are insertion order; the view stores the
+    index on each row to survive user sorting.
+    """
+
+    COLUMNS = ("filename", "title", "artist", "album", "year", "genre", "duration")
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.cols: Dict[str, List[str]] = {name: [] for name in self.COLUMNS}
+        self.search_index: List[str] = []  # lowercased row text for substring search
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, sid: str, values: Dict[str, str]) -> int:
+        """Append one song row; returns its store index."""
+        self.ids.append(sid)
+        parts = []
+        for name in self.COLUMNS:
+            v = str(values.get(name, "") or "")
+            self.cols[name].append(v)
+            parts.append(v.lower())
+        self.search_index.append(" ".join(parts))
+        return len(self.ids) - 1
+
+    def clear(self) -> None:
+        self.ids.clear()
+        for col in self.cols.values():
+            col.clear()
+        self.search_index.clear()
+
+
+# Weak reference to the most recently opened library dialog; lets the
+# create-playlist action reuse an open window without scanning every
+# top-level widget
+_last_library_dialog = None
+
+
 class NavidromeLibraryDialog(QDialog):
     # Column indices (checkbox embedded in Filename column)
     COL_FILENAME = 0
@@ -2582,8 +4176,13 @@ class NavidromeLibraryDialog(QDialog):
     COL_GENRE = 5
     COL_DURATION = 6
 
+    # Streaming loads flush fetched rows into the table in chunks this big
+    FLUSH_BATCH = 200
+
     def __init__(self, parent: Optional[QWidget], client: SubsonicClient) -> None:
         super().__init__(parent)
+        global _last_library_dialog
+        _last_library_dialog = weakref.ref(self)
         self.setWindowTitle("Select Tracks from Navidrome Library")
         self.client = client
         self._loading = False
@@ -2801,18 +4400,54 @@ class NavidromeLibraryDialog(QDialog):
         self.info_label = QLabel("", self)
         layout.addWidget(self.info_label)
 
+        # Debounce filtering so a typing burst runs one scan, not one per key
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(self._apply_filters)  # type: ignore[attr-defined]
+
         # Signals
         try:
-            self.search_bar.textChanged.connect(self._apply_filters)  # type: ignore[attr-defined]
-            self.table.itemSelectionChanged.connect(self._update_counts)  # type: ignore[attr-defined]
+            self.search_bar.textChanged.connect(lambda *_: self._filter_timer.start())  # type: ignore[attr-defined]
+            self.table.itemSelectionChanged.connect(self._schedule_count_update)  # type: ignore[attr-defined]
+            self.table.itemSelectionChanged.connect(self._refresh_selected_rows)  # type: ignore[attr-defined]
             self.table.cellClicked.connect(self._on_cell_clicked)  # type: ignore[attr-defined]
             self.table.itemChanged.connect(self._on_item_changed)  # type: ignore[attr-defined]
+            # Sorting reorders rows behind our backs; drop the positional
+            # id index and fall back to the per-item UserRole lookup
+            self.table.horizontalHeader().sortIndicatorChanged.connect(self._invalidate_row_ids)  # type: ignore[attr-defined]
+            # The checkbox hit-zone only moves when the header or the
+            # horizontal scroll does — no per-click visualItemRect needed
+            self.table.horizontalHeader().sectionResized.connect(self._refresh_filename_hitzone)  # type: ignore[attr-defined]
+            self.table.horizontalHeader().sectionMoved.connect(self._refresh_filename_hitzone)  # type: ignore[attr-defined]
+            self.table.horizontalScrollBar().valueChanged.connect(self._refresh_filename_hitzone)  # type: ignore[attr-defined]
         except Exception:
             pass
+        self._filename_hitzone_right = 24
+        self._refresh_filename_hitzone()
+        try:
+            self._table_viewport = self.table.viewport()
+        except Exception:
+            self._table_viewport = None
 
         self._songs: List[Dict] = []
+        self._columns = SongColumns()
         self._visible_rows: List[int] = []
-        self._checked_ids: Set[str] = set()
+        self._row_ids: List[str] = []  # positional id index, valid until a sort
+        self._hidden_mask = bytearray()  # per-row hidden bit, mirrors the view
+        self._last_filter_tokens: List[str] = []  # tokens of the last applied filter
+        # Absolute item flags, computed once instead of per cell during load
+        try:
+            self._item_flags_ro = Qt.ItemIsEnabled | Qt.ItemIsSelectable  # type: ignore
+            self._item_flags_chk = self._item_flags_ro | Qt.ItemIsUserCheckable  # type: ignore
+        except Exception:
+            self._item_flags_ro = None
+            self._item_flags_chk = None
+        # Insertion-ordered so the check sequence is recoverable without a
+        # table sweep; membership stays O(1)
+        self._checked_ids: Dict[str, None] = {}
+        self._selected_rows_cache: Tuple[int, ...] = ()  # refreshed on selection change
+        self._count_update_pending = False  # one scheduled counter refresh at a time
         self._updating_checks: bool = False
         # Drag-select state (paint selection by dragging)
         self._drag_select_active: bool = False
@@ -2903,7 +4538,7 @@ class NavidromeLibraryDialog(QDialog):
         Keeps the rest intact. Leading spaces before the numbers are allowed.
         """
         try:
-            return re.sub(r"^\s*\d{2}-\d{2}\s*-\s*", "", name)
+            return _cleaned_name(name)
         except Exception:
             return name
 
@@ -2915,7 +4550,7 @@ class NavidromeLibraryDialog(QDialog):
             if isinstance(path, str) and path:
                 base = os.path.basename(path)
                 if base:
-                    return cls._strip_two_digit_prefix(base)
+                    return _canonical_track_name(base)
         except Exception:
             pass
         # Else synthesize from title/name + extension
@@ -2927,55 +4562,132 @@ class NavidromeLibraryDialog(QDialog):
         base = str(title).strip() or "track"
         if not base.lower().endswith("." + ext):
             base = f"{base}.{ext}"
-        return cls._strip_two_digit_prefix(base)
+        return _canonical_track_name(base)
 
     def _apply_filters(self) -> None:
-        """Apply search text to visible rows across visible columns."""
+        """Apply search text to visible rows using the prebuilt lowercased index."""
         query = (self.search_bar.text() or "").strip().lower()
-        tokens = [t for t in re.split(r"\s+", query) if t]
+        tokens = query.split()
+
+        row_count = self.table.rowCount()
+        # One byte per row mirrors the view's hidden state so setRowHidden —
+        # which recomputes viewport geometry even for no-op calls — only runs
+        # when a row actually flips. Rebuilt all-visible after a fresh load.
+        mask = self._hidden_mask
+        if len(mask) < row_count:
+            # Defensive: grow with zeros rather than rebuild — discarding
+            # the tracked bits would leave already-hidden rows invisible
+            # with the view believing them shown
+            mask.extend(bytes(row_count - len(mask)))
+        elif len(mask) > row_count:
+            del mask[row_count:]
+
+        # Empty query: unhide everything without touching the index
+        if not tokens:
+            try:
+                self.table.setUpdatesEnabled(False)
+                for row in range(row_count):
+                    if mask[row]:
+                        self.table.setRowHidden(row, False)
+                        mask[row] = 0
+                self.table.setUpdatesEnabled(True)
+            except Exception:
+                pass
+            self._visible_rows = list(range(row_count))
+            self._last_filter_tokens = []
+            self._schedule_count_update()
+            return
+
+        # A query that only narrows the previous one (every old token is a
+        # substring of some new token) cannot bring hidden rows back, so
+        # rescan just the rows that are currently visible
+        prev_tokens = self._last_filter_tokens
+        refining = bool(prev_tokens) and all(
+            any(pt in nt for nt in tokens) for pt in prev_tokens
+        )
+        candidates = self._visible_rows if refining else range(row_count)
 
+        search_index = self._columns.search_index
+        index_len = len(search_index)
+        store_role = Qt.UserRole + 1  # type: ignore
         self._visible_rows = []
-        for row in range(self.table.rowCount()):
-            # Search across visible columns only
-            row_text_parts = []
-            for col in range(self.table.columnCount()):
-                try:
-                    if self.table.isColumnHidden(col):
-                        continue
-                except Exception:
-                    pass
-                it = self.table.item(row, col)
+        # Queries are overwhelmingly one word; skip the token loop for them
+        single_tok = tokens[0] if len(tokens) == 1 else None
+        for row in candidates:
+            # Prefer the precomputed row text; the store index lives on the
+            # Filename item so this survives column sorting. Rows are always
+            # built by _flush_song_batch, so plain None/bounds checks replace
+            # per-row exception handlers in this hot loop.
+            row_text = None
+            it = self.table.item(row, self.COL_FILENAME)
+            if it is not None:
+                store_row = it.data(store_role)
+                if store_row is not None and 0 <= int(store_row) < index_len:
+                    row_text = search_index[int(store_row)]
+            if row_text is None:
+                # Fallback: scan visible columns for rows without a store index
+                row_text_parts = []
+                for col in range(self.table.columnCount()):
+                    try:
+                        if self.table.isColumnHidden(col):
+                            continue
+                    except Exception:
+                        pass
+                    cit = self.table.item(row, col)
+                    try:
+                        if cit:
+                            row_text_parts.append((cit.text() or "").lower())
+                    except Exception:
+                        pass
+                row_text = " ".join(row_text_parts)
+
+            if single_tok is not None:
+                matches_text = single_tok in row_text
+            else:
+                matches_text = True
+                for tok in tokens:
+                    if tok not in row_text:
+                        matches_text = False
+                        break
+
+            hidden = 0 if matches_text else 1
+            if mask[row] != hidden:
                 try:
-                    if it:
-                        row_text_parts.append((it.text() or "").lower())
+                    self.table.setRowHidden(row, bool(hidden))
+                    mask[row] = hidden
                 except Exception:
                     pass
-            row_text = " ".join(row_text_parts)
-            matches_text = True
-            for tok in tokens:
-                if tok not in row_text:
-                    matches_text = False
-                    break
-
-            try:
-                self.table.setRowHidden(row, not matches_text)
-            except Exception:
-                pass
             if matches_text:
                 self._visible_rows.append(row)
 
-        self._update_counts()
-
-    def _update_counts(self) -> None:
-        selected = 0
+        self._last_filter_tokens = tokens
         try:
-            selected = sum(
-                1
-                for r in range(self.table.rowCount())
-                if (self.table.item(r, self.COL_FILENAME) is not None and self.table.item(r, self.COL_FILENAME).checkState() == Qt.Checked)  # type: ignore
-            )
+            self.table.viewport().update()
         except Exception:
-            selected = len(self._checked_ids)
+            pass
+        self._schedule_count_update()
+
+    def _schedule_count_update(self) -> None:
+        """Coalesce counter/title refreshes to at most one per frame."""
+        if self._count_update_pending:
+            return
+        self._count_update_pending = True
+        QTimer.singleShot(16, self._run_count_update)
+
+    def _run_count_update(self) -> None:
+        self._count_update_pending = False
+        try:
+            self._update_counts()
+        except RuntimeError:
+            pass  # dialog tore down before the pending refresh fired
+
+    def _update_counts(self) -> None:
+        # Bulk toggles refresh once at the end, not per intermediate change
+        if self._updating_checks:
+            return
+        # Every check/uncheck path maintains _checked_ids, so the count is a
+        # set size — no per-row widget sweep.
+        selected = len(self._checked_ids)
         total = len(self._songs)
         self.setWindowTitle(f"Select Tracks from Navidrome Library — {selected} selected / {total} total")
         try:
@@ -2990,16 +4702,27 @@ class NavidromeLibraryDialog(QDialog):
     def _clear_selection(self) -> None:
         # Uncheck all checkboxes (clears logical selection)
         self._updating_checks = True
+        try:
+            self.table.blockSignals(True)
+        except Exception:
+            pass
         try:
             self._checked_ids.clear()
+            get_item = self.table.item
+            col = self.COL_FILENAME
+            unchecked = Qt.Unchecked  # type: ignore
             for r in range(self.table.rowCount()):
-                it = self.table.item(r, self.COL_FILENAME)
+                it = get_item(r, col)
                 if it is not None:
-                    it.setCheckState(Qt.Unchecked)  # type: ignore
+                    it.setCheckState(unchecked)
+        except Exception:
+            pass
+        try:
+            self.table.blockSignals(False)
         except Exception:
             pass
         self._updating_checks = False
-        self._update_counts()
+        self._schedule_count_update()
 
     def _deselect_blue_selection(self) -> None:
         # Clear visual selection highlight only; do not change any checkbox states
@@ -3022,17 +4745,17 @@ class NavidromeLibraryDialog(QDialog):
 
     # ---------- Loading ----------
     def _load_songs_streaming(self) -> None:
-        """Streaming load with progress dialog and live 'Fetched song X of Y' status."""
+        """Streaming load with progress dialog; the fetch runs off the GUI thread.
+
+        The worker only appends raw song dicts to a shared buffer; a 30 Hz
+        drain timer on the GUI thread converts them to rows and bulk-inserts
+        via _flush_song_batch. No processEvents reentrancy anywhere.
+        """
         progress = NavidromeFetchProgressDialog(self)
         try:
             progress.show()
         except Exception:
             pass
-        if QCoreApplication is not None:
-            try:
-                QCoreApplication.processEvents()
-            except Exception:
-                pass
 
         try:
             self.table.setSortingEnabled(False)
@@ -3040,119 +4763,60 @@ class NavidromeLibraryDialog(QDialog):
             pass
 
         self._songs = []
+        self._columns.clear()
         self.table.setRowCount(0)
+        self._row_ids = []
+        self._hidden_mask = bytearray()
+        self._last_filter_tokens = []
         self._loading = True
-        fetched = 0
+
+        # Shared with the worker: it appends, the drain timer slices off the
+        # front. Plain list ops are atomic under the GIL.
+        fetch_buffer: List[Dict] = []
+        fetch_progress = [0, 0]  # done, total_known (written by worker)
+        fetch_state = {"finished": False, "error": None}
+        fetched = [0]
 
         def _cancelled() -> bool:
             return progress.cancelled()
 
         def _progress_cb(done: int, total_known: int) -> None:
-            progress.set_total(total_known if total_known > 0 else 0)
-            progress.set_value(done if total_known > 0 else 0)
-            if total_known > 0:
-                percentage = int((done * 100) / total_known) if total_known > 0 else 0
-                progress.set_status(f"Fetched {done} of {total_known} songs ({percentage}%)")
-            else:
-                progress.set_status(f"Calculating total songs... ({done} found)")
-            if QCoreApplication is not None:
-                try:
-                    QCoreApplication.processEvents()
-                except Exception:
-                    pass
-
-        try:
+            fetch_progress[0] = done
+            fetch_progress[1] = total_known
+
+        def _fetch() -> int:
+            # Warm path: when the server's scan snapshot matches the cached
+            # one, the whole library comes straight from the sqlite tier
+            signature = self.client.library_signature()
+            cached = self.client.cached_song_library(signature)
+            if cached is not None:
+                fetch_buffer.extend(cached)
+                fetch_progress[0] = len(cached)
+                fetch_progress[1] = len(cached)
+                return len(cached)
+
+            count = 0
+            fetched_songs: List[Dict] = []
             for s in self.client.iter_all_songs_stream(progress_cb=_progress_cb, cancel_flag=_cancelled):
-                if _cancelled():
-                    break
-
-                artist = s.get("artist") or ""
-                title = s.get("title") or s.get("name") or ""
-                album = s.get("album") or ""
-                year = str(s.get("year", ""))
-                genre = s.get("genre") or ""
-                dur = s.get("duration")
-                if isinstance(dur, int) and dur >= 0:
-                    minutes = dur // 60
-                    seconds = dur % 60
-                    duration_text = f"{minutes}:{seconds:02d}"
-                else:
-                    duration_text = str(dur) if dur is not None else ""
-
-                filename = self._dataname_for_song(s)
-                sid = str(s.get("id", ""))
-
-                row = self.table.rowCount()
-                self.table.insertRow(row)
-
-                # Embed checkbox into Filename cell (no separate checkbox column)
-                try:
-                    chk = QTableWidgetItem("")
-                    try:
-                        chk.setFlags((chk.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable) & ~Qt.ItemIsEditable)  # type: ignore
-                    except Exception:
-                        pass
-                    if sid in self._checked_ids:
-                        chk.setCheckState(Qt.Checked)  # type: ignore
-                    else:
-                        chk.setCheckState(Qt.Unchecked)  # type: ignore
-                except Exception:
-                    chk = None
-
-                # Fill other cells; store song id on Filename cell
-                try:
-                    it_filename = QTableWidgetItem(str(filename))
-                    try:
-                        it_filename.setFlags(it_filename.flags() & ~Qt.ItemIsEditable)  # type: ignore
-                    except Exception:
-                        pass
-                    try:
-                        it_filename.setData(Qt.UserRole, sid)  # type: ignore
-                    except Exception:
-                        pass
-                    self.table.setItem(row, self.COL_FILENAME, it_filename)
-                    if chk is not None:
-                        try:
-                            it_filename.setFlags((it_filename.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable) & ~Qt.ItemIsEditable)  # type: ignore
-                        except Exception:
-                            pass
-                        try:
-                            it_filename.setCheckState(chk.checkState())  # type: ignore
-                        except Exception:
-                            pass
-                except Exception:
-                    pass
-
-                def _safe_set(col_index: int, value: str) -> None:
-                    try:
-                        item = QTableWidgetItem(str(value))
-                        try:
-                            item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # type: ignore
-                        except Exception:
-                            pass
-                        self.table.setItem(row, col_index, item)
-                    except Exception:
-                        pass
+                fetch_buffer.append(s)
+                fetched_songs.append(s)
+                count += 1
+            if not _cancelled():
+                self.client.store_song_library(fetched_songs, signature)
+            return count
 
-                _safe_set(self.COL_TITLE, title)
-                _safe_set(self.COL_ARTIST, artist)
-                _safe_set(self.COL_ALBUM, album)
-                _safe_set(self.COL_YEAR, year)
-                _safe_set(self.COL_GENRE, genre)
-                _safe_set(self.COL_DURATION, duration_text)
+        def _on_fetch_finished(_result: object) -> None:
+            fetch_state["finished"] = True
 
-                self._songs.append(s)
-                fetched += 1
+        def _on_fetch_failed(exc: object) -> None:
+            fetch_state["error"] = str(exc)
+            fetch_state["finished"] = True
 
-                if fetched % 25 == 0 and QCoreApplication is not None:
-                    try:
-                        QCoreApplication.processEvents()
-                    except Exception:
-                        pass
+        drain_timer = QTimer(self)
+        drain_timer.setInterval(33)
 
-        except Exception as exc:
-            QMessageBox.critical(self, "Navidrome", f"Failed to load library: {exc}")
-        finally:
+        def _finish_load() -> None:
+            drain_timer.stop()
             self._loading = False
             try:
                 progress.close()
@@ -3163,12 +4827,142 @@ class NavidromeLibraryDialog(QDialog):
             except Exception:
                 pass
             self._visible_rows = list(range(self.table.rowCount()))
+            if fetch_state["error"]:
+                QMessageBox.critical(self, "Navidrome", f"Failed to load library: {fetch_state['error']}")
             if progress.cancelled():
-                self.info_label.setText(f"Loaded {fetched} song(s) (cancelled)")
+                self.info_label.setText(f"Loaded {fetched[0]} song(s) (cancelled)")
             else:
-                self.info_label.setText(f"All songs loaded: {fetched}")
+                self.info_label.setText(f"All songs loaded: {fetched[0]}")
             self._apply_filters()
 
+        def _drain() -> None:
+            n = len(fetch_buffer)
+            if n:
+                chunk = fetch_buffer[:n]
+                del fetch_buffer[:n]
+                self._flush_song_batch([self._song_to_row(s) for s in chunk])
+                self._songs.extend(chunk)
+                fetched[0] += n
+
+            done, total_known = fetch_progress
+            progress.set_total(total_known if total_known > 0 else 0)
+            progress.set_value(done if total_known > 0 else 0)
+            if total_known > 0:
+                percentage = int((done * 100) / total_known)
+                progress.set_status(f"Fetched {done} of {total_known} songs ({percentage}%)")
+            else:
+                progress.set_status(f"Calculating total songs... ({done} found)")
+
+            if fetch_state["finished"] and not fetch_buffer:
+                _finish_load()
+
+        drain_timer.timeout.connect(_drain)  # type: ignore[attr-defined]
+        drain_timer.start()
+        _run_network_job(_fetch, _on_fetch_finished, _on_fetch_failed)
+
+    def _song_to_row(self, s: Dict) -> Tuple[str, int, str, str, str, str, str, str, str]:
+        """Extract one song dict into the row tuple _flush_song_batch expects."""
+        get = s.get  # one bound-method lookup instead of eight
+        artist = get("artist") or ""
+        title = get("title") or get("name") or ""
+        album = get("album") or ""
+        year = get("year")
+        year = "" if year is None else (year if isinstance(year, str) else str(year))
+        genre = get("genre") or ""
+        dur = get("duration")
+        if isinstance(dur, int) and dur >= 0:
+            minutes, seconds = divmod(dur, 60)
+            duration_text = f"{minutes}:{seconds:02d}"
+        else:
+            duration_text = str(dur) if dur is not None else ""
+
+        # Display name is a pure function of the song dict; memoize it on the
+        # dict so cache-served loads skip the basename/prefix work entirely
+        filename = get("_display_name")
+        if filename is None:
+            filename = self._dataname_for_song(s)
+            s["_display_name"] = filename
+        # Interned ids make the per-row membership tests against
+        # _checked_ids pointer compares and dedupe the N id strings
+        raw_id = get("id")
+        sid = sys.intern(raw_id) if isinstance(raw_id, str) else str(raw_id or "")
+
+        # Columnar store row; the view keeps this index on the Filename item
+        store_row = self._columns.append(sid, {
+            "filename": filename,
+            "title": title,
+            "artist": artist,
+            "album": album,
+            "year": year,
+            "genre": genre,
+            "duration": duration_text,
+        })
+        return (sid, store_row, filename, title, artist, album, year, genre, duration_text)
+
+    def _flush_song_batch(self, batch: List[Tuple[str, int, str, str, str, str, str, str, str]]) -> None:
+        """Insert a chunk of fetched songs as table rows in one update cycle."""
+        if not batch:
+            return
+        self._updating_checks = True
+        try:
+            self.table.setUpdatesEnabled(False)
+            self.table.blockSignals(True)
+        except Exception:
+            pass
+        try:
+            start = self.table.rowCount()
+            self.table.setRowCount(start + len(batch))
+            # Keep the hidden mask mirroring the row count; new rows start
+            # visible, and a filter pass between flushes must not see a
+            # length mismatch (rebuilding the mask would forget rows it
+            # already hid)
+            self._hidden_mask.extend(bytes(len(batch)))
+            # Hot loop: one try per song, hoisted lookups, precomputed flags
+            set_item = self.table.setItem
+            checked_ids = self._checked_ids
+            flags_ro = self._item_flags_ro
+            flags_chk = self._item_flags_chk
+            col_filename = self.COL_FILENAME
+            user_role = Qt.UserRole  # type: ignore
+            store_role = Qt.UserRole + 1  # type: ignore
+            checked = Qt.Checked  # type: ignore
+            unchecked = Qt.Unchecked  # type: ignore
+            row_ids = self._row_ids
+            for offset, (sid, store_row, filename, title, artist, album, year, genre, duration_text) in enumerate(batch):
+                row = start + offset
+                row_ids.append(sid)
+                try:
+                    # Embed checkbox into Filename cell (no separate checkbox column)
+                    it_filename = QTableWidgetItem(filename)
+                    if flags_chk is not None:
+                        it_filename.setFlags(flags_chk)
+                    it_filename.setData(user_role, sid)
+                    it_filename.setData(store_role, store_row)
+                    it_filename.setCheckState(checked if sid in checked_ids else unchecked)
+                    set_item(row, col_filename, it_filename)
+
+                    for col_index, value in (
+                        (self.COL_TITLE, title),
+                        (self.COL_ARTIST, artist),
+                        (self.COL_ALBUM, album),
+                        (self.COL_YEAR, year),
+                        (self.COL_GENRE, genre),
+                        (self.COL_DURATION, duration_text),
+                    ):
+                        item = QTableWidgetItem(value)
+                        if flags_ro is not None:
+                            item.setFlags(flags_ro)
+                        set_item(row, col_index, item)
+                except Exception:
+                    pass
+        finally:
+            try:
+                self.table.blockSignals(False)
+                self.table.setUpdatesEnabled(True)
+            except Exception:
+                pass
+            self._updating_checks = False
+
     # ---------- Playlist creation ----------
     def _continue_to_review_selected(self) -> None:
         # Safety: Require a working connection first
@@ -3180,28 +4974,38 @@ class NavidromeLibraryDialog(QDialog):
             QMessageBox.warning(self, "Navidrome", f"Connection check failed: {exc}")
             return
 
-        # Gather selected song ids and filenames in current table order
+        # Gather selected song ids and filenames in current table order.
+        # _checked_ids is the source of truth; the sweep only supplies order
+        # and stops once every checked id has been found.
+        checked = self._checked_ids
         selected: List[Tuple[str, str]] = []
+        remaining = len(checked)
+        song_id_for_row = self._song_id_for_row
+        # While rows still sit in insert order the filename comes from the
+        # columnar store; after a sort the positional index is gone and the
+        # item text is the only truthful source
+        filenames = self._columns.cols["filename"]
+        use_store = len(self._row_ids) == self.table.rowCount()
         for r in range(self.table.rowCount()):
-            try:
-                it_chk = self.table.item(r, self.COL_FILENAME)
-                if it_chk is None or it_chk.checkState() != Qt.Checked:  # type: ignore
-                    continue
-            except Exception:
-                continue
-            sid = self._song_id_for_row(r)
-            if not sid:
+            if not remaining:
+                break
+            sid = song_id_for_row(r)
+            if not sid or sid not in checked:
                 continue
-            fname = ""
-            try:
-                it = self.table.item(r, self.COL_FILENAME)
-                if it is not None:
-                    fname = it.text() or ""
-            except Exception:
-                pass
-            selected.append((sid, fname))
-
-        if not selected:
+            if use_store and r < len(filenames):
+                fname = filenames[r]
+            else:
+                fname = ""
+                try:
+                    it = self.table.item(r, self.COL_FILENAME)
+                    if it is not None:
+                        fname = it.text() or ""
+                except Exception:
+                    pass
+            selected.append((sid, fname))
+            remaining -= 1
+
+        if not selected:
             QMessageBox.information(self, "Navidrome", "No songs selected. Use the leftmost checkbox column to select tracks.")
             return
 
@@ -3211,14 +5015,9 @@ class NavidromeLibraryDialog(QDialog):
         except Exception as exc:
             QMessageBox.critical(self, "Navidrome", f"Unable to open review: {exc}")
             return
-        try:
-            res = dlg.exec()
-        except Exception:
-            try:
-                res = dlg.exec_()
-            except Exception:
-                dlg.show()
-                return
+        res = _exec_dialog(dlg)
+        if res is None:
+            return
         # If user accepted, proceed to create playlist with chosen order
         try:
             accepted = (res == QDialog.Accepted)
@@ -3253,14 +5052,9 @@ class NavidromeLibraryDialog(QDialog):
                     dlg_name.setWindowFlags(dlg_name.windowFlags() & ~Qt.WindowContextHelpButtonHint)  # type: ignore
                 except Exception:
                     pass
-            try:
-                res_name = dlg_name.exec()
-            except Exception:
-                try:
-                    res_name = dlg_name.exec_()
-                except Exception:
-                    dlg_name.show()
-                    return
+            res_name = _exec_dialog(dlg_name)
+            if res_name is None:
+                return
             try:
                 ok = (res_name == QDialog.Accepted)
             except Exception:
@@ -3292,7 +5086,30 @@ class NavidromeLibraryDialog(QDialog):
             pass
 
     # ---------- Checkbox selection helpers ----------
+    def _invalidate_row_ids(self, *_args) -> None:
+        self._row_ids = []
+
+    def _refresh_filename_hitzone(self, *_args) -> None:
+        # Left ~24px of the Filename column counts as the checkbox area
+        try:
+            self._filename_hitzone_right = self.table.columnViewportPosition(self.COL_FILENAME) + 24
+        except Exception:
+            self._filename_hitzone_right = 24
+
+    def _refresh_selected_rows(self) -> None:
+        try:
+            self._selected_rows_cache = tuple(
+                mi.row() for mi in self.table.selectionModel().selectedRows()
+            )
+        except Exception:
+            self._selected_rows_cache = ()
+
     def _song_id_for_row(self, row: int) -> str:
+        # Fast path: the positional index built at insert time; emptied on
+        # sort because the table reorders without telling us the permutation
+        row_ids = self._row_ids
+        if 0 <= row < len(row_ids):
+            return row_ids[row]
         try:
             it = self.table.item(row, self.COL_FILENAME)
             if it is not None:
@@ -3301,57 +5118,101 @@ class NavidromeLibraryDialog(QDialog):
         except Exception:
             pass
         try:
-            return str(self._songs[row].get("id", ""))
+            return self._columns.ids[row]
         except Exception:
             return ""
 
-    def _check_row(self, row: int, checked: bool) -> None:
+    def _check_row(self, row: int, checked: bool, update_counts: bool = True) -> None:
         self._updating_checks = True
         try:
             it = self.table.item(row, self.COL_FILENAME)
             if it is None:
                 it = QTableWidgetItem("")
-                try:
-                    it.setFlags((it.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable) & ~Qt.ItemIsEditable)  # type: ignore
-                except Exception:
-                    pass
+                if self._item_flags_chk is not None:
+                    it.setFlags(self._item_flags_chk)
                 self.table.setItem(row, self.COL_FILENAME, it)
             it.setCheckState(Qt.Checked if checked else Qt.Unchecked)  # type: ignore
             sid = self._song_id_for_row(row)
             if sid:
                 if checked:
-                    self._checked_ids.add(sid)
+                    self._checked_ids[sid] = None
                 else:
-                    self._checked_ids.discard(sid)
+                    self._checked_ids.pop(sid, None)
         except Exception:
             pass
         self._updating_checks = False
-        self._update_counts()
+        if update_counts:
+            self._schedule_count_update()
 
-    def _toggle_row(self, row: int) -> None:
+    def _toggle_row(self, row: int, update_counts: bool = True) -> None:
         self._updating_checks = True
         try:
             it = self.table.item(row, self.COL_FILENAME)
             if it is None:
                 it = QTableWidgetItem("")
-                try:
-                    it.setFlags((it.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable) & ~Qt.ItemIsEditable)  # type: ignore
-                except Exception:
-                    pass
+                if self._item_flags_chk is not None:
+                    it.setFlags(self._item_flags_chk)
                 self.table.setItem(row, self.COL_FILENAME, it)
-            current_checked = (it.checkState() == Qt.Checked)  # type: ignore
-            new_checked = not current_checked
-            it.setCheckState(Qt.Checked if new_checked else Qt.Unchecked)  # type: ignore
             sid = self._song_id_for_row(row)
+            new_checked = not (sid and sid in self._checked_ids)
+            it.setCheckState(Qt.Checked if new_checked else Qt.Unchecked)  # type: ignore
             if sid:
                 if new_checked:
-                    self._checked_ids.add(sid)
+                    self._checked_ids[sid] = None
                 else:
-                    self._checked_ids.discard(sid)
+                    self._checked_ids.pop(sid, None)
         except Exception:
             pass
         self._updating_checks = False
-        self._update_counts()
+        if update_counts:
+            self._schedule_count_update()
+
+    def _toggle_row_fast(self, row: int) -> None:
+        """Toggle one row assuming its Filename item already exists.
+
+        Bulk paths call this per crossed row; after a load every row has
+        its item, so the creation guard, per-row flag flip and counter
+        refresh of _toggle_row are skipped. Falls back for bare rows.
+        """
+        it = self.table.item(row, self.COL_FILENAME)
+        if it is None:
+            self._toggle_row(row, update_counts=False)
+            return
+        sid = self._song_id_for_row(row)
+        new_checked = not (sid and sid in self._checked_ids)
+        it.setCheckState(Qt.Checked if new_checked else Qt.Unchecked)  # type: ignore
+        if sid:
+            if new_checked:
+                self._checked_ids[sid] = None
+            else:
+                self._checked_ids.pop(sid, None)
+
+    def _bulk_toggle(self, rows: List[int]) -> None:
+        """Toggle several rows with one paint and one counter refresh.
+
+        Fast drags cross many rows per mouse event; toggling them through
+        _toggle_row would repaint and recount per row.
+        """
+        if not rows:
+            return
+        self._updating_checks = True
+        try:
+            self.table.setUpdatesEnabled(False)
+            self.table.blockSignals(True)
+        except Exception:
+            pass
+        try:
+            toggle = self._toggle_row_fast
+            for r in rows:
+                toggle(r)
+        finally:
+            try:
+                self.table.blockSignals(False)
+                self.table.setUpdatesEnabled(True)
+            except Exception:
+                pass
+            self._updating_checks = False
+        self._schedule_count_update()
 
     def _on_cell_clicked(self, row: int, col: int) -> None:
         # Clicking anywhere in the row toggles the checkbox; clicking the checkbox also works
@@ -3370,10 +5231,7 @@ class NavidromeLibraryDialog(QDialog):
                 self._press_on_filename_checkbox = False
                 return
             # Clicking any column (including Filename) toggles the row
-            try:
-                selected_rows = [mi.row() for mi in self.table.selectionModel().selectedRows()]
-            except Exception:
-                selected_rows = []
+            selected_rows = self._selected_rows_cache
 
             # Determine rows we will act on
             rows_to_toggle = selected_rows if len(selected_rows) > 1 else [row]
@@ -3383,15 +5241,15 @@ class NavidromeLibraryDialog(QDialog):
             if it_clicked_chk is None:
                 # Ensure there is a checkable item in Filename column
                 it_clicked_chk = QTableWidgetItem("")
-                try:
-                    it_clicked_chk.setFlags((it_clicked_chk.flags() | Qt.ItemIsUserCheckable | Qt.ItemIsEnabled | Qt.ItemIsSelectable) & ~Qt.ItemIsEditable)  # type: ignore
-                except Exception:
-                    pass
+                if self._item_flags_chk is not None:
+                    it_clicked_chk.setFlags(self._item_flags_chk)
                 self.table.setItem(row, self.COL_FILENAME, it_clicked_chk)
             target_checked = not (it_clicked_chk.checkState() == Qt.Checked)  # type: ignore
 
+            # One label/title refresh for the whole batch, not one per row
             for r in rows_to_toggle:
-                self._check_row(r, target_checked)
+                self._check_row(r, target_checked, update_counts=False)
+            self._schedule_count_update()
         except Exception:
             pass
 
@@ -3408,127 +5266,150 @@ class NavidromeLibraryDialog(QDialog):
             sid = self._song_id_for_row(item.row())
             if sid:
                 if item.checkState() == Qt.Checked:  # type: ignore
-                    self._checked_ids.add(sid)
+                    self._checked_ids[sid] = None
                 else:
-                    self._checked_ids.discard(sid)
+                    self._checked_ids.pop(sid, None)
 
             # Propagate this new state to all other selected rows
-            try:
-                selected_rows = [mi.row() for mi in self.table.selectionModel().selectedRows()]
-            except Exception:
-                selected_rows = []
+            selected_rows = self._selected_rows_cache
             if len(selected_rows) > 1:
                 target_checked = (item.checkState() == Qt.Checked)  # type: ignore
                 for r in selected_rows:
                     if r == item.row():
                         continue
-                    self._check_row(r, target_checked)
+                    self._check_row(r, target_checked, update_counts=False)
         except Exception:
             pass
-        self._update_counts()
+        self._schedule_count_update()
 
     # Event filter to support click-drag selection toggling (invert on pass) without row drag
     def eventFilter(self, obj, event):  # type: ignore[override]
+        # Runs for every viewport event; bail with identity/type compares
+        # before any exception frame or attribute chasing
+        if obj is not self._table_viewport:
+            return False
+        et = event.type()
+        if et not in _MOUSE_EVENTS:
+            return False
         try:
-            if obj is self.table.viewport():
-                et = event.type()
-                if et == QEvent.MouseButtonPress:
-                    # Initiate potential drag-select with left button, but do not toggle yet
-                    try:
-                        if event.button() != Qt.LeftButton:  # type: ignore
-                            return False
-                    except Exception:
-                        pass
-                    pos = event.pos()
-                    # Allow drag-select to start in any column, including Filename
-                    row = self.table.rowAt(pos.y())
-                    if row is None or row < 0:
+            if et == QEvent.MouseButtonPress:
+                # Initiate potential drag-select with left button, but do not toggle yet
+                try:
+                    if event.button() != Qt.LeftButton:  # type: ignore
                         return False
-                    # Detect if press is on the checkbox area of the Filename column
-                    try:
-                        col = self.table.columnAt(pos.x())
-                        if col == self.COL_FILENAME:
-                            rect = self.table.visualItemRect(self.table.item(row, self.COL_FILENAME))
-                            # Heuristic: consider the left ~24px region as checkbox hit-zone
-                            if pos.x() - rect.left() <= 24:
-                                self._press_on_filename_checkbox = True
-                            else:
-                                self._press_on_filename_checkbox = False
-                        else:
-                            self._press_on_filename_checkbox = False
-                    except Exception:
-                        self._press_on_filename_checkbox = False
-                    # Clear any previous blue selection on simple press so a single click
-                    # won't act on previously selected rows
-                    try:
-                        self.table.clearSelection()
-                        self.table.setCurrentCell(-1, -1)
-                    except Exception:
-                        pass
-                    # No special press handling per column; unify click behavior across columns
-                    self._drag_select_active = True
-                    self._drag_anchor_row = row
+                except Exception:
+                    pass
+                pos = event.pos()
+                # Allow drag-select to start in any column, including Filename
+                row = self.table.rowAt(pos.y())
+                if row is None or row < 0:
+                    return False
+                # Detect if press is on the checkbox area of the Filename column
+                try:
+                    col = self.table.columnAt(pos.x())
+                    self._press_on_filename_checkbox = (
+                        col == self.COL_FILENAME and pos.x() <= self._filename_hitzone_right
+                    )
+                except Exception:
+                    self._press_on_filename_checkbox = False
+                # Clear any previous blue selection on simple press so a single click
+                # won't act on previously selected rows
+                try:
+                    self.table.clearSelection()
+                    self.table.setCurrentCell(-1, -1)
+                except Exception:
+                    pass
+                # No special press handling per column; unify click behavior across columns
+                self._drag_select_active = True
+                self._drag_anchor_row = row
+                self._drag_last_row = row
+                self._drag_prev_direction = 0
+                return False
+            elif et == QEvent.MouseMove:
+                if not self._drag_select_active:
+                    return False
+                pos = event.pos()
+                row = self.table.rowAt(pos.y())
+                if row is None or row < 0:
+                    return False
+                last = self._drag_last_row
+                if last is None:
                     self._drag_last_row = row
-                    self._drag_prev_direction = 0
                     return False
-                elif et == QEvent.MouseMove:
-                    if not self._drag_select_active:
-                        return False
+                if row != last:
+                    self._drag_did_move = True
+                    step = 1 if row > last else -1
+                    # Determine direction change to include reversal row immediately
+                    current_direction = 1 if row > last else -1
+                    rows: List[int] = []
+                    if self._drag_prev_direction != 0 and current_direction != self._drag_prev_direction:
+                        # Direction changed: toggle the row we are at (boundary) to mirror reversal
+                        rows.append(last)
+                    # On very first move, also toggle the anchor so the starting row acts like others
+                    if self._drag_prev_direction == 0 and self._drag_anchor_row is not None:
+                        rows.append(self._drag_anchor_row)
+                    # Toggle each row passed through (excluding the previous last, including the current row)
+                    rows.extend(range(last + step, row + step, step))
+                    self._bulk_toggle(rows)
+                    self._drag_prev_direction = current_direction
+                    self._drag_last_row = row
+                return False
+            elif et == QEvent.MouseButtonRelease:
+                # Capture the row under the mouse at release to suppress only that click
+                try:
                     pos = event.pos()
                     row = self.table.rowAt(pos.y())
-                    if row is None or row < 0:
-                        return False
-                    last = self._drag_last_row
-                    if last is None:
-                        self._drag_last_row = row
-                        return False
-                    if row != last:
-                        self._drag_did_move = True
-                        step = 1 if row > last else -1
-                        # Determine direction change to include reversal row immediately
-                        current_direction = 1 if row > last else -1
-                        if self._drag_prev_direction != 0 and current_direction != self._drag_prev_direction:
-                            # Direction changed: toggle the row we are at (boundary) to mirror reversal
-                            self._toggle_row(last)
-                        # On very first move, also toggle the anchor so the starting row acts like others
-                        if self._drag_prev_direction == 0 and self._drag_anchor_row is not None:
-                            self._toggle_row(self._drag_anchor_row)
-                        # Toggle each row passed through (excluding the previous last, including the current row)
-                        for r in range(last + step, row + step, step):
-                            self._toggle_row(r)
-                        self._drag_prev_direction = current_direction
-                        self._drag_last_row = row
-                    return False
-                elif et == QEvent.MouseButtonRelease:
-                    # Capture the row under the mouse at release to suppress only that click
-                    try:
-                        pos = event.pos()
-                        row = self.table.rowAt(pos.y())
-                        self._just_finished_drag_release_row = row if (row is not None and row >= 0 and self._drag_did_move) else None
-                    except Exception:
-                        self._just_finished_drag_release_row = None
-                    # End drag-select and reset state
-                    self._drag_select_active = False
-                    self._drag_last_row = None
-                    self._drag_anchor_row = None
-                    self._drag_prev_direction = 0
-                    # Clear move flag so the next distinct click is processed
-                    self._drag_did_move = False
-                    return False
+                    self._just_finished_drag_release_row = row if (row is not None and row >= 0 and self._drag_did_move) else None
+                except Exception:
+                    self._just_finished_drag_release_row = None
+                # End drag-select and reset state
+                self._drag_select_active = False
+                self._drag_last_row = None
+                self._drag_anchor_row = None
+                self._drag_prev_direction = 0
+                # Clear move flag so the next distinct click is processed
+                self._drag_did_move = False
+                return False
         except Exception:
             pass
         return False
 
     def _check_all_visible(self) -> None:
-        # Check all currently visible rows
-        for r in range(self.table.rowCount()):
-            try:
-                if self.table.isRowHidden(r):
+        # Check all currently visible rows with direct item writes — no
+        # per-row helper dispatch — and one repaint/recount for the sweep
+        self._updating_checks = True
+        try:
+            self.table.setUpdatesEnabled(False)
+            self.table.blockSignals(True)
+        except Exception:
+            pass
+        try:
+            get_item = self.table.item
+            is_hidden = self.table.isRowHidden
+            song_id_for_row = self._song_id_for_row
+            checked_ids = self._checked_ids
+            col = self.COL_FILENAME
+            qt_checked = Qt.Checked  # type: ignore
+            for r in range(self.table.rowCount()):
+                if is_hidden(r):
+                    continue
+                it = get_item(r, col)
+                if it is None:
                     continue
+                it.setCheckState(qt_checked)
+                sid = song_id_for_row(r)
+                if sid:
+                    checked_ids[sid] = None
+        except Exception:
+            pass
+        finally:
+            try:
+                self.table.blockSignals(False)
+                self.table.setUpdatesEnabled(True)
             except Exception:
                 pass
-            self._check_row(r, True)
-        self._update_counts()
+            self._updating_checks = False
+        self._schedule_count_update()
 
     # Default event handling
     def event(self, e):  # type: ignore[override]
@@ -3590,19 +5471,19 @@ class NavidromeLibraryDialogForAddingSongs(NavidromeLibraryDialog):
             QMessageBox.warning(self, "Navidrome", f"Connection check failed: {exc}")
             return
         
-        # Gather selected song ids in current table order
+        # Gather selected song ids in current table order; _checked_ids is
+        # the source of truth, the sweep only supplies order
+        checked = self._checked_ids
         selected_ids: List[str] = []
+        remaining = len(checked)
+        song_id_for_row = self._song_id_for_row
         for r in range(self.table.rowCount()):
-            try:
-                it_chk = self.table.item(r, self.COL_FILENAME)
-                if it_chk is None or it_chk.checkState() != Qt.Checked:  # type: ignore
-                    continue
-            except Exception:
-                continue
-            sid = self._song_id_for_row(r)
-            if not sid:
-                continue
-            selected_ids.append(sid)
+            if not remaining:
+                break
+            sid = song_id_for_row(r)
+            if sid and sid in checked:
+                selected_ids.append(sid)
+                remaining -= 1
         
         if not selected_ids:
             QMessageBox.information(self, "Navidrome", "No tracks selected!")
@@ -3677,34 +5558,20 @@ def _nav_parent_window():
 def _open_library_dialog():
     """Open the library dialog."""
     try:
-        base_url = config.setting["navidrome_base_url"].strip()
-        username = config.setting["navidrome_username"].strip()
-        password = config.setting["navidrome_password"]
-        verify_ssl = bool(config.setting["navidrome_verify_ssl"])
-        
-        if not base_url or not username or not password:
+        settings = _read_nav_settings()
+        if not settings.complete():
             QMessageBox.warning(None, "Navidrome", "Please configure Navidrome settings in Options > Plugins > Navidrome.")
             return
-        
-        try:
-            enable_cache = bool(config.setting["navidrome_enable_cache"])
-        except (KeyError, ValueError):
-            enable_cache = True
-        client = SubsonicClient(
-            base_url=base_url, 
-            username=username, 
-            password=password, 
-            verify_ssl=verify_ssl,
-            enable_cache=enable_cache
+
+        client = _get_client(
+            settings.base_url,
+            settings.username,
+            settings.password,
+            verify_ssl=settings.verify_ssl,
+            enable_cache=settings.enable_cache,
         )
         dlg = NavidromeLibraryDialog(None, client)
-        try:
-            dlg.exec()
-        except Exception:
-            try:
-                dlg.exec_()
-            except Exception:
-                dlg.show()
+        _exec_dialog(dlg)
     except Exception as exc:
         QMessageBox.critical(None, "Navidrome", f"Error: {exc}")
 
@@ -3712,37 +5579,26 @@ def _open_connect_dialog() -> None:
     parent = _nav_parent_window()
     try:
         dlg = NavidromeOptionsDialog(parent)
-        try:
-            dlg.exec()
-        except Exception:
-            try:
-                dlg.exec_()
-            except Exception:
-                dlg.show()
+        _exec_dialog(dlg)
     except Exception as exc:
         QMessageBox.critical(parent, "Navidrome", f"Unable to open dialog: {exc}")
 
 def _open_playlists_dialog():
     """Open the playlists dialog."""
     try:
-        base_url = config.setting["navidrome_base_url"].strip()
-        username = config.setting["navidrome_username"].strip()
-        password = config.setting["navidrome_password"]
-        verify_ssl = bool(config.setting["navidrome_verify_ssl"])
-        
-        if not base_url or not username or not password:
+        settings = _read_nav_settings()
+        if not settings.complete():
             QMessageBox.warning(None, "Navidrome", "Please configure Navidrome settings in Options > Plugins > Navidrome.")
             return
-            
-        client = SubsonicClient(base_url=base_url, username=username, password=password, verify_ssl=verify_ssl)
+
+        client = _get_client(
+            settings.base_url,
+            settings.username,
+            settings.password,
+            verify_ssl=settings.verify_ssl,
+        )
         dlg = NavidromeBrowserDialog(None, client)
-        try:
-            dlg.exec()
-        except Exception:
-            try:
-                dlg.exec_()
-            except Exception:
-                dlg.show()
+        _exec_dialog(dlg)
     except Exception as exc:
         QMessageBox.critical(None, "Navidrome", f"Error: {exc}")
 
@@ -3750,6 +5606,44 @@ def _open_playlists_dialog():
 # -----------------------------
 # About dialog
 # -----------------------------
+def _open_url(url: str) -> None:
+    try:
+        webbrowser.open(url)
+    except Exception:
+        pass
+
+
+# Bold/italic variants of the application font, created once on first use
+# and shared by every dialog label (QFont is implicitly shared)
+_BOLD_FONT = None
+_ITALIC_FONT = None
+
+
+def _bold_font():
+    global _BOLD_FONT
+    if _BOLD_FONT is None:
+        f = QApplication.font()
+        f.setBold(True)
+        _BOLD_FONT = f
+    return _BOLD_FONT
+
+
+def _italic_font():
+    global _ITALIC_FONT
+    if _ITALIC_FONT is None:
+        f = QApplication.font()
+        f.setItalic(True)
+        _ITALIC_FONT = f
+    return _ITALIC_FONT
+
+
+# URL openers bound once at import; avoids a fresh closure per connect
+_OPEN_PAYPAL = functools.partial(_open_url, "https://paypal.me/vikshepo")
+_OPEN_GITHUB = functools.partial(_open_url, "https://github.com/VikShepo/picard-navidrome-intergration")
+_OPEN_FACEBOOK = functools.partial(_open_url, "https://www.facebook.com/Vikiller94")
+_OPEN_INSTAGRAM = functools.partial(_open_url, "https://www.instagram.com/notorious_vik_")
+
+
 class NavidromeAboutDialog(QDialog):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -3766,6 +5660,19 @@ class NavidromeAboutDialog(QDialog):
             except Exception:
                 pass
 
+        # Widget construction is deferred to the first showEvent so the
+        # cached singleton costs nothing until the menu entry is used.
+        self._built = False
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        self._ensure_built()
+        super().showEvent(event)
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        self._built = True
+
         main = QVBoxLayout(self)
 
         title = QLabel("Navidrome (Subsonic) Integration for Picard", self)
@@ -3785,9 +5692,9 @@ class NavidromeAboutDialog(QDialog):
         )
         try:
             info.setTextFormat(Qt.RichText)  # type: ignore
+            info.setWordWrap(True)
         except Exception:
             pass
-        info.setWordWrap(True)
         main.addWidget(info)
 
         # Version row (bold)
@@ -3808,9 +5715,9 @@ class NavidromeAboutDialog(QDialog):
         )
         try:
             compat.setTextFormat(Qt.RichText)  # type: ignore
+            compat.setWordWrap(True)
         except Exception:
             pass
-        compat.setWordWrap(True)
         main.addWidget(compat)
 
         # Links row
@@ -3822,24 +5729,15 @@ class NavidromeAboutDialog(QDialog):
 
         # Highlight Donate button
         try:
-            btn_paypal.setStyleSheet("font-weight: bold; background-color: #FFE08A;")
-        except Exception:
-            pass
-        try:
+            btn_paypal.setStyleSheet(_DONATE_QSS)
             btn_paypal.setDefault(True)
             btn_paypal.setAutoDefault(True)
         except Exception:
             pass
 
-        def open_url(url: str) -> None:
-            try:
-                webbrowser.open(url)
-            except Exception:
-                pass
-
         try:
-            btn_paypal.clicked.connect(lambda: open_url("https://paypal.me/vikshepo"))  # type: ignore[attr-defined]
-            btn_github.clicked.connect(lambda: open_url("https://github.com/VikShepo/picard-navidrome-intergration"))  # type: ignore[attr-defined]
+            btn_paypal.clicked.connect(_OPEN_PAYPAL)  # type: ignore[attr-defined]
+            btn_github.clicked.connect(_OPEN_GITHUB)  # type: ignore[attr-defined]
             # In-app changelog dialog
             btn_changelog.clicked.connect(_open_changelog_dialog)  # type: ignore[attr-defined]
         except Exception:
@@ -3861,17 +5759,12 @@ class NavidromeAboutDialog(QDialog):
         cute = QLabel("<i>Thanks for using this plugin! Your support keeps the music playing.</i>", self)
         try:
             cute.setTextFormat(Qt.RichText)  # type: ignore
+            cute.setWordWrap(True)
         except Exception:
             pass
-        cute.setWordWrap(True)
         main.addWidget(cute)
 
         # Social icon buttons (centered)
-        social_row = QHBoxLayout()
-        try:
-            social_row.setAlignment(Qt.AlignCenter)  # type: ignore
-        except Exception:
-            pass
         fb_btn = QToolButton(self)
         fb_btn.setText("📘")
         fb_btn.setToolTip("Facebook")
@@ -3882,58 +5775,25 @@ class NavidromeAboutDialog(QDialog):
         ig_btn.setText("📸")
         ig_btn.setToolTip("Instagram")
         try:
-            fb_btn.clicked.connect(lambda: open_url("https://www.facebook.com/Vikiller94"))  # type: ignore[attr-defined]
-            gh_btn.clicked.connect(lambda: open_url("https://github.com/VikShepo/picard-navidrome-intergration"))  # type: ignore[attr-defined]
-            ig_btn.clicked.connect(lambda: open_url("https://www.instagram.com/notorious_vik_"))  # type: ignore[attr-defined]
-        except Exception:
-            pass
-        # Add text labels under each icon button
-        fb_col = QVBoxLayout()
-        try:
-            fb_col.setAlignment(Qt.AlignHCenter)  # type: ignore
-        except Exception:
-            pass
-        fb_col.addWidget(fb_btn, 0, Qt.AlignHCenter)  # type: ignore[arg-type]
-        fb_label = QLabel("Facebook", self)
-        try:
-            fb_label.setAlignment(Qt.AlignHCenter)  # type: ignore
-        except Exception:
-            pass
-        fb_col.addWidget(fb_label, 0, Qt.AlignHCenter)  # type: ignore[arg-type]
-
-        gh_col = QVBoxLayout()
-        try:
-            gh_col.setAlignment(Qt.AlignHCenter)  # type: ignore
+            fb_btn.clicked.connect(_OPEN_FACEBOOK)  # type: ignore[attr-defined]
+            gh_btn.clicked.connect(_OPEN_GITHUB)  # type: ignore[attr-defined]
+            ig_btn.clicked.connect(_OPEN_INSTAGRAM)  # type: ignore[attr-defined]
         except Exception:
             pass
-        gh_col.addWidget(gh_btn, 0, Qt.AlignHCenter)  # type: ignore[arg-type]
-        gh_label = QLabel("GitHub", self)
-        try:
-            gh_label.setAlignment(Qt.AlignHCenter)  # type: ignore
-        except Exception:
-            pass
-        gh_col.addWidget(gh_label, 0, Qt.AlignHCenter)  # type: ignore[arg-type]
-
-        ig_col = QVBoxLayout()
-        try:
-            ig_col.setAlignment(Qt.AlignHCenter)  # type: ignore
-        except Exception:
-            pass
-        ig_col.addWidget(ig_btn, 0, Qt.AlignHCenter)  # type: ignore[arg-type]
-        ig_label = QLabel("Instagram", self)
-        try:
-            ig_label.setAlignment(Qt.AlignHCenter)  # type: ignore
-        except Exception:
-            pass
-        ig_col.addWidget(ig_label, 0, Qt.AlignHCenter)  # type: ignore[arg-type]
+        # One grid holds all three icon/caption pairs: buttons on row 0,
+        # labels on row 1, each cell centered
+        social_grid = QGridLayout()
+        social_grid.addWidget(fb_btn, 0, 0, Qt.AlignHCenter)  # type: ignore[arg-type]
+        social_grid.addWidget(QLabel("Facebook", self), 1, 0, Qt.AlignHCenter)  # type: ignore[arg-type]
+        social_grid.addWidget(gh_btn, 0, 1, Qt.AlignHCenter)  # type: ignore[arg-type]
+        social_grid.addWidget(QLabel("GitHub", self), 1, 1, Qt.AlignHCenter)  # type: ignore[arg-type]
+        social_grid.addWidget(ig_btn, 0, 2, Qt.AlignHCenter)  # type: ignore[arg-type]
+        social_grid.addWidget(QLabel("Instagram", self), 1, 2, Qt.AlignHCenter)  # type: ignore[arg-type]
 
-        social_row.addLayout(fb_col)
-        social_row.addLayout(gh_col)
-        social_row.addLayout(ig_col)
-        try:
-            social_row.setAlignment(Qt.AlignCenter)  # type: ignore
-        except Exception:
-            pass
+        social_row = QHBoxLayout()
+        social_row.addStretch(1)
+        social_row.addLayout(social_grid)
+        social_row.addStretch(1)
         main.addLayout(social_row)
 
         # Close
@@ -3945,17 +5805,23 @@ class NavidromeAboutDialog(QDialog):
         main.addWidget(buttons)
 
 
+_about_dialog_singleton: Optional["NavidromeAboutDialog"] = None
+
+
 def _open_about_dialog() -> None:
+    global _about_dialog_singleton
     parent = _nav_parent_window()
     try:
-        dlg = NavidromeAboutDialog(parent)
-        try:
-            dlg.exec()
-        except Exception:
+        dlg = _about_dialog_singleton
+        if dlg is None:
+            dlg = NavidromeAboutDialog(parent)
+            _about_dialog_singleton = dlg
+        elif dlg.parent() is not parent:
             try:
-                dlg.exec_()
+                dlg.setParent(parent, dlg.windowFlags())
             except Exception:
-                dlg.show()
+                pass
+        _exec_dialog(dlg)
     except Exception as exc:
         QMessageBox.critical(parent, "Navidrome", f"Unable to open About: {exc}")
 
@@ -3963,6 +5829,80 @@ def _open_about_dialog() -> None:
 # -----------------------------
 # Changelog dialog
 # -----------------------------
+def _build_changelog_text() -> str:
+    """Join the per-version bullet list once; the content is static."""
+    # Build a comprehensive bullet list per version. Update as you release.
+    lines: List[str] = []
+    def add_version(ver: str, bullets: List[str]) -> None:
+        lines.append(f"Version {ver}")
+        for b in bullets:
+            lines.append(f"  - {b}")
+        lines.append("")
+
+    add_version(
+        "0.7.1",
+        [
+            "➕ NEW: 'Add new Track' button to add songs to existing playlists",
+            "🎯 NEW: Dedicated dialog for adding tracks with 'Apply' button (reuses library browser UI)",
+            "✨ NEW: Green highlighting for newly added tracks (visible until playlist switch or modification)",
+            "👤 NEW: Owner label showing playlist ownership (e.g., 'Owner: username')",
+            "🔒 NEW: Ownership-based permission system - non-owners have read-only access to public playlists",
+            "🚫 SECURITY: All modification buttons disabled for playlists you don't own",
+            "🚫 SECURITY: Rename, Delete, Add Track, Remove Track, Randomize, and Make Public restricted to owners",
+            "🔔 UX: Clear tooltips explain why buttons are disabled for non-owned playlists",
+            "💾 CACHE: Removed TTL expiration - cache now persists until manually cleared",
+            "💾 CACHE: Simplified caching system for better performance and consistency",
+            "🎨 UI: Track Actions reorganized - Randomize, Add new Track, Remove Track order",
+            "🎨 UI: Owner label displays with bold 'Owner:' and normal username in user-friendly blue",
+            "🔧 Technical: Ownership checking on all modification operations",
+            "🔧 Technical: Cache simplification removes TTL logic and parameters",
+            "Bugfixes and improvements"
+        ],
+    )
+    add_version(
+        "0.7.0",
+        [
+            "🚀 NEW: Smart caching system for dramatically faster subsequent fetches",
+            "🔧 Clear Cache button in options for testing and troubleshooting",
+            "📈 Performance boost: Second and subsequent library fetches are much faster",
+            "💾 In-memory cache for optimal performance",
+            "🎯 Cache keys based on request parameters for optimal hit rates",
+            "🔧 Enhanced SubsonicClient with cache statistics and management",
+            "📊 FIXED: Progress bar now shows accurate 100% completion when all songs are fetched",
+            "🎨 UI Polish: Enhanced progress dialog with percentage and window title updates",
+            "🎨 UI Polish: Better status text showing current/total counts",
+            "🔧 Technical: Two-pass algorithm for accurate progress calculation",
+            "🔧 Technical: Global cache sharing across all SubsonicClient instances",
+            "Bugfixes and improvements"
+        ],
+    )
+    add_version(
+        "0.6.0",
+        [
+            "New Navidrome menu: Connect…, Create Playlist from Library…, Edit Playlists…",
+            "Options page (URL, credentials, SSL verify, save credentials) + status check",
+            "Library browser: Filter menu, search across visible columns, adjustable columns/rows",
+            "Playlist creation from selected rows; ID order preserved regardless of UI sort",
+            "Live progress dialog while fetching songs (\"Fetched X of Y\")",
+            "Playlists browser with safe local drag-and-drop reordering and visual cues",
+            "Subsonic client with salted token authentication and SSL toggle",
+            "Added 'About…' to Navidrome menu and Options page",
+            "Bugfixes and improvements"
+        ],
+    )
+    add_version(
+        "0.5.x",
+        [
+            "Initial Subsonic connectivity and basic browsing",
+            "Picard options page with credentials and SSL verification",
+        ],
+    )
+    return "\n".join(lines)
+
+
+_CHANGELOG_TEXT: str = _build_changelog_text()
+
+
 class NavidromeChangelogDialog(QDialog):
     def __init__(self, parent: Optional[QWidget] = None) -> None:
         super().__init__(parent)
@@ -3979,13 +5919,23 @@ class NavidromeChangelogDialog(QDialog):
             except Exception:
                 pass
 
+        # Same deferred-build pattern as NavidromeAboutDialog.
+        self._built = False
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        self._ensure_built()
+        super().showEvent(event)
+
+    def _ensure_built(self) -> None:
+        if self._built:
+            return
+        self._built = True
+
         layout = QVBoxLayout(self)
 
         header = QLabel("What's new", self)
         try:
-            f = header.font()
-            f.setBold(True)
-            header.setFont(f)
+            header.setFont(_bold_font())
         except Exception:
             pass
         layout.addWidget(header)
@@ -3997,74 +5947,7 @@ class NavidromeChangelogDialog(QDialog):
         except Exception:
             pass
 
-        # Build a comprehensive bullet list per version. Update as you release.
-        changelog_lines: List[str] = []
-        def add_version(ver: str, bullets: List[str]) -> None:
-            changelog_lines.append(f"Version {ver}")
-            for b in bullets:
-                changelog_lines.append(f"  - {b}")
-            changelog_lines.append("")
-
-        add_version(
-            "0.7.1",
-            [
-                "➕ NEW: 'Add new Track' button to add songs to existing playlists",
-                "🎯 NEW: Dedicated dialog for adding tracks with 'Apply' button (reuses library browser UI)",
-                "✨ NEW: Green highlighting for newly added tracks (visible until playlist switch or modification)",
-                "👤 NEW: Owner label showing playlist ownership (e.g., 'Owner: username')",
-                "🔒 NEW: Ownership-based permission system - non-owners have read-only access to public playlists",
-                "🚫 SECURITY: All modification buttons disabled for playlists you don't own",
-                "🚫 SECURITY: Rename, Delete, Add Track, Remove Track, Randomize, and Make Public restricted to owners",
-                "🔔 UX: Clear tooltips explain why buttons are disabled for non-owned playlists",
-                "💾 CACHE: Removed TTL expiration - cache now persists until manually cleared",
-                "💾 CACHE: Simplified caching system for better performance and consistency",
-                "🎨 UI: Track Actions reorganized - Randomize, Add new Track, Remove Track order",
-                "🎨 UI: Owner label displays with bold 'Owner:' and normal username in user-friendly blue",
-                "🔧 Technical: Ownership checking on all modification operations",
-                "🔧 Technical: Cache simplification removes TTL logic and parameters",
-                "Bugfixes and improvements"
-            ],
-        )
-        add_version(
-            "0.7.0",
-            [
-                "🚀 NEW: Smart caching system for dramatically faster subsequent fetches",
-                "🔧 Clear Cache button in options for testing and troubleshooting",
-                "📈 Performance boost: Second and subsequent library fetches are much faster",
-                "💾 In-memory cache for optimal performance",
-                "🎯 Cache keys based on request parameters for optimal hit rates",
-                "🔧 Enhanced SubsonicClient with cache statistics and management",
-                "📊 FIXED: Progress bar now shows accurate 100% completion when all songs are fetched",
-                "🎨 UI Polish: Enhanced progress dialog with percentage and window title updates",
-                "🎨 UI Polish: Better status text showing current/total counts",
-                "🔧 Technical: Two-pass algorithm for accurate progress calculation",
-                "🔧 Technical: Global cache sharing across all SubsonicClient instances",
-                "Bugfixes and improvements"
-            ],
-        )
-        add_version(
-            "0.6.0",
-            [
-                "New Navidrome menu: Connect…, Create Playlist from Library…, Edit Playlists…",
-                "Options page (URL, credentials, SSL verify, save credentials) + status check",
-                "Library browser: Filter menu, search across visible columns, adjustable columns/rows",
-                "Playlist creation from selected rows; ID order preserved regardless of UI sort",
-                "Live progress dialog while fetching songs (\"Fetched X of Y\")",
-                "Playlists browser with safe local drag-and-drop reordering and visual cues",
-                "Subsonic client with salted token authentication and SSL toggle",
-                "Added 'About…' to Navidrome menu and Options page",
-                "Bugfixes and improvements"
-            ],
-        )
-        add_version(
-            "0.5.x",
-            [
-                "Initial Subsonic connectivity and basic browsing",
-                "Picard options page with credentials and SSL verification",
-            ],
-        )
-
-        text.setPlainText("\n".join(changelog_lines))
+        text.setPlainText(_CHANGELOG_TEXT)
         layout.addWidget(text)
 
         buttons = QDialogButtonBox(QDialogButtonBox.Close, self)
@@ -4075,21 +5958,77 @@ class NavidromeChangelogDialog(QDialog):
         layout.addWidget(buttons)
 
 
+_changelog_dialog_singleton: Optional["NavidromeChangelogDialog"] = None
+
+
 def _open_changelog_dialog() -> None:
+    global _changelog_dialog_singleton
     parent = _nav_parent_window()
     try:
-        dlg = NavidromeChangelogDialog(parent)
-        try:
-            dlg.exec()
-        except Exception:
+        dlg = _changelog_dialog_singleton
+        if dlg is None:
+            dlg = NavidromeChangelogDialog(parent)
+            _changelog_dialog_singleton = dlg
+        elif dlg.parent() is not parent:
             try:
-                dlg.exec_()
+                dlg.setParent(parent, dlg.windowFlags())
             except Exception:
-                dlg.show()
+                pass
+        _exec_dialog(dlg)
     except Exception as exc:
         QMessageBox.critical(parent, "Navidrome", f"Unable to open Changelog: {exc}")
 
+# Tint applied to the filename label of newly added tracks in the review list
+_NEW_TRACK_TINT_QSS = "background-color: rgba(0, 200, 0, 40); border-radius: 3px; padding: 2px 4px;"
+
+# Qt enum values used once per review row, resolved a single time. Fresh
+# QListWidgetItems are already enabled and selectable; only the drag bit
+# needs to be OR'd in.
+try:
+    _REVIEW_ROW_FLAGS = Qt.ItemIsDragEnabled
+    _REVIEW_ORDER_ALIGN = Qt.AlignRight | Qt.AlignVCenter
+except Exception:
+    _REVIEW_ROW_FLAGS = None
+    _REVIEW_ORDER_ALIGN = None
+
+# Enum lookups on per-event / per-row paths, bound once at import
+try:
+    _USER_ROLE = Qt.UserRole
+    _DROP_EVENT = QEvent.Drop
+    _DLG_ACCEPTED = QDialog.Accepted
+except Exception:
+    _USER_ROLE = None
+    _DROP_EVENT = None
+    _DLG_ACCEPTED = None
+
+# Shared stylesheet literals; passing the same string object lets Qt's
+# style-sheet cache hit instead of re-parsing per setStyleSheet call
+_DONATE_QSS = "font-weight: bold; background-color: #FFE08A;"
+_ADD_LEFT_QSS = "color: #1b5e20;"
+_DELETE_LEFT_QSS = "color: #b00020;"
+_RANDOMIZE_LEFT_QSS = "color: #6200ea;"
+
+
 class NavidromeSelectionReviewDialog(QDialog):
+    # Drag-handle glyph rendered once and shared by every row's two labels;
+    # False means rendering failed and rows fall back to text labels
+    _HANDLE_PIXMAP = None
+
+    @classmethod
+    def _handle_pixmap(cls):
+        pm = cls._HANDLE_PIXMAP
+        if pm is None:
+            try:
+                pm = QPixmap(16, 16)
+                pm.fill(Qt.transparent)  # type: ignore
+                painter = QPainter(pm)
+                painter.drawText(pm.rect(), Qt.AlignCenter, "≡")  # type: ignore
+                painter.end()
+            except Exception:
+                pm = False
+            cls._HANDLE_PIXMAP = pm
+        return pm if pm else None
+
     def __init__(self, parent: Optional[QWidget], selected: List[Tuple[str, str]], previously_reviewed_ids: Optional[Set[str]] = None):
         super().__init__(parent)
         self.setWindowTitle("Review Selected Tracks")
@@ -4115,13 +6054,12 @@ class NavidromeSelectionReviewDialog(QDialog):
 
         info = QLabel("Drag tracks to order your playlist. Only track filenames are shown.", self)
         try:
-            font = info.font()
-            font.setItalic(True)
-            info.setFont(font)
+            info.setFont(_italic_font())
         except Exception:
             pass
 
         self.list = _DraggableListWidget(self)
+        self._row_widgets = None  # lazy (item, num_label) cache, see _row_widget_cache
         try:
             # Enable dragging by allowing selection and internal move
             self.list.setSelectionMode(QAbstractItemView.SingleSelection)  # type: ignore[attr-defined]
@@ -4161,85 +6099,38 @@ class NavidromeSelectionReviewDialog(QDialog):
 
         ordered_items = prev_items + new_items
 
-        # Populate list with custom row widgets including left/right handles
+        # Populate list via the shared row builder; bind the hot methods once.
+        # Suppress per-insert model signals and repaints while building — one
+        # renumber pass below covers the whole list.
         has_new_items = False
+        make_row = self._make_review_row
+        add_item = self.list.addItem
+        set_widget = self.list.setItemWidget
+        try:
+            self.list.setUpdatesEnabled(False)
+            self.list.model().blockSignals(True)
+        except Exception:
+            pass
         for sid, fname in ordered_items:
             try:
-                item = QListWidgetItem()
-                try:
-                    item.setData(Qt.UserRole, sid)  # type: ignore
-                except Exception:
-                    pass
+                is_new = bool(prev_ids) and (sid not in prev_ids)
+                if is_new:
+                    has_new_items = True
+                item, row_w = make_row(sid, fname, is_new)
+                add_item(item)
                 try:
-                    # Ensure item can be dragged
-                    item.setFlags(item.flags() | Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled)  # type: ignore
-                except Exception:
-                    pass
-                # Custom row
-                row_w = QWidget(self)
-                h = QHBoxLayout(row_w)
-                try:
-                    h.setContentsMargins(8, 4, 8, 4)
-                except Exception:
-                    pass
-                order = QLabel("", row_w)  # dynamic order number
-                left = QLabel("≡", row_w)  # left drag handle
-                mid = QLabel(str(fname or ""), row_w)
-                right = QLabel("≡", row_w)  # right drag handle
-                # Highlight newly added tracks with a subtle green tint on the filename only
-                try:
-                    if prev_ids and (sid not in prev_ids):
-                        # Apply tint to the filename label so alternating row colors remain visible
-                        mid.setStyleSheet("background-color: rgba(0, 200, 0, 40); border-radius: 3px; padding: 2px 4px;")
-                        has_new_items = True
-                except Exception:
-                    pass
-                try:
-                    order.setMinimumWidth(28)
-                    order.setAlignment(Qt.AlignRight | Qt.AlignVCenter)  # type: ignore
-                    left.setToolTip("Drag to reorder")
-                    right.setToolTip("Drag to reorder")
-                except Exception:
-                    pass
-                try:
-                    # Visual cursor hints
-                    left.setCursor(Qt.OpenHandCursor)  # type: ignore
-                    right.setCursor(Qt.OpenHandCursor)  # type: ignore
-                    mid.setCursor(Qt.OpenHandCursor)  # type: ignore
-                    row_w.setCursor(Qt.OpenHandCursor)  # type: ignore
-                except Exception:
-                    pass
-                # Layout: [order][sp][left drag][filename][right drag]
-                h.addWidget(order, 0)
-                spacer = QLabel("", row_w)
-                try:
-                    spacer.setMinimumWidth(4)
-                except Exception:
-                    pass
-                h.addWidget(spacer, 0)
-                h.addWidget(left, 0)
-                h.addWidget(mid, 1)
-                h.addWidget(right, 0)
-                self.list.addItem(item)
-                try:
-                    # Make row taller for better drag target
-                    item.setSizeHint(row_w.sizeHint())
-                except Exception:
-                    pass
-                self.list.setItemWidget(item, row_w)
-                try:
-                    # attach for later renumbering
-                    row_w._num_label = order  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-                # Ensure drag works when clicking on embedded widgets by letting events pass through
-                try:
-                    for wgt in (row_w, order, left, mid, right):
-                        wgt.setAttribute(Qt.WA_TransparentForMouseEvents, True)  # type: ignore
+                    # Make row taller for better drag target
+                    item.setSizeHint(row_w.sizeHint())
                 except Exception:
                     pass
+                set_widget(item, row_w)
             except Exception:
                 continue
+        try:
+            self.list.model().blockSignals(False)
+            self.list.setUpdatesEnabled(True)
+        except Exception:
+            pass
 
         buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel, self)
         try:
@@ -4248,14 +6139,82 @@ class NavidromeSelectionReviewDialog(QDialog):
         except Exception:
             pass
 
-        # Left-side actions panel
-        left_panel = QVBoxLayout()
+        # Left-side actions panel; the container reserves its slot now, the
+        # label and buttons are filled in lazily after the first paint
+        self._actions_built = False
+        self._left_container = QWidget(self)
+        left_container = self._left_container
+        try:
+            left_container.setFixedWidth(200)  # Fixed width in pixels
+        except Exception:
+            pass
+
+        middle = QHBoxLayout()
+        middle.addWidget(left_container, 0)  # Fixed width left panel
+        middle.addWidget(self.list, 1)       # Flexible track list
+
+        v = QVBoxLayout(self)
+        v.addWidget(info)
+        v.addLayout(middle, 1)
+        v.addWidget(buttons)
+
+        # Keyboard shortcuts and initial focus/scroll; QShortcut/QKeySequence
+        # are resolved once at module import
+        # Delete key removes current item
+        try:
+            if QShortcut is not None and QKeySequence is not None:
+                del_shortcut = QShortcut(QKeySequence.Delete, self)
+                del_shortcut.activated.connect(self._delete_selected_from_list)  # type: ignore[attr-defined]
+        except Exception:
+            pass
+        # Ctrl+Enter to accept
+        try:
+            if QShortcut is not None and QKeySequence is not None:
+                ok_shortcut = QShortcut(QKeySequence("Ctrl+Return"), self)
+                ok_shortcut.activated.connect(self.accept)  # type: ignore[attr-defined]
+        except Exception:
+            pass
+        # Focus list and scroll to bottom if new items appended
+        try:
+            self.list.setFocus()
+            if has_new_items:
+                self.list.scrollToBottom()
+        except Exception:
+            pass
+
+        # Initial numbering
+        self._renumber_rows()
+        # Update numbering after drag reorders only; the insert/remove paths
+        # (_delete_selected_from_list, population above) renumber explicitly,
+        # so per-row model notifications would just repeat the same O(N) pass
+        try:
+            self.list.model().rowsMoved.connect(self._on_rows_moved)  # type: ignore[attr-defined]
+        except Exception:
+            pass
+        try:
+            self.list.installEventFilter(self)
+            self.list.viewport().installEventFilter(self)
+        except Exception:
+            pass
+
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        if not self._actions_built:
+            # Let the dialog paint first, then fill in the action buttons
+            try:
+                QTimer.singleShot(0, self._ensure_actions_built)  # type: ignore[attr-defined]
+            except Exception:
+                self._ensure_actions_built()
+        super().showEvent(event)
+
+    def _ensure_actions_built(self) -> None:
+        if self._actions_built:
+            return
+        self._actions_built = True
+        left_panel = QVBoxLayout(self._left_container)
         try:
             lbl_actions = QLabel("Actions", self)
             try:
-                font = lbl_actions.font()
-                font.setBold(True)
-                lbl_actions.setFont(font)
+                lbl_actions.setFont(_bold_font())
             except Exception:
                 pass
             lbl_actions.setToolTip("Add more files or remove the selected one from this list")
@@ -4264,122 +6223,119 @@ class NavidromeSelectionReviewDialog(QDialog):
             pass
         try:
             self._btn_add_more_left = QPushButton("+ Add to List", self)
-            try:
-                self._btn_add_more_left.setToolTip("Return to the previous window to add more items")
-            except Exception:
-                pass
-            try:
-                self._btn_add_more_left.setStyleSheet("color: #1b5e20;")
-            except Exception:
-                pass
+            self._btn_add_more_left.setToolTip("Return to the previous window to add more items")
+            self._btn_add_more_left.setStyleSheet(_ADD_LEFT_QSS)
             self._btn_add_more_left.clicked.connect(self._return_to_library_for_more)  # type: ignore[attr-defined]
             left_panel.addWidget(self._btn_add_more_left)
         except Exception:
             pass
         try:
             self._btn_delete_left = QPushButton("− Delete from List", self)
-            try:
-                self._btn_delete_left.setStyleSheet("color: #b00020;")
-            except Exception:
-                pass
-            try:
-                self._btn_delete_left.setToolTip("Remove the selected entry from this list (Delete)")
-            except Exception:
-                pass
+            self._btn_delete_left.setStyleSheet(_DELETE_LEFT_QSS)
+            self._btn_delete_left.setToolTip("Remove the selected entry from this list (Delete)")
             self._btn_delete_left.clicked.connect(self._delete_selected_from_list)  # type: ignore[attr-defined]
             left_panel.addWidget(self._btn_delete_left)
         except Exception:
             pass
         try:
             self._btn_randomize_left = QPushButton("🎲 Randomize", self)
-            try:
-                self._btn_randomize_left.setToolTip("Shuffle the track order randomly")
-            except Exception:
-                pass
-            try:
-                self._btn_randomize_left.setStyleSheet("color: #6200ea;")
-            except Exception:
-                pass
+            self._btn_randomize_left.setToolTip("Shuffle the track order randomly")
+            self._btn_randomize_left.setStyleSheet(_RANDOMIZE_LEFT_QSS)
             self._btn_randomize_left.clicked.connect(self._randomize_tracks)  # type: ignore[attr-defined]
             left_panel.addWidget(self._btn_randomize_left)
         except Exception:
             pass
-        try:
-            left_panel.addStretch(1)
-        except Exception:
-            pass
-
-        left_container = QWidget(self)
-        left_container.setLayout(left_panel)
-        try:
-            left_container.setFixedWidth(200)  # Fixed width in pixels
-        except Exception:
-            pass
+        left_panel.addStretch(1)
 
-        middle = QHBoxLayout()
-        middle.addWidget(left_container, 0)  # Fixed width left panel
-        middle.addWidget(self.list, 1)       # Flexible track list
+    def _on_rows_moved(self, parent, src, end, dest_parent, dest) -> None:
+        """Relabel only the index range a drag move could have shifted.
 
-        v = QVBoxLayout(self)
-        v.addWidget(info)
-        v.addLayout(middle, 1)
-        v.addWidget(buttons)
-
-        # Keyboard shortcuts and initial focus/scroll
-        try:
-            from PyQt5.QtWidgets import QShortcut  # type: ignore
-        except Exception:
-            try:
-                from PySide2.QtWidgets import QShortcut  # type: ignore
-            except Exception:
-                QShortcut = None  # type: ignore
-        try:
-            from PyQt5.QtGui import QKeySequence  # type: ignore
+        Rows outside [min(src, dest), max(end, dest)] keep their numbers, so
+        a short drag in a long list touches a handful of labels instead of
+        walking every row.
+        """
+        self._invalidate_row_widgets()
+        try:
+            lst = self.list
+            lo = max(min(src, dest), 0)
+            hi = min(max(end, dest), lst.count() - 1)
+            get_item = lst.item
+            get_widget = lst.itemWidget
+            for i in range(lo, hi + 1):
+                it = get_item(i)
+                w = get_widget(it) if it is not None else None
+                lbl = getattr(w, "_num_label", None) if w is not None else None
+                if lbl is not None:
+                    text = f"{i+1}."
+                    if lbl.text() != text:
+                        lbl.setText(text)
         except Exception:
-            try:
-                from PySide2.QtGui import QKeySequence  # type: ignore
-            except Exception:
-                QKeySequence = None  # type: ignore
+            self._renumber_rows()
 
-        # Delete key removes current item
+    def _make_review_row(self, sid: str, fname: str, is_new: bool) -> Tuple[QListWidgetItem, QWidget]:
+        """Build one draggable review row: the list item plus its embedded widget."""
+        item = QListWidgetItem()
         try:
-            if QShortcut is not None and QKeySequence is not None:
-                del_shortcut = QShortcut(QKeySequence.Delete, self)
-                del_shortcut.activated.connect(self._delete_selected_from_list)  # type: ignore[attr-defined]
+            item.setData(_USER_ROLE, sid)  # type: ignore
+            item.setData(_USER_ROLE + 1, bool(is_new))  # type: ignore
         except Exception:
             pass
-        # Ctrl+Enter to accept
         try:
-            if QShortcut is not None and QKeySequence is not None:
-                ok_shortcut = QShortcut(QKeySequence("Ctrl+Return"), self)
-                ok_shortcut.activated.connect(self.accept)  # type: ignore[attr-defined]
+            # Ensure item can be dragged
+            item.setFlags(item.flags() | _REVIEW_ROW_FLAGS)  # type: ignore
         except Exception:
             pass
-        # Focus list and scroll to bottom if new items appended
+        row_w = QWidget(self)
+        h = QHBoxLayout(row_w)
         try:
-            self.list.setFocus()
-            if has_new_items:
-                self.list.scrollToBottom()
+            h.setContentsMargins(8, 4, 8, 4)
         except Exception:
             pass
-
-        # Initial numbering
-        self._renumber_rows()
-        # Update numbering after reorders
+        order = QLabel("", row_w)  # dynamic order number
+        left = QLabel(row_w)  # left drag handle
+        mid = QLabel(str(fname or ""), row_w)
+        right = QLabel(row_w)  # right drag handle
+        handle = self._handle_pixmap()
+        if handle is not None:
+            left.setPixmap(handle)
+            right.setPixmap(handle)
+        else:
+            left.setText("≡")
+            right.setText("≡")
+        if is_new:
+            # Tint the filename label only so alternating row colors remain visible
+            try:
+                mid.setStyleSheet(_NEW_TRACK_TINT_QSS)
+            except Exception:
+                pass
         try:
-            self.list.model().rowsMoved.connect(lambda *args: self._renumber_rows())  # type: ignore[attr-defined]
+            order.setMinimumWidth(28)
+            order.setAlignment(_REVIEW_ORDER_ALIGN)  # type: ignore
+            # Children are transparent for mouse events, so the tooltip and
+            # cursor hint only need to live on the row widget itself
+            row_w.setToolTip("Drag to reorder")
+            row_w.setCursor(Qt.OpenHandCursor)  # type: ignore
         except Exception:
             pass
+        # Layout: [order][4px][left drag][filename][right drag]
+        h.addWidget(order, 0)
+        h.addSpacing(4)
+        h.addWidget(left, 0)
+        h.addWidget(mid, 1)
+        h.addWidget(right, 0)
         try:
-            self.list.model().rowsInserted.connect(lambda *args: self._renumber_rows())  # type: ignore[attr-defined]
-            self.list.model().rowsRemoved.connect(lambda *args: self._renumber_rows())  # type: ignore[attr-defined]
+            # attach for later renumbering / in-place updates
+            row_w._num_label = order  # type: ignore[attr-defined]
+            row_w._mid_label = mid  # type: ignore[attr-defined]
         except Exception:
             pass
+        # Ensure drag works when clicking on embedded widgets by letting events pass through
         try:
-            self.list.installEventFilter(self)
-            self.list.viewport().installEventFilter(self)
+            for wgt in (row_w, order, left, mid, right):
+                wgt.setAttribute(Qt.WA_TransparentForMouseEvents, True)  # type: ignore
         except Exception:
             pass
+        return item, row_w
 
     def _delete_selected_from_list(self) -> None:
         try:
@@ -4390,12 +6346,11 @@ class NavidromeSelectionReviewDialog(QDialog):
             QMessageBox.information(self, "Navidrome", "No track selected for deletion. Nothing deleted from playlist.")
             return
         try:
-            it = self.list.takeItem(row)
-            # Ensure widget is cleaned up
-            if it is not None:
-                del it
+            # Dropping the last reference lets Qt delete the item and its widget
+            self.list.takeItem(row)
         except Exception:
             pass
+        self._invalidate_row_widgets()
         # Renumber after removal
         self._renumber_rows()
         # Keep selection user-friendly: select the next item if available, otherwise the last one
@@ -4415,151 +6370,108 @@ class NavidromeSelectionReviewDialog(QDialog):
             pass
 
     def _randomize_tracks(self) -> None:
-        """Shuffle the track order randomly."""
-        import random
-        try:
-            # Get all items and their data
-            items_data = []
-            for i in range(self.list.count()):
-                item = self.list.item(i)
-                if item is None:
-                    continue
-                widget = self.list.itemWidget(item)
-                try:
-                    song_id = str(item.data(Qt.UserRole))  # type: ignore
-                except Exception:
-                    song_id = ""
-                if widget is not None and song_id:
-                    items_data.append((song_id, widget))
-            
-            if len(items_data) <= 1:
+        """Shuffle the track order in place without rebuilding row widgets."""
+        lst = self.list
+        # Gather the authoritative data for each row: id, filename, is-new
+        # flag. Any surprise here aborts with the order untouched instead of
+        # wrapping the whole walk in one broad handler.
+        try:
+            count = lst.count()
+            if count <= 1:
                 return  # Nothing to shuffle
-            
-            # Extract song IDs and shuffle them
-            song_ids = [data[0] for data in items_data]
-            random.shuffle(song_ids)
-            
-            # Clear the list
-            self.list.clear()
-            
-            # Re-add items in shuffled order
-            # We need to reconstruct the items since we cleared the list
-            for i, shuffled_song_id in enumerate(song_ids):
-                # Find the original data for this song ID
-                original_widget_data = None
-                for original_song_id, widget in items_data:
-                    if original_song_id == shuffled_song_id:
-                        original_widget_data = widget
-                        break
-                
-                if original_widget_data is None:
-                    continue
-                
-                # Create new item
-                item = QListWidgetItem()
-                try:
-                    item.setData(Qt.UserRole, shuffled_song_id)  # type: ignore
-                except Exception:
-                    pass
-                try:
-                    item.setFlags(item.flags() | Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled)  # type: ignore
-                except Exception:
-                    pass
-                
-                # Create new widget based on the original
-                row_w = QWidget(self)
-                h = QHBoxLayout(row_w)
-                try:
-                    h.setContentsMargins(8, 4, 8, 4)
-                except Exception:
-                    pass
-                
-                order = QLabel("", row_w)  # Will be updated by _renumber_rows
-                left = QLabel("≡", row_w)
-                
-                # Extract filename from original widget
-                filename = ""
+            items = []
+            mid_labels = []
+            rows: List[Tuple[str, str, bool]] = []
+            get_item = lst.item
+            get_widget = lst.itemWidget
+            for i in range(count):
+                item = get_item(i)
+                mid = None
+                if item is not None:
+                    w = get_widget(item)
+                    mid = getattr(w, "_mid_label", None) if w is not None else None
+                if item is None or mid is None:
+                    return  # Unexpected row shape; leave the order untouched
                 try:
-                    # Try to get the filename from the original widget's middle label
-                    for child in original_widget_data.findChildren(QLabel):
-                        text = child.text()
-                        if text and text not in ["≡", ""]:
-                            # Skip order numbers (like "1.", "2.", etc.)
-                            if not (text.endswith(".") and text[:-1].isdigit()):
-                                filename = text
-                                break
-                except Exception:
-                    filename = f"Track {i+1}"
-                
-                mid = QLabel(str(filename), row_w)
-                right = QLabel("≡", row_w)
-                
-                try:
-                    order.setMinimumWidth(28)
-                    order.setAlignment(Qt.AlignRight | Qt.AlignVCenter)  # type: ignore
-                    left.setToolTip("Drag to reorder")
-                    right.setToolTip("Drag to reorder")
+                    sid = str(item.data(_USER_ROLE))  # type: ignore
                 except Exception:
-                    pass
-                try:
-                    left.setCursor(Qt.OpenHandCursor)  # type: ignore
-                    right.setCursor(Qt.OpenHandCursor)  # type: ignore
-                    mid.setCursor(Qt.OpenHandCursor)  # type: ignore
-                    row_w.setCursor(Qt.OpenHandCursor)  # type: ignore
-                except Exception:
-                    pass
-                
-                # Layout
-                h.addWidget(order, 0)
-                spacer = QLabel("", row_w)
-                try:
-                    spacer.setMinimumWidth(4)
-                except Exception:
-                    pass
-                h.addWidget(spacer, 0)
-                h.addWidget(left, 0)
-                h.addWidget(mid, 1)
-                h.addWidget(right, 0)
-                
-                self.list.addItem(item)
-                try:
-                    item.setSizeHint(row_w.sizeHint())
-                except Exception:
-                    pass
-                self.list.setItemWidget(item, row_w)
-                try:
-                    row_w._num_label = order  # type: ignore[attr-defined]
-                except Exception:
-                    pass
-                
-                # Make widgets transparent for mouse events
+                    sid = ""
                 try:
-                    for wgt in (row_w, order, left, mid, right):
-                        wgt.setAttribute(Qt.WA_TransparentForMouseEvents, True)  # type: ignore
+                    is_new = bool(item.data(_USER_ROLE + 1))  # type: ignore
                 except Exception:
-                    pass
-            
-            # Renumber the tracks
-            self._renumber_rows()
-            
-        except Exception as exc:
-            # If randomization fails, show a message but don't crash
+                    is_new = False
+                items.append(item)
+                mid_labels.append(mid)
+                rows.append((sid, mid.text(), is_new))
+        except Exception:
+            return
+
+        random.shuffle(rows)
+
+        # Write the shuffled data back into the existing items and labels;
+        # row positions never change, so numbering stays correct. Updates
+        # are paused so N label changes repaint as one pass.
+        try:
+            lst.setUpdatesEnabled(False)
+        except Exception:
+            pass
+        for item, mid, (sid, fname, is_new) in zip(items, mid_labels, rows):
             try:
-                QMessageBox.warning(self, "Randomize", f"Failed to randomize tracks: {exc}")
+                item.setData(_USER_ROLE, sid)  # type: ignore
+                item.setData(_USER_ROLE + 1, is_new)  # type: ignore
+                mid.setText(fname)
+                mid.setStyleSheet(_NEW_TRACK_TINT_QSS if is_new else "")
             except Exception:
                 pass
+        try:
+            lst.setUpdatesEnabled(True)
+        except Exception:
+            pass
+
+    def _row_widget_cache(self):
+        """Return [(item, num_label)] in view order, rebuilt only when stale.
+
+        The cache dies on any reorder or removal (set to None) and whenever
+        its length no longer matches the list, so the renumber walk pays the
+        itemWidget/getattr round trip once per structural change instead of
+        once per row per call.
+        """
+        cache = self._row_widgets
+        if cache is None or len(cache) != self.list.count():
+            cache = []
+            get_widget = self.list.itemWidget
+            for _i, it in self._iter_items():
+                w = get_widget(it) if it is not None else None
+                cache.append((it, getattr(w, "_num_label", None) if w is not None else None))
+            self._row_widgets = cache
+        return cache
+
+    def _invalidate_row_widgets(self) -> None:
+        self._row_widgets = None
+
+    def _iter_items(self):
+        """Yield (row, item) with the count and item accessor bound once."""
+        lst = self.list
+        get_item = lst.item
+        for i in range(lst.count()):
+            yield i, get_item(i)
 
     def get_ordered_ids(self) -> List[str]:
+        user_role = _USER_ROLE
+        try:
+            # Fast path: one comprehension, no per-row exception frames
+            return [sid for sid in (str(it.data(user_role)) for _i, it in self._iter_items() if it is not None) if sid]  # type: ignore
+        except Exception:
+            pass
+        # Defensive fallback: collect what survives row by row under the
+        # one outer handler
         ids: List[str] = []
         try:
-            for i in range(self.list.count()):
-                it = self.list.item(i)
+            for _i, it in self._iter_items():
                 if it is None:
                     continue
-                try:
-                    sid = str(it.data(Qt.UserRole))  # type: ignore
-                except Exception:
-                    sid = ""
+                d = it.data(user_role)  # type: ignore
+                sid = str(d) if d is not None else ""
                 if sid:
                     ids.append(sid)
         except Exception:
@@ -4568,40 +6480,60 @@ class NavidromeSelectionReviewDialog(QDialog):
 
     def _renumber_rows(self) -> None:
         try:
-            for i in range(self.list.count()):
-                it = self.list.item(i)
-                if it is None:
+            for i, (_it, lbl) in enumerate(self._row_widget_cache()):
+                if lbl is None:
                     continue
-                w = self.list.itemWidget(it)
-                if w is None:
-                    continue
-                try:
-                    if hasattr(w, "_num_label") and w._num_label is not None:  # type: ignore[attr-defined]
-                        w._num_label.setText(f"{i+1}.")
-                except Exception:
-                    pass
+                text = f"{i+1}."
+                # Rows that kept their position repaint nothing
+                if lbl.text() != text:
+                    lbl.setText(text)
         except Exception:
             pass
 
     # Ensure numbering updates even if only Drop event fires
     def eventFilter(self, obj, event):  # type: ignore[override]
-        try:
-            et = event.type()
-            if et == QEvent.Drop:
-                self._renumber_rows()
-        except Exception:
-            pass
+        if event.type() == _DROP_EVENT:
+            self._invalidate_row_widgets()
+            self._renumber_rows()
         return False
 
-def _ensure_menu_installed(_attempt: int = 0) -> None:
+_menu_install_hooked = False
+
+
+def _hook_menu_install_on_focus() -> None:
+    """Subscribe the menu installer to the next focus change.
+
+    Replaces the old 300 ms retry timer: instead of up to 30 scheduler
+    wakeups while Picard starts, the install reruns on the focus event the
+    main window emits when it comes up.
+    """
+    global _menu_install_hooked
+    if _menu_install_hooked:
+        return
+    try:
+        QApplication.instance().focusChanged.connect(_on_focus_for_menu_install)  # type: ignore[attr-defined]
+        _menu_install_hooked = True
+    except Exception:
+        pass
+
+
+def _on_focus_for_menu_install(*_args) -> None:
+    global _menu_install_hooked
+    if not _nav_parent_window():
+        return  # main window still not up; the subscription keeps waiting
+    try:
+        QApplication.instance().focusChanged.disconnect(_on_focus_for_menu_install)  # type: ignore[attr-defined]
+    except Exception:
+        pass
+    _menu_install_hooked = False
+    _ensure_menu_installed()
+
+
+def _ensure_menu_installed() -> None:
     """Insert 'Navidrome' menu near Help/Tools on the main menu bar."""
     parent = _nav_parent_window()
     if not parent:
-        if _attempt < 30:
-            try:
-                QTimer.singleShot(300, lambda: _ensure_menu_installed(_attempt + 1))  # type: ignore[attr-defined]
-            except Exception:
-                pass
+        _hook_menu_install_on_focus()
         return
     try:
         menubar = parent.menuBar()
@@ -4609,21 +6541,29 @@ def _ensure_menu_installed(_attempt: int = 0) -> None:
         menubar = None
 
     if menubar is None:
-        if _attempt < 30:
-            try:
-                QTimer.singleShot(300, lambda: _ensure_menu_installed(_attempt + 1))  # type: ignore[attr-defined]
-            except Exception:
-                pass
+        _hook_menu_install_on_focus()
         return
 
-    # Avoid duplicates
-    for act in menubar.actions():
+    # One walk over a single actions() snapshot: bail out on a duplicate
+    # menu, and note Help plus the Tools index for positioning below
+    try:
+        actions = menubar.actions()
+    except Exception:
+        actions = []
+    help_act = None
+    tools_index = None
+    for i, act in enumerate(actions):
         try:
             m = act.menu()
             if m and m.objectName() == "menuNavidrome":
                 return
+            text = act.text().replace("&", "")
         except Exception:
             continue
+        if text == "Help" and help_act is None:
+            help_act = act
+        elif text == "Tools" and tools_index is None:
+            tools_index = i
 
     try:
         nav_menu = menubar.addMenu("Navidrome")
@@ -4641,18 +6581,6 @@ def _ensure_menu_installed(_attempt: int = 0) -> None:
 
     # Try to position menu near Help or after Tools
     try:
-        actions = menubar.actions()
-        help_act = None
-        tools_index = None
-        for i, act in enumerate(actions):
-            try:
-                text = act.text()
-            except Exception:
-                text = ""
-            if text.replace("&", "") == "Help" and help_act is None:
-                help_act = act
-            if text.replace("&", "") == "Tools" and tools_index is None:
-                tools_index = i
         if help_act is not None:
             menubar.removeAction(nav_menu.menuAction())
             menubar.insertMenu(help_act, nav_menu)
@@ -4687,12 +6615,14 @@ try:
     class NavidromeCreatePlaylistFromSelectionAction(BaseAction):
         NAME = "Create playlist and send to Navidrome ..."
         TITLE = "Create playlist and send to Navidrome ..."
-        def callback(self, objs) -> None:
-            parent = _nav_parent_window()
-            # Try to resolve highlighted (selected) items from Picard's left panel
-            selected_basenames: List[str] = []
+        @staticmethod
+        def _resolve_selection(objs) -> List[str]:
+            """Collect unique filenames from the highlighted Picard objects."""
             try:
-                seen: Set[str] = set()
+                # Dict keys dedupe and keep selection order in one hash op
+                sel: Dict[str, None] = {}
+                add_name = sel.setdefault
+                basename = os.path.basename
                 for o in (objs or []):
                     # Album/cluster-like with .files
                     try:
@@ -4702,10 +6632,7 @@ try:
                                 try:
                                     p = getattr(f, "filename", None) or getattr(f, "path", None) or getattr(f, "_filename", None)
                                     if p:
-                                        bn = os.path.basename(str(p))
-                                        if bn not in seen:
-                                            selected_basenames.append(bn)
-                                            seen.add(bn)
+                                        add_name(basename(str(p)), None)
                                 except Exception:
                                     continue
                             continue
@@ -4715,180 +6642,195 @@ try:
                     try:
                         p = getattr(o, "filename", None) or getattr(o, "path", None) or getattr(o, "_filename", None)
                         if p:
-                            bn = os.path.basename(str(p))
-                            if bn not in seen:
-                                selected_basenames.append(bn)
-                                seen.add(bn)
+                            add_name(basename(str(p)), None)
                     except Exception:
                         pass
+                return list(sel)
             except Exception:
-                selected_basenames = []
-
-            if selected_basenames:
-                # Connect using saved settings
-                base_url = config.setting["navidrome_base_url"].strip()
-                username = config.setting["navidrome_username"].strip()
-                password = config.setting["navidrome_password"]
-                app_name = "PicardNavidrome"
-                verify_ssl = bool(config.setting["navidrome_verify_ssl"])
-                if not base_url or not username or not password:
-                    QMessageBox.warning(parent, "Navidrome", "Please fill in Server URL, Username and Password in Navidrome settings.")
-                    return
+                return []
+
+        # Selections up to this size are matched with one search3 query per
+        # name; anything larger streams the library once instead.
+        _SEARCH_MATCH_LIMIT = 50
+
+        @staticmethod
+        def _match_songs(client, cleaned_order: List[str]) -> List[Tuple[str, str]]:
+            """Match cleaned names against the library, keeping selection order.
+
+            Small selections issue a targeted search3 query per name, which
+            is far cheaper than walking the whole library. Larger ones — and
+            any names search3 left unmatched — stream all songs with a
+            shrinking set of unmatched names: one hash probe per song,
+            stopping as soon as everything is matched. Candidates are always verified by normalized dataname so
+            server-side fuzzy search cannot produce wrong matches. Raises on
+            transport errors; the caller turns those into a message box.
+            """
+            wanted: Dict[str, Tuple[str, str]] = {}
+            remaining = set(cleaned_order)
+            dataname = NavidromeLibraryDialog._dataname_for_song
+
+            def claim(s: Dict) -> None:
+                # _dataname_for_song already returns the canonical form;
+                # only the exception fallback needs normalizing here
                 try:
-                    try:
-                        enable_cache = bool(config.setting["navidrome_enable_cache"])
-                    except (KeyError, ValueError):
-                        enable_cache = True
-                    client = SubsonicClient(
-                        base_url=base_url, 
-                        username=username, 
-                        password=password, 
-                        app_name=app_name, 
-                        verify_ssl=verify_ssl,
-                        enable_cache=enable_cache
-                    )
-                except Exception as exc:
-                    QMessageBox.critical(parent, "Navidrome", f"Unable to connect: {exc}")
-                    return
-
-                # Build a cleaned set using same normalization as library
-                cleaned_order: List[str] = []
-                seen_clean: Set[str] = set()
-                for bn in selected_basenames:
-                    try:
-                        clean = NavidromeLibraryDialog._strip_two_digit_prefix(str(bn))
-                    except Exception:
-                        clean = str(bn)
-                    clean = clean.strip()
-                    if clean and clean not in seen_clean:
-                        cleaned_order.append(clean)
-                        seen_clean.add(clean)
-
-                # Iterate songs and match by normalized dataname
-                wanted: Dict[str, Tuple[str, str]] = {}
+                    dn = dataname(s)
+                except Exception:
+                    dn = str(s.get("title") or s.get("name") or "").strip()
+                if dn in remaining:
+                    sid = str(s.get("id", ""))
+                    if sid:
+                        wanted[dn] = (sid, dn)
+                        remaining.discard(dn)
+
+            if remaining and len(cleaned_order) <= NavidromeCreatePlaylistFromSelectionAction._SEARCH_MATCH_LIMIT:
                 try:
-                    for s in client.iter_all_songs_stream():
-                        try:
-                            dn = NavidromeLibraryDialog._dataname_for_song(s)
-                        except Exception:
-                            dn = str(s.get("title") or s.get("name") or "")
-                        dn = dn.strip()
-                        if dn in seen_clean and dn not in wanted:
-                            sid = str(s.get("id", ""))
-                            if sid:
-                                wanted[dn] = (sid, dn)
-                        # Short-circuit if we matched all
-                        try:
-                            if len(wanted) >= len(cleaned_order):
+                    for name in list(remaining):
+                        # Query without the extension; search3 indexes titles
+                        query = os.path.splitext(name)[0].strip() or name
+                        for s in client.search_songs(query, count=20):
+                            claim(s)
+                            if name not in remaining:
                                 break
-                        except Exception:
-                            pass
-                except Exception as exc:
-                    QMessageBox.critical(parent, "Navidrome", f"Failed to load songs for matching: {exc}")
-                    return
-
-                # Assemble in the order of user's selection
-                selected_pairs: List[Tuple[str, str]] = []
-                for name in cleaned_order:
-                    p = wanted.get(name)
-                    if p:
-                        selected_pairs.append(p)
+                except Exception:
+                    # Search unavailable or failed; fall back to the stream
+                    pass
 
-                if not selected_pairs:
-                    QMessageBox.information(parent, "Navidrome", "No Navidrome songs matched the currently highlighted items.")
-                    return
+            if remaining:
+                for s in client.iter_all_songs_stream():
+                    claim(s)
+                    if not remaining:
+                        break
+            # Assemble in the order of user's selection
+            return [wanted[name] for name in cleaned_order if name in wanted]
 
-                # Open review dialog directly
+        @staticmethod
+        def _prompt_name(parent) -> Optional[str]:
+            """Ask for a playlist name; returns None when cancelled."""
+            try:
+                dlg_name = QInputDialog(parent)
                 try:
-                    dlg = NavidromeSelectionReviewDialog(parent, selected_pairs)
-                    try:
-                        res = dlg.exec()
-                    except Exception:
-                        try:
-                            res = dlg.exec_()
-                        except Exception:
-                            dlg.show()
-                            return
-                    try:
-                        accepted = (res == QDialog.Accepted)
-                    except Exception:
-                        accepted = True
-                    if not accepted:
-                        return
-                    ordered_ids = dlg.get_ordered_ids()
+                    dlg_name.setInputMode(QInputDialog.TextInput)
+                    dlg_name.setWindowTitle("Create Playlist")
+                    dlg_name.setLabelText("Playlist name:")
                 except Exception:
-                    ordered_ids = [sid for sid, _ in selected_pairs]
-
-                if not ordered_ids:
-                    QMessageBox.information(parent, "Navidrome", "No tracks to create a playlist from.")
-                    return
-
-                # Ask for playlist name (remove '?' help button)
+                    pass
+                # Remove the '?' help button
                 try:
-                    dlg_name = QInputDialog(parent)
+                    dlg_name.setWindowFlag(Qt.WindowContextHelpButtonHint, False)  # type: ignore
+                except Exception:
                     try:
-                        dlg_name.setInputMode(QInputDialog.TextInput)
-                        dlg_name.setWindowTitle("Create Playlist")
-                        dlg_name.setLabelText("Playlist name:")
+                        dlg_name.setWindowFlags(dlg_name.windowFlags() & ~Qt.WindowContextHelpButtonHint)  # type: ignore
                     except Exception:
                         pass
-                    try:
-                        dlg_name.setWindowFlag(Qt.WindowContextHelpButtonHint, False)  # type: ignore
-                    except Exception:
-                        try:
-                            dlg_name.setWindowFlags(dlg_name.windowFlags() & ~Qt.WindowContextHelpButtonHint)  # type: ignore
-                        except Exception:
-                            pass
-                    try:
-                        res_name = dlg_name.exec()
-                    except Exception:
-                        try:
-                            res_name = dlg_name.exec_()
-                        except Exception:
-                            dlg_name.show()
-                            return
-                    try:
-                        ok = (res_name == QDialog.Accepted)
-                    except Exception:
-                        ok = True
-                    name = dlg_name.textValue() if ok else ""
+                res_name = _exec_dialog(dlg_name)
+                if res_name is None:
+                    return None
+                try:
+                    ok = (res_name == _DLG_ACCEPTED)
                 except Exception:
-                    ok = False
-                    name = ""
+                    ok = True
                 if not ok:
-                    return
-                name = (name or "").strip()
-                if not name:
-                    QMessageBox.information(parent, "Navidrome", "Playlist name cannot be empty.")
-                    return
+                    return None
+                return (dlg_name.textValue() or "").strip()
+            except Exception:
+                return None
 
+        @staticmethod
+        def _create(client, parent, name: str, ordered_ids: List[str]) -> None:
+            try:
+                client.create_playlist(name, ordered_ids)
+            except Exception as exc:
+                QMessageBox.critical(parent, "Navidrome", f"Failed to create playlist: {exc}")
+                return
+            QMessageBox.information(parent, "Navidrome", f"Playlist '{name}' created.")
+
+        def callback(self, objs) -> None:
+            parent = _nav_parent_window()
+            # Try to resolve highlighted (selected) items from Picard's left panel
+            selected_basenames = self._resolve_selection(objs)
+            if not selected_basenames:
+                # Nothing selected: reuse an open Library window if present, else open it
                 try:
-                    pl_id = client.create_playlist(name, ordered_ids)
-                except Exception as exc:
-                    QMessageBox.critical(parent, "Navidrome", f"Failed to create playlist: {exc}")
-                    return
-                if pl_id:
-                    QMessageBox.information(parent, "Navidrome", f"Playlist '{name}' created.")
-                else:
-                    QMessageBox.information(parent, "Navidrome", f"Playlist '{name}' created.")
+                    dlg = _last_library_dialog() if _last_library_dialog is not None else None
+                    if dlg is not None and dlg.isVisible():
+                        dlg._continue_to_review_selected()
+                        return
+                except Exception:
+                    pass
+                _open_library_dialog()
                 return
 
-            # Fallbacks if nothing selected in Picard: use open Library window if present, else open it
+            # Connect using saved settings
+            settings = _read_nav_settings()
+            if not settings.complete():
+                QMessageBox.warning(parent, "Navidrome", "Please fill in Server URL, Username and Password in Navidrome settings.")
+                return
             try:
-                for w in QApplication.topLevelWidgets():
-                    try:
-                        if isinstance(w, NavidromeLibraryDialog):
-                            w._continue_to_review_selected()
-                            return
-                    except Exception:
-                        continue
+                client = _get_client(
+                    settings.base_url,
+                    settings.username,
+                    settings.password,
+                    verify_ssl=settings.verify_ssl,
+                    enable_cache=settings.enable_cache,
+                )
+            except Exception as exc:
+                QMessageBox.critical(parent, "Navidrome", f"Unable to connect: {exc}")
+                return
+
+            # Build a cleaned list using the same canonicalizer as the
+            # library side, so both halves of the comparison normalize
+            # exactly once and no follow-up strip() is needed anywhere.
+            cleaned_order: List[str] = []
+            seen_clean: Set[str] = set()
+            for bn in selected_basenames:
+                clean = _canonical_track_name(bn)
+                if clean and clean not in seen_clean:
+                    cleaned_order.append(clean)
+                    seen_clean.add(clean)
+
+            try:
+                selected_pairs = self._match_songs(client, cleaned_order)
+            except Exception as exc:
+                QMessageBox.critical(parent, "Navidrome", f"Failed to load songs for matching: {exc}")
+                return
+            if not selected_pairs:
+                QMessageBox.information(parent, "Navidrome", "No Navidrome songs matched the currently highlighted items.")
+                return
+
+            # Open review dialog directly
+            try:
+                dlg = NavidromeSelectionReviewDialog(parent, selected_pairs)
+                res = _exec_dialog(dlg)
+                if res is None:
+                    return
+                try:
+                    accepted = (res == _DLG_ACCEPTED)
+                except Exception:
+                    accepted = True
+                if not accepted:
+                    return
+                ordered_ids = dlg.get_ordered_ids()
             except Exception:
-                pass
-            _open_library_dialog()
+                ordered_ids = [sid for sid, _ in selected_pairs]
+
+            if not ordered_ids:
+                QMessageBox.information(parent, "Navidrome", "No tracks to create a playlist from.")
+                return
+
+            name = self._prompt_name(parent)
+            if name is None:
+                return
+            if not name:
+                QMessageBox.information(parent, "Navidrome", "Playlist name cannot be empty.")
+                return
+
+            self._create(client, parent, name, ordered_ids)
+    # One instance serves all contexts; the callback only looks at objs
+    _create_playlist_action = NavidromeCreatePlaylistFromSelectionAction()
     if register_file_action is not None:
-        register_file_action(NavidromeCreatePlaylistFromSelectionAction())  # type: ignore
-    register_track_action(NavidromeCreatePlaylistFromSelectionAction())
-    register_album_action(NavidromeCreatePlaylistFromSelectionAction())
+        register_file_action(_create_playlist_action)  # type: ignore
+    register_track_action(_create_playlist_action)
+    register_album_action(_create_playlist_action)
 except Exception as exc:
     log.error("Navidrome plugin: Failed to register create-playlist action: %r", exc)
 
@@ -4897,40 +6839,23 @@ except Exception as exc:
 # Clear sensitive credentials on app exit
 # -----------------------------
 def _clear_credentials_on_exit() -> None:
-    try:
-        save = False
-        try:
-            try:
-                save = bool(config.setting["navidrome_save_credentials"])
-            except (KeyError, ValueError):
-                save = False
-        except Exception:
-            save = bool(config.setting["navidrome_save_credentials"]) if "navidrome_save_credentials" in config.setting else False
-        if not save:
-            config.setting["navidrome_username"] = ""
-            config.setting["navidrome_password"] = ""
-    except Exception:
-        pass
+    """Blank stored credentials unless the user opted to save them.
 
-def _flush_credentials_if_not_saved() -> None:
+    Runs both at startup (QTimer tick 0) and on aboutToQuit.
+    """
     try:
-        save = False
-        try:
-            try:
-                save = bool(config.setting["navidrome_save_credentials"])
-            except (KeyError, ValueError):
-                save = False
-        except Exception:
-            save = bool(config.setting["navidrome_save_credentials"]) if "navidrome_save_credentials" in config.setting else False
+        save = _cfg_bool("navidrome_save_credentials", False)
         if not save:
             config.setting["navidrome_username"] = ""
             config.setting["navidrome_password"] = ""
+            # Cached clients hold the old password; drop them with it
+            _CLIENT_CACHE.clear()
     except Exception:
         pass
 
 try:
     if QTimer is not None:
-        QTimer.singleShot(0, _flush_credentials_if_not_saved)  # type: ignore[attr-defined]
+        QTimer.singleShot(0, _clear_credentials_on_exit)  # type: ignore[attr-defined]
 except Exception:
     pass
 